@@ -17,6 +17,7 @@ from pathlib import Path
 
 from .domain.models import CustomFieldDefinition, ImportMappingTemplate, CustomFieldType
 from .services import custom_field_service, import_mapping_service
+from .utils.text_utils import is_cyrillic
 
 metadata_bp = Blueprint('metadata', __name__, url_prefix='/metadata')
 
@@ -492,11 +493,14 @@ def enrich_from_url_endpoint():
             api_key = os.getenv('PERPLEXITY_API_KEY')
             if api_key:
                 enricher = PerplexityEnricher(api_key=api_key)
-                metadata = run_async(enricher.enrich_book_from_url(
-                    url=url,
-                    title=title if title else None,
-                    author=author if author else None
-                ))
+                try:
+                    metadata = run_async(enricher.enrich_book_from_url(
+                        url=url,
+                        title=title if title else None,
+                        author=author if author else None
+                    ))
+                finally:
+                    run_async(enricher.close())
         
         if not metadata:
             return jsonify({
@@ -604,12 +608,16 @@ def enrich_single_book_endpoint():
             force=True,
             require_cover=True
         )
-        metadata = run_async(coro)
+        try:
+            metadata = run_async(coro)
+        finally:
+            # The service's HTTP clients are only needed for this call
+            run_async(enrichment_service.close())
         
         # For Bulgarian books, also try to scrape from Bulgarian bookstores
         title = book_data.get('title', '')
         author = book_data.get('author', '')
-        has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in title) or any('\u0400' <= char <= '\u04FF' for char in author)
+        has_cyrillic = is_cyrillic(title) or is_cyrillic(author)
         
         bookstore_metadata = None
         if has_cyrillic:
@@ -800,8 +808,8 @@ def enrich_single_book_endpoint():
         # Update language for Bulgarian books
         title = merged.get('title', '') or book_data.get('title', '')
         author = merged.get('author', '') or book_data.get('author', '')
-        has_cyrillic_title = any('\u0400' <= char <= '\u04FF' for char in title)
-        has_cyrillic_author = any('\u0400' <= char <= '\u04FF' for char in author)
+        has_cyrillic_title = is_cyrillic(title)
+        has_cyrillic_author = is_cyrillic(author)
         
         if has_cyrillic_title and has_cyrillic_author:
             current_language = book_data.get('language', '')
@@ -1384,22 +1384,22 @@ def search_book_details():
             """Fetch results from Biblioman database (Bulgarian books)."""
             try:
                 from app.services.metadata_providers.biblioman import BibliomanProvider
-                provider = BibliomanProvider()
-                if not provider.is_enabled():
+                with BibliomanProvider() as provider:
+                    if not provider.is_enabled():
+                        return []
+                    
+                    # Search Biblioman
+                    if title and author:
+                        result = provider.find_best_match(title, author, threshold=0.7)
+                        if result:
+                            return [result]
+                        # Fallback to title search
+                        return provider.search_by_title(title, limit=8)
+                    elif title:
+                        return provider.search_by_title(title, limit=8)
+                    elif author:
+                        return provider.search_by_author(author, limit=8)
                     return []
-                
-                # Search Biblioman
-                if title and author:
-                    result = provider.find_best_match(title, author, threshold=0.7)
-                    if result:
-                        return [result]
-                    # Fallback to title search
-                    return provider.search_by_title(title, limit=8)
-                elif title:
-                    return provider.search_by_title(title, limit=8)
-                elif author:
-                    return provider.search_by_author(author, limit=8)
-                return []
             except Exception as e:
                 current_app.logger.debug(f"[SEARCH] Biblioman failed: {e}")
                 return []
@@ -5143,6 +5143,7 @@ async def process_biblioman_csv_import(import_config):
         update_job_in_kuzu(task_id, err)
         safe_update_import_job(user_id, task_id, err)
     finally:
+        biblioman_provider.close()
         try:
             if os.path.exists(csv_file_path):
                 os.unlink(csv_file_path)
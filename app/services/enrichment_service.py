@@ -9,10 +9,17 @@ Created: 2025-12-23
 import os
 import logging
 import asyncio
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union, AsyncIterable
 from datetime import datetime
 
 from .metadata_providers.perplexity import PerplexityEnricher
+from app.utils.text_utils import (
+    IMAGE_EXTENSIONS,
+    IMAGE_EXTENSION_PARAM_RE,
+    has_isbn_in_path,
+    is_cyrillic,
+    is_isbn13,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +110,7 @@ class EnrichmentService:
         # Configuration
         self.min_quality_score = float(os.getenv('AI_ENRICHMENT_MIN_QUALITY', '0.7'))
         self.rate_limit_delay = float(os.getenv('AI_ENRICHMENT_RATE_LIMIT', '1.0'))
+        self.concurrency = int(os.getenv('AI_ENRICHMENT_CONCURRENCY', '1'))
         self.download_covers = os.getenv('AI_COVER_DOWNLOAD', 'true').lower() == 'true'
         
         logger.info(f"⚙️  Config: min_quality={self.min_quality_score}, "
@@ -252,20 +260,30 @@ class EnrichmentService:
     
     async def enrich_batch(
         self, 
-        books: List[Dict],
+        books: Union[List[Dict], AsyncIterable[Dict]],
         force: bool = False,
         require_cover: bool = False,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        concurrency: Optional[int] = None,
+        total: Optional[int] = None
     ) -> Dict:
         """
         Enrich multiple books in batch
         
+        Up to `concurrency` books are enriched at the same time; request starts
+        are still spaced at least rate_limit_delay seconds apart.
+        
         Args:
-            books: List of book dictionaries
+            books: List of book dictionaries, or an async iterable yielding
+                   them (consumed as books are started, not up front)
             force: Force enrichment even if book already has data
             require_cover: If True, books must have valid cover URL to be considered sufficient
             progress_callback: Optional callback for progress updates
                               Signature: callback(processed, total, current_book, metadata)
+            concurrency: Maximum books enriched at once (default: AI_ENRICHMENT_CONCURRENCY)
+            total: Expected number of books, for progress reporting when books
+                   is an async iterable (default: len(books) for lists). May be
+                   an upper bound; stats['total'] is the number actually processed
             
         Returns:
             Statistics dictionary
@@ -275,7 +293,7 @@ class EnrichmentService:
         self._require_cover = require_cover
         
         stats = {
-            'total': len(books),
+            'total': total if total is not None else (len(books) if isinstance(books, list) else 0),
             'processed': 0,
             'enriched': 0,
             'failed': 0,
@@ -285,18 +303,35 @@ class EnrichmentService:
             'start_time': datetime.now(),
         }
         
-        logger.info(f"📦 Starting batch enrichment: {len(books)} books")
+        concurrency = max(1, concurrency or self.concurrency)
+        logger.info(f"📦 Starting batch enrichment: {stats['total'] or 'streamed'} books expected (concurrency={concurrency})")
+        
+        sem = asyncio.Semaphore(concurrency)
+        rate_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
         
-        for i, book in enumerate(books, 1):
+        async def wait_for_rate_limit():
+            # Rate limiting: space book starts rate_limit_delay seconds apart
+            nonlocal next_start
+            async with rate_lock:
+                delay = next_start - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_start = loop.time() + self.rate_limit_delay
+        
+        async def enrich_one(i: int, book: Dict):
             try:
+                await wait_for_rate_limit()
+                
                 book_title = book.get('title', 'Unknown')
-                logger.info(f"🔍 [enrich_batch] Processing book {i}/{len(books)}: '{book_title}' (force={force}, require_cover={require_cover})")
+                logger.info(f"🔍 [enrich_batch] Processing book {i}/{stats['total'] or '?'}: '{book_title}' (force={force}, require_cover={require_cover})")
                 
                 # Enrich book (pass force flag and require_cover)
                 metadata = await self.enrich_single_book(book, force=force, require_cover=require_cover)
                 
                 stats['processed'] += 1
-                logger.info(f"🔍 [enrich_batch] Book {i}/{len(books)} '{book_title}': metadata={'found' if metadata else 'None'}")
+                logger.info(f"🔍 [enrich_batch] Book {i}/{stats['total'] or '?'} '{book_title}': metadata={'found' if metadata else 'None'}")
                 
                 if metadata:
                     stats['enriched'] += 1
@@ -321,13 +356,30 @@ class EnrichmentService:
                         metadata=metadata
                     )
                 
-                # Rate limiting
-                if i < len(books):  # Don't delay after last book
-                    await asyncio.sleep(self.rate_limit_delay)
-                
             except Exception as e:
                 logger.error(f"Error in batch processing: {e}")
                 stats['failed'] += 1
+            finally:
+                sem.release()
+        
+        async def iter_books():
+            if isinstance(books, list):
+                for book in books:
+                    yield book
+            else:
+                async for book in books:
+                    yield book
+        
+        # Take a semaphore slot before starting each book, so books are only
+        # pulled from the source as fast as they can be enriched
+        tasks = []
+        count = 0
+        async for book in iter_books():
+            await sem.acquire()
+            count += 1
+            tasks.append(asyncio.create_task(enrich_one(count, book)))
+        await asyncio.gather(*tasks)
+        stats['total'] = count
         
         # Final statistics
         stats['end_time'] = datetime.now()
@@ -415,15 +467,14 @@ class EnrichmentService:
                         logger.debug(f"🔍 [_has_sufficient_data] Local cover file not found: {cover_path}")
                 except Exception as e:
                     logger.debug(f"🔍 [_has_sufficient_data] Could not verify local cover '{cover_url}': {e}")
-            elif cover_url.startswith('http://') or cover_url.startswith('https://'):
+            elif cover_url.startswith(('http://', 'https://')):
                 cover_url_lower = cover_url.lower()
-                image_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif']
                 
                 # Check if URL ends with image extension
-                ends_with_extension = any(cover_url_lower.endswith(ext) for ext in image_extensions)
+                ends_with_extension = cover_url_lower.endswith(IMAGE_EXTENSIONS)
                 
                 # Check if URL contains image extension before query params
-                contains_extension = any(f'{ext}?' in cover_url_lower or f'{ext}&' in cover_url_lower for ext in image_extensions)
+                contains_extension = IMAGE_EXTENSION_PARAM_RE.search(cover_url_lower) is not None
                 
                 # Special case: cache URLs must end with extension to be valid
                 # Broken cache URLs like "cache/926507dc7f..." are invalid
@@ -433,9 +484,8 @@ class EnrichmentService:
                 if is_cache_url:
                     # Cache URLs must end with extension AND not contain suspicious patterns
                     # Suspicious patterns: ISBN numbers (13 digits starting with 978 or 979) in path
-                    import re
                     # Check for ISBN in path (can be between / or at end before extension)
-                    has_isbn_in_path = bool(re.search(r'/(978|979)\d{10}(/|\.)', cover_url))
+                    isbn_in_path = has_isbn_in_path(cover_url)
                     
                     # Also check if filename itself is an ISBN (13 digits)
                     path_after_cache = cover_url.split('/cache/')[-1] if '/cache/' in cover_url else ''
@@ -443,23 +493,23 @@ class EnrichmentService:
                     if path_segments:
                         # Remove extension from last segment
                         last_seg = path_segments[-1]
-                        for ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']:
+                        for ext in IMAGE_EXTENSIONS:
                             if last_seg.lower().endswith(ext):
                                 last_seg = last_seg[:-len(ext)]
                                 break
-                        filename_is_isbn = bool(re.match(r'^(978|979)\d{10}$', last_seg))
+                        filename_is_isbn = is_isbn13(last_seg)
                     else:
                         filename_is_isbn = False
                     
                     # Check if path segments are mostly single digits (suspicious pattern like /9/7/9783836555401)
                     has_numeric_path = len(path_segments) > 2 and all(len(seg) <= 2 and seg.isdigit() for seg in path_segments[:-1])
                     
-                    has_cover = ends_with_extension and not has_isbn_in_path and not has_numeric_path and not filename_is_isbn
+                    has_cover = ends_with_extension and not isbn_in_path and not has_numeric_path and not filename_is_isbn
                 else:
                     # Non-cache URLs: check if ends with extension or contains it before query params
                     has_cover = ends_with_extension or contains_extension
                 
-                # If require_cover is True, also check accessibility (same as _get_books_to_enrich)
+                # If require_cover is True, also check accessibility (same as _iter_books_to_enrich)
                 if has_cover and require_cover:
                     try:
                         import httpx
@@ -505,7 +555,7 @@ class EnrichmentService:
                 return False  # Book needs cover, enrich it
         
         # For Bulgarian books, cover is critical - don't skip if missing cover
-        is_bulgarian = any('\u0400' <= char <= '\u04FF' for char in title) or book_data.get('language') == 'bg'
+        is_bulgarian = is_cyrillic(title) or book_data.get('language') == 'bg'
         
         if is_bulgarian:
             # Bulgarian books MUST have cover - it's critical
@@ -565,14 +615,14 @@ class EnrichmentService:
             
             # Check book title language
             title = merged.get('title', '') or ai_metadata.get('title', '')
-            has_cyrillic_title = any('\u0400' <= char <= '\u04FF' for char in title)
+            has_cyrillic_title = is_cyrillic(title)
             
             # Check if existing description matches title language
-            existing_has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in existing_desc) if existing_desc else False
+            existing_has_cyrillic = is_cyrillic(existing_desc)
             existing_matches_title = (has_cyrillic_title and existing_has_cyrillic) or (not has_cyrillic_title and not existing_has_cyrillic)
             
             # Check if AI description matches title language
-            ai_has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in ai_desc)
+            ai_has_cyrillic = is_cyrillic(ai_desc)
             ai_matches_title = (has_cyrillic_title and ai_has_cyrillic) or (not has_cyrillic_title and not ai_has_cyrillic)
             
             # Use AI description ONLY if it matches title language
@@ -661,4 +711,6 @@ class EnrichmentService:
         """Close all connections"""
         if self.perplexity:
             await self.perplexity.close()
+        if self.openai_enricher:
+            await self.openai_enricher.close()
 
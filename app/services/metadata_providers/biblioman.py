@@ -6,12 +6,35 @@ Biblioman has 23,000+ Bulgarian book records with ISBN coverage of ~60%.
 """
 import os
 import logging
+import threading
 import mysql.connector
+from mysql.connector import pooling
 from typing import Optional, List, Dict, Any
 from difflib import SequenceMatcher
 
 logger = logging.getLogger(__name__)
 
+# Providers are created per lookup, so connections are pooled per process to
+# avoid a TCP + auth handshake on every search
+_POOL_SIZE = int(os.getenv('BIBLIOMAN_POOL_SIZE', '5'))
+_pool: Optional[pooling.MySQLConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(config: Dict[str, Any]) -> pooling.MySQLConnectionPool:
+    """Get the shared connection pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Sessions are configured identically, so skip the reset round-trip per checkout
+            _pool = pooling.MySQLConnectionPool(
+                pool_name='biblioman',
+                pool_size=_POOL_SIZE,
+                pool_reset_session=False,
+                **config
+            )
+        return _pool
+
 class BibliomanProvider:
     """Metadata provider for Biblioman database."""
     
@@ -41,9 +64,17 @@ class BibliomanProvider:
             return False
         
         try:
-            if not self.db or not self.db.is_connected():
+            if self.db is not None and not self.db.is_connected():
+                # Dropped (e.g. server idle timeout) - still hand it back so the
+                # pool slot is not lost; the pool reconnects it on checkout
+                self.close()
+            if self.db is None:
                 logger.debug(f"Connecting to Biblioman database at {self.config['host']}:{self.config['port']}")
-                self.db = mysql.connector.connect(**self.config)
+                try:
+                    self.db = _get_pool(self.config).get_connection()
+                except mysql.connector.errors.PoolError:
+                    # All pooled connections are checked out - use a one-off connection
+                    self.db = mysql.connector.connect(**self.config)
                 logger.debug("Biblioman database connection established")
             return True
         except mysql.connector.Error as e:
@@ -57,11 +88,23 @@ class BibliomanProvider:
             return False
     
     def close(self):
-        """Close database connection."""
-        if self.db and self.db.is_connected():
-            self.db.close()
+        """Close database connection (pooled connections go back to the pool)."""
+        if self.db is not None:
+            # Always close: for pooled connections this is what returns the
+            # slot to the pool, even if the connection has dropped
+            try:
+                self.db.close()
+            except mysql.connector.Error as e:
+                logger.debug(f"Error closing Biblioman connection: {e}")
             self.db = None
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Return the connection to the pool
+        self.close()
+    
     def search_by_isbn(self, isbn: str) -> Optional[Dict[str, Any]]:
         """Search for book by ISBN (cleaned ISBN-10 or ISBN-13)."""
         if not self.connect():
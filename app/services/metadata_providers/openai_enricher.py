@@ -14,8 +14,16 @@ from typing import Dict, Optional, Any
 import httpx
 from flask import current_app
 
+from app.utils.text_utils import is_cyrillic
+
 logger = logging.getLogger(__name__)
 
+# Author list separator
+_AUTHOR_SPLIT_RE = re.compile(r'[,;]')
+
+# Connection pool for the shared API client (enough for concurrent batch enrichment)
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
 
 class OpenAIEnricher:
     """
@@ -48,6 +56,8 @@ class OpenAIEnricher:
         self.timeout = int(config.get('AI_TIMEOUT', '30'))
         self.max_tokens = int(config.get('AI_MAX_TOKENS', '2000'))
         self.temperature = float(config.get('AI_TEMPERATURE', '0.1'))
+        # Created on first use and reused, so keep-alive connections are shared across books
+        self._client: Optional[httpx.AsyncClient] = None
         
         logger.info(f"✅ OpenAIEnricher initialized with provider: {self.provider}")
     
@@ -77,7 +87,7 @@ class OpenAIEnricher:
         """
         try:
             # Check if book is Bulgarian (has Cyrillic in title)
-            has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in title)
+            has_cyrillic = is_cyrillic(title)
             
             # Build query
             query = self._build_metadata_query(title, author, isbn, publisher, has_cyrillic)
@@ -233,16 +243,16 @@ IMPORTANT: If you don't know the book, return null for description!
                 'response_format': {'type': 'json_object'}
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                result = response.json()
-                
-                if 'choices' in result and len(result['choices']) > 0:
-                    return result['choices'][0]['message']['content']
-                
-                return None
-                
+            client = self._get_client()
+            response = await client.post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            result = response.json()
+            
+            if 'choices' in result and len(result['choices']) > 0:
+                return result['choices'][0]['message']['content']
+            
+            return None
+            
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
             return None
@@ -275,20 +285,32 @@ IMPORTANT: If you don't know the book, return null for description!
                 'format': 'json'
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                result = response.json()
-                
-                if 'message' in result and 'content' in result['message']:
-                    return result['message']['content']
-                
-                return None
-                
+            client = self._get_client()
+            response = await client.post(url, json=payload)
+            response.raise_for_status()
+            result = response.json()
+            
+            if 'message' in result and 'content' in result['message']:
+                return result['message']['content']
+            
+            return None
+            
         except Exception as e:
             logger.error(f"Ollama API error: {e}")
             return None
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared API client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=_HTTP_LIMITS)
+        return self._client
+    
+    async def close(self):
+        """Close HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _parse_response(self, response_text: str, has_cyrillic: bool) -> Optional[Dict[str, Any]]:
         """Parse AI response"""
         try:
@@ -314,15 +336,15 @@ IMPORTANT: If you don't know the book, return null for description!
             if data.get('author'):
                 author = data['author']
                 if ',' in author or ';' in author:
-                    authors_list = [a.strip() for a in re.split(r'[,;]', author)]
+                    authors_list = [a.strip() for a in _AUTHOR_SPLIT_RE.split(author)]
                     if has_cyrillic:
-                        cyrillic_authors = [a for a in authors_list if any('\u0400' <= char <= '\u04FF' for char in a)]
+                        cyrillic_authors = [a for a in authors_list if is_cyrillic(a)]
                         if cyrillic_authors:
                             data['author'] = cyrillic_authors[0]
                         else:
                             data['author'] = authors_list[0]
                     else:
-                        english_authors = [a for a in authors_list if not any('\u0400' <= char <= '\u04FF' for char in a)]
+                        english_authors = [a for a in authors_list if not is_cyrillic(a)]
                         if english_authors:
                             data['author'] = english_authors[0]
                         else:
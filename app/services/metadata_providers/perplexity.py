@@ -15,8 +15,131 @@ from typing import Optional, Dict, List
 from datetime import datetime
 import asyncio
 
+from app.utils.text_utils import is_cyrillic
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 (one multiplexed connection for concurrent requests) needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# Author list separator
+_AUTHOR_SPLIT_RE = re.compile(r'[,;]')
+
+# Prompt text shared by every request; only the book fields are built per call.
+# The system prompt is sent first and is identical across calls.
+_SYSTEM_PROMPT = (
+    "Ти си експерт по българска литература и книжен пазар. "
+    "Намираш ТОЧНА информация за български книги от интернет. "
+    "Винаги цитираш източници и не измисляш данни. "
+    "Отговаряш САМО в JSON формат, без допълнителен текст."
+)
+
+_BG_QUERY_INSTRUCTIONS = """
+
+ВАЖНО: Търся ИЗКЛЮЧИТЕЛНО БЪЛГАРСКОТО издание на тази книга!
+- Ако книгата е превод, търси българския превод
+- Ако книгата е оригинално българска, търси българското издание
+- НЕ търси оригиналното издание на друг език!
+
+ТЪРСЯ СЛЕДНАТА ИНФОРМАЦИЯ:
+
+1. **Точно заглавие** на български (може да има подзаглавие)
+2. **Автор** - ЕДИН основен автор на български (не английско!). Ако книгата е от Агата Кристи, авторът е "Агата Кристи" (не "Christie, Agatha" или други варианти!)
+3. **Преводач** (ако книгата е превод)
+4. **Издателство** - българско издателство
+5. **Година на издаване** в България
+6. **ISBN номер** (ISBN-10 или ISBN-13)
+7. **Брой страници**
+8. **Жанр/Категории** (2-4 категории)
+9. **Описание** - 3-4 изречения на български за какво е книгата
+10. **URL на корица** - директен линк към изображение (JPG/PNG)
+
+ВАЖНО:
+- Търся БЪЛГАРСКОТО издание, НЕ оригинала!
+- Корицата трябва да е от българското издание
+- Ако има няколко издания, предпочитай по-новото
+- Проверявай в: chitanka.info, biblioman, ciela.com, helikon.bg, ozone.bg, knigomania.bg, book.store.bg
+
+КРИТИЧНО ВАЖНО: ОТГОВОРИ САМО С ВАЛИДЕН JSON ОБЕКТ! Без markdown code blocks, без текст преди или след JSON-а!
+
+JSON ФОРМАТ (задължително):
+{{
+    "title": "Точно заглавие",
+    "subtitle": "Подзаглавие ако има",
+    "author": "Име Фамилия",
+    "translator": "Име на преводач ако има",
+    "publisher": "Име на издателство",
+    "year": "2024",
+    "isbn": "978-954-xxx-xxx-x",
+    "pages": 384,
+    "genres": ["Жанр1", "Жанр2", "Жанр3"],
+    "description": "Описание на български...",
+    "cover_url": "https://direkten-url-kam-korica.jpg",
+    "confidence": 0.95,
+    "sources": ["url1", "url2"]
+}}
+
+ПРАВИЛА:
+- ВИНАГИ включи "title" и "author" полетата (задължителни!)
+- Ако НЕ НАМЕРИШ някое поле, използвай null (не празен string!)
+- Не измисляй информация - само точни данни от надеждни източници!
+- JSON-ът трябва да е валиден и да може да се parse-не директно с json.loads()!
+"""
+
+_EN_QUERY_INSTRUCTIONS = """
+
+IMPORTANT: I'm looking for the ENGLISH edition of this book!
+- If the book is a translation, find the English original
+- If the book is originally English, find the English edition
+- DO NOT search for translations in other languages!
+
+I NEED THE FOLLOWING INFORMATION:
+
+1. **Exact title** in English (may have subtitle)
+2. **Author** - ONE main author in English (e.g., "Donna Tartt" not "Тарт, Дона" or other variants!)
+3. **Publisher** - English/American publisher
+4. **Publication year** in English-speaking country
+5. **ISBN number** (ISBN-10 or ISBN-13)
+6. **Page count**
+7. **Genres/Categories** (2-4 categories)
+8. **Description** - 3-4 sentences in English about what the book is about
+9. **Cover URL** - direct link to image (JPG/PNG)
+
+IMPORTANT:
+- I'm looking for the ENGLISH edition, NOT translations!
+- Cover should be from the English edition
+- If there are multiple editions, prefer the newer one
+- Check sources like: Amazon, Goodreads, Google Books, OpenLibrary
+
+CRITICALLY IMPORTANT: RESPOND ONLY WITH A VALID JSON OBJECT! No markdown code blocks, no text before or after the JSON!
+
+JSON FORMAT (required):
+{{
+    "title": "Exact title",
+    "subtitle": "Subtitle if any",
+    "author": "First Last",
+    "publisher": "Publisher name",
+    "year": "2024",
+    "isbn": "978-0-xxx-xxx-x",
+    "pages": 384,
+    "genres": ["Genre1", "Genre2", "Genre3"],
+    "description": "Description in English...",
+    "cover_url": "https://direct-url-to-cover.jpg",
+    "confidence": 0.95,
+    "sources": ["url1", "url2"]
+}}
+
+RULES:
+- ALWAYS include "title" and "author" fields (required!)
+- If you CANNOT FIND a field, use null (not empty string!)
+- Don't make up information - only accurate data from reliable sources!
+- JSON must be valid and parseable directly with json.loads()!
+"""
+
 
 class PerplexityEnricher:
     """
@@ -28,6 +151,10 @@ class PerplexityEnricher:
     
     API_URL = "https://api.perplexity.ai/chat/completions"
     
+    # Retries for HTTP 429 (rate limited) responses, with exponential backoff
+    MAX_RATE_LIMIT_RETRIES = 3
+    MAX_RATE_LIMIT_BACKOFF = 32.0
+    
     # Perplexity models (as of Dec 2024)
     # Sonar model family - see https://docs.perplexity.ai/getting-started/models
     MODEL_SONAR = "sonar"  # Fast, reliable answers with detailed research
@@ -46,7 +173,16 @@ class PerplexityEnricher:
         # Default to sonar-pro for best balance of quality and web search
         # All sonar models support web search
         self.model = model or os.getenv('PERPLEXITY_MODEL', 'sonar-pro')
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # Pool sized for concurrent batch enrichment; keep-alive reuses TLS connections
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=H2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=30.0)
+        )
         
         logger.info(f"✅ PerplexityEnricher initialized with model: {self.model}")
     
@@ -229,156 +365,58 @@ RULES:
         publisher = existing_data.get('publisher') if existing_data else None
         
         # Check if book title contains Cyrillic (Bulgarian)
-        has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in title)
+        has_cyrillic = is_cyrillic(title)
         
         # Normalize author - if multiple authors, try to find the main one
         # For Bulgarian books, prefer Bulgarian name format
-        import re
         author_normalized = author
         if ',' in author or ';' in author:
             # Multiple authors - try to extract main author
-            authors_list = [a.strip() for a in re.split(r'[,;]', author)]
+            authors_list = [a.strip() for a in _AUTHOR_SPLIT_RE.split(author)]
             # For Bulgarian books, prefer Cyrillic name
-            cyrillic_authors = [a for a in authors_list if any('\u0400' <= char <= '\u04FF' for char in a)]
+            cyrillic_authors = [a for a in authors_list if is_cyrillic(a)]
             if cyrillic_authors:
                 author_normalized = cyrillic_authors[0]  # Use first Bulgarian name
             else:
                 author_normalized = authors_list[0]  # Use first author
         
-        # Build query - handle missing author
+        # Build query - handle missing author. Only the book fields vary per
+        # call; the instruction text is a module constant joined in once
         if author_normalized and author_normalized.strip():
-            query = f"""
+            parts = [f"""
 Намери детайлна информация за българската книга:
 
 ЗАГЛАВИЕ: {title}
 АВТОР: {author_normalized}
-"""
+"""]
         else:
             # No author provided - AI should find it
-            query = f"""
+            parts = [f"""
 Намери детайлна информация за българската книга:
 
 ЗАГЛАВИЕ: {title}
 
 ВАЖНО: Ако знаеш автора на тази книга, включи го в отговора!
-"""
+"""]
         
         if has_cyrillic:
             # Bulgarian book query
             if isbn:
-                query += f"ISBN: {isbn}\n"
+                parts.append(f"ISBN: {isbn}\n")
             if publisher:
-                query += f"ИЗДАТЕЛСТВО: {publisher}\n"
+                parts.append(f"ИЗДАТЕЛСТВО: {publisher}\n")
             
-            query += """
-
-ВАЖНО: Търся ИЗКЛЮЧИТЕЛНО БЪЛГАРСКОТО издание на тази книга!
-- Ако книгата е превод, търси българския превод
-- Ако книгата е оригинално българска, търси българското издание
-- НЕ търси оригиналното издание на друг език!
-
-ТЪРСЯ СЛЕДНАТА ИНФОРМАЦИЯ:
-
-1. **Точно заглавие** на български (може да има подзаглавие)
-2. **Автор** - ЕДИН основен автор на български (не английско!). Ако книгата е от Агата Кристи, авторът е "Агата Кристи" (не "Christie, Agatha" или други варианти!)
-3. **Преводач** (ако книгата е превод)
-4. **Издателство** - българско издателство
-5. **Година на издаване** в България
-6. **ISBN номер** (ISBN-10 или ISBN-13)
-7. **Брой страници**
-8. **Жанр/Категории** (2-4 категории)
-9. **Описание** - 3-4 изречения на български за какво е книгата
-10. **URL на корица** - директен линк към изображение (JPG/PNG)
-
-ВАЖНО:
-- Търся БЪЛГАРСКОТО издание, НЕ оригинала!
-- Корицата трябва да е от българското издание
-- Ако има няколко издания, предпочитай по-новото
-- Проверявай в: chitanka.info, biblioman, ciela.com, helikon.bg, ozone.bg, knigomania.bg, book.store.bg
-
-КРИТИЧНО ВАЖНО: ОТГОВОРИ САМО С ВАЛИДЕН JSON ОБЕКТ! Без markdown code blocks, без текст преди или след JSON-а!
-
-JSON ФОРМАТ (задължително):
-{{
-    "title": "Точно заглавие",
-    "subtitle": "Подзаглавие ако има",
-    "author": "Име Фамилия",
-    "translator": "Име на преводач ако има",
-    "publisher": "Име на издателство",
-    "year": "2024",
-    "isbn": "978-954-xxx-xxx-x",
-    "pages": 384,
-    "genres": ["Жанр1", "Жанр2", "Жанр3"],
-    "description": "Описание на български...",
-    "cover_url": "https://direkten-url-kam-korica.jpg",
-    "confidence": 0.95,
-    "sources": ["url1", "url2"]
-}}
-
-ПРАВИЛА:
-- ВИНАГИ включи "title" и "author" полетата (задължителни!)
-- Ако НЕ НАМЕРИШ някое поле, използвай null (не празен string!)
-- Не измисляй информация - само точни данни от надеждни източници!
-- JSON-ът трябва да е валиден и да може да се parse-не директно с json.loads()!
-"""
+            parts.append(_BG_QUERY_INSTRUCTIONS)
         else:
             # English book query
             if isbn:
-                query += f"ISBN: {isbn}\n"
+                parts.append(f"ISBN: {isbn}\n")
             if publisher:
-                query += f"PUBLISHER: {publisher}\n"
+                parts.append(f"PUBLISHER: {publisher}\n")
             
-            query += """
-
-IMPORTANT: I'm looking for the ENGLISH edition of this book!
-- If the book is a translation, find the English original
-- If the book is originally English, find the English edition
-- DO NOT search for translations in other languages!
-
-I NEED THE FOLLOWING INFORMATION:
-
-1. **Exact title** in English (may have subtitle)
-2. **Author** - ONE main author in English (e.g., "Donna Tartt" not "Тарт, Дона" or other variants!)
-3. **Publisher** - English/American publisher
-4. **Publication year** in English-speaking country
-5. **ISBN number** (ISBN-10 or ISBN-13)
-6. **Page count**
-7. **Genres/Categories** (2-4 categories)
-8. **Description** - 3-4 sentences in English about what the book is about
-9. **Cover URL** - direct link to image (JPG/PNG)
-
-IMPORTANT:
-- I'm looking for the ENGLISH edition, NOT translations!
-- Cover should be from the English edition
-- If there are multiple editions, prefer the newer one
-- Check sources like: Amazon, Goodreads, Google Books, OpenLibrary
-
-CRITICALLY IMPORTANT: RESPOND ONLY WITH A VALID JSON OBJECT! No markdown code blocks, no text before or after the JSON!
-
-JSON FORMAT (required):
-{{
-    "title": "Exact title",
-    "subtitle": "Subtitle if any",
-    "author": "First Last",
-    "publisher": "Publisher name",
-    "year": "2024",
-    "isbn": "978-0-xxx-xxx-x",
-    "pages": 384,
-    "genres": ["Genre1", "Genre2", "Genre3"],
-    "description": "Description in English...",
-    "cover_url": "https://direct-url-to-cover.jpg",
-    "confidence": 0.95,
-    "sources": ["url1", "url2"]
-}}
-
-RULES:
-- ALWAYS include "title" and "author" fields (required!)
-- If you CANNOT FIND a field, use null (not empty string!)
-- Don't make up information - only accurate data from reliable sources!
-- JSON must be valid and parseable directly with json.loads()!
-"""
+            parts.append(_EN_QUERY_INSTRUCTIONS)
         
-        return query
+        return ''.join(parts)
     
     async def _search(self, query: str) -> Optional[Dict]:
         """
@@ -391,23 +429,13 @@ RULES:
             API response dictionary or None
         """
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         # Build payload - some parameters may not be supported in all API versions
         payload = {
             "model": self.model,
             "messages": [
                 {
                     "role": "system",
-                    "content": (
-                        "Ти си експерт по българска литература и книжен пазар. "
-                        "Намираш ТОЧНА информация за български книги от интернет. "
-                        "Винаги цитираш източници и не измисляш данни. "
-                        "Отговаряш САМО в JSON формат, без допълнителен текст."
-                    )
+                    "content": _SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
@@ -423,11 +451,26 @@ RULES:
         # Try without them first, then add if needed
         
         try:
-            response = await self.client.post(
-                self.API_URL,
-                headers=headers,
-                json=payload
-            )
+            backoff = 2.0
+            for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+                response = await self.client.post(
+                    self.API_URL,
+                    headers=self._headers,
+                    json=payload
+                )
+                if response.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                    break
+                
+                # Rate limited - wait (honouring Retry-After when given) and retry
+                try:
+                    delay = float(response.headers.get('Retry-After', backoff))
+                except ValueError:
+                    delay = backoff
+                delay = min(delay, self.MAX_RATE_LIMIT_BACKOFF)
+                logger.warning(f"⏳ Perplexity rate limit hit (429), retrying in {delay:.0f}s "
+                               f"({attempt + 1}/{self.MAX_RATE_LIMIT_RETRIES})")
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, self.MAX_RATE_LIMIT_BACKOFF)
             
             # Log response details for debugging
             if response.status_code != 200:
@@ -525,9 +568,9 @@ RULES:
                 author_from_ai = metadata['author']
                 # If multiple authors separated by comma/semicolon, take the first/main one
                 if ',' in author_from_ai or ';' in author_from_ai:
-                    authors_list = [a.strip() for a in re.split(r'[,;]', author_from_ai)]
+                    authors_list = [a.strip() for a in _AUTHOR_SPLIT_RE.split(author_from_ai)]
                     # For Bulgarian books, prefer Cyrillic name
-                    cyrillic_authors = [a for a in authors_list if any('\u0400' <= char <= '\u04FF' for char in a)]
+                    cyrillic_authors = [a for a in authors_list if is_cyrillic(a)]
                     if cyrillic_authors:
                         metadata['author'] = cyrillic_authors[0]
                     else:
@@ -538,8 +581,8 @@ RULES:
             if not metadata.get('author') and author:
                 # Normalize original author too
                 if ',' in author or ';' in author:
-                    authors_list = [a.strip() for a in re.split(r'[,;]', author)]
-                    cyrillic_authors = [a for a in authors_list if any('\u0400' <= char <= '\u04FF' for char in a)]
+                    authors_list = [a.strip() for a in _AUTHOR_SPLIT_RE.split(author)]
+                    cyrillic_authors = [a for a in authors_list if is_cyrillic(a)]
                     if cyrillic_authors:
                         metadata['author'] = cyrillic_authors[0]
                     else:
@@ -716,7 +759,7 @@ RULES:
         logger.info(f"🖼️  Searching for cover: {title}")
         
         # Check if book is Bulgarian (has Cyrillic in title)
-        has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in title)
+        has_cyrillic = is_cyrillic(title)
         
         if has_cyrillic:
             query = f"""
@@ -895,6 +938,12 @@ If you cannot find a quality WORKING cover, respond: NOT_FOUND
         """Close HTTP client"""
         await self.client.aclose()
     
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
     def __repr__(self):
         return f"PerplexityEnricher(model={self.model})"
 
@@ -2,12 +2,25 @@
 Text utilities for Cyrillic and Unicode text handling.
 
 Provides functions for detecting Cyrillic text and normalizing text
-while preserving Cyrillic characters for search and comparison.
+while preserving Cyrillic characters for search and comparison, plus
+the cover URL rules shared by the enrichment service and scripts.
+This module has no Flask or database dependencies.
 """
 import unicodedata
 import re
 from typing import Optional
 
+# Cyrillic Unicode range: U+0400 to U+04FF. Literal characters rather than
+# \u escapes, so the same pattern also works in Kuzu's regexp_matches (RE2)
+CYRILLIC_CHAR_CLASS = '[\u0400-\u04FF]'
+_CYRILLIC_RE = re.compile(CYRILLIC_CHAR_CLASS)
+
+# Image file extensions accepted in cover URLs
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+# Image extension followed by '?' or '&' anywhere in the URL (also matches
+# image-proxy URLs like image.php?src=cover.jpg&w=300)
+IMAGE_EXTENSION_PARAM_RE = re.compile(r'\.(?:jpg|jpeg|png|webp|gif)[?&]')
+
 
 def is_cyrillic(text: str) -> bool:
     """
@@ -22,10 +35,10 @@ def is_cyrillic(text: str) -> bool:
     Returns:
         True if text contains any Cyrillic characters, False otherwise
     """
-    if not text:
+    if not text or text.isascii():
         return False
     
-    return any('\u0400' <= char <= '\u04FF' for char in text)
+    return _CYRILLIC_RE.search(text) is not None
 
 
 def normalize_text(text: str, preserve_cyrillic: bool = True) -> str:
@@ -101,3 +114,27 @@ def should_use_biblioman(title: Optional[str] = None, author: Optional[str] = No
         return True
     return False
 
+
+def is_isbn13(segment: str) -> bool:
+    """True if segment is a bare ISBN-13 (978/979 prefix + 10 digits)"""
+    return (
+        len(segment) == 13
+        and segment.isascii()
+        and segment.isdigit()
+        and segment[:3] in ('978', '979')
+    )
+
+
+def has_isbn_in_path(url: str) -> bool:
+    """
+    Check whether a URL contains an ISBN-13 path segment.
+    
+    Matches '/978...' or '/979...' (13 digits) followed by '/' or '.', the
+    pattern of broken ISBN-derived cache URLs like cache/HASH/9/7/9783836555401.jpg
+    """
+    start = url.find('/97')
+    while start != -1:
+        if is_isbn13(url[start + 1:start + 14]) and url[start + 14:start + 15] in ('/', '.'):
+            return True
+        start = url.find('/97', start + 1)
+    return False
@@ -15,6 +15,8 @@ import requests
 import os
 import logging
 
+from app.utils.text_utils import is_cyrillic
+
 _META_LOG = logging.getLogger(__name__)
 _META_DEBUG = os.getenv('METADATA_DEBUG', '0').lower() in ('1','true','yes','on')
 
@@ -633,7 +635,7 @@ def _merge_dicts(google: Dict[str, Any], openlib: Dict[str, Any], biblioman: Opt
 		# Prioritize Biblioman if it has Cyrillic content
 		if b_val and isinstance(b_val, str):
 			# Check if value contains Cyrillic characters
-			has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in b_val)
+			has_cyrillic = is_cyrillic(b_val)
 			if has_cyrillic:
 				merged[key] = b_val
 				continue
@@ -662,7 +664,7 @@ def _merge_dicts(google: Dict[str, Any], openlib: Dict[str, Any], biblioman: Opt
 	o_spec = openlib.get('published_date_specificity', 0)
 	
 	# If Biblioman has date and title contains Cyrillic, prefer it
-	if b_date and biblioman.get('title') and any('\u0400' <= char <= '\u04FF' for char in str(biblioman.get('title', ''))):
+	if b_date and biblioman.get('title') and is_cyrillic(str(biblioman.get('title', ''))):
 		merged['published_date'] = b_date
 		merged['published_date_specificity'] = b_spec
 	elif g_date and o_date:
@@ -693,7 +695,7 @@ def _merge_dicts(google: Dict[str, Any], openlib: Dict[str, Any], biblioman: Opt
 	b_desc = biblioman.get('description')
 	g_desc = google.get('description')
 	o_desc = openlib.get('description')
-	if b_desc and isinstance(b_desc, str) and any('\u0400' <= char <= '\u04FF' for char in b_desc):
+	if b_desc and isinstance(b_desc, str) and is_cyrillic(b_desc):
 		merged['description'] = b_desc
 	else:
 		merged['description'] = _choose_longer_text(_choose_longer_text(b_desc, g_desc), o_desc)
@@ -706,7 +708,7 @@ def _merge_dicts(google: Dict[str, Any], openlib: Dict[str, Any], biblioman: Opt
 		b_authors = [a.strip() for a in b_authors.split(',') if a.strip()]
 	
 	# Prioritize Biblioman authors if they contain Cyrillic
-	has_cyrillic_authors = any(isinstance(a, str) and any('\u0400' <= char <= '\u04FF' for char in a) for a in b_authors)
+	has_cyrillic_authors = any(isinstance(a, str) and is_cyrillic(a) for a in b_authors)
 	
 	sources = []
 	if has_cyrillic_authors:
@@ -837,22 +839,22 @@ def _fetch_biblioman_by_isbn(isbn: str) -> Dict[str, Any]:
 	try:
 		builtins.print(f"🔍 [UNIFIED_METADATA][BIBLIOMAN] Fetching Biblioman data for ISBN: {isbn}")
 		from app.services.metadata_providers.biblioman import BibliomanProvider
-		provider = BibliomanProvider()
-		if not provider.is_enabled():
-			builtins.print(f"⚠️ [UNIFIED_METADATA][BIBLIOMAN] Provider not enabled for ISBN={isbn}")
+		with BibliomanProvider() as provider:
+			if not provider.is_enabled():
+				builtins.print(f"⚠️ [UNIFIED_METADATA][BIBLIOMAN] Provider not enabled for ISBN={isbn}")
+				if _META_DEBUG:
+					_META_LOG.debug(f"[UNIFIED_METADATA][BIBLIOMAN] Provider not enabled for ISBN={isbn}")
+				return {}
+			result = provider.search_by_isbn(isbn)
+			if result:
+				builtins.print(f"✅ [UNIFIED_METADATA][BIBLIOMAN] Found ISBN={isbn}: biblioman_id={result.get('biblioman_id')}, chitanka_id={result.get('chitanka_id')}, cover_url={result.get('cover_url')}, chitanka_cover_url={result.get('chitanka_cover_url')}, categories={result.get('categories')}")
+				if _META_DEBUG:
+					_META_LOG.info(f"[UNIFIED_METADATA][BIBLIOMAN] Found ISBN={isbn}: cover_url={result.get('cover_url')}, categories={result.get('categories')}, chitanka_id={result.get('chitanka_id')}")
+				return result
+			builtins.print(f"⚠️ [UNIFIED_METADATA][BIBLIOMAN] No result for ISBN={isbn}")
 			if _META_DEBUG:
-				_META_LOG.debug(f"[UNIFIED_METADATA][BIBLIOMAN] Provider not enabled for ISBN={isbn}")
+				_META_LOG.debug(f"[UNIFIED_METADATA][BIBLIOMAN] No result for ISBN={isbn}")
 			return {}
-		result = provider.search_by_isbn(isbn)
-		if result:
-			builtins.print(f"✅ [UNIFIED_METADATA][BIBLIOMAN] Found ISBN={isbn}: biblioman_id={result.get('biblioman_id')}, chitanka_id={result.get('chitanka_id')}, cover_url={result.get('cover_url')}, chitanka_cover_url={result.get('chitanka_cover_url')}, categories={result.get('categories')}")
-			if _META_DEBUG:
-				_META_LOG.info(f"[UNIFIED_METADATA][BIBLIOMAN] Found ISBN={isbn}: cover_url={result.get('cover_url')}, categories={result.get('categories')}, chitanka_id={result.get('chitanka_id')}")
-			return result
-		builtins.print(f"⚠️ [UNIFIED_METADATA][BIBLIOMAN] No result for ISBN={isbn}")
-		if _META_DEBUG:
-			_META_LOG.debug(f"[UNIFIED_METADATA][BIBLIOMAN] No result for ISBN={isbn}")
-		return {}
 	except Exception as e:
 		builtins.print(f"❌ [UNIFIED_METADATA][BIBLIOMAN] Exception for ISBN={isbn}: {e}")
 		if _META_DEBUG:
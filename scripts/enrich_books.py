@@ -12,6 +12,7 @@ Options:
     --dry-run          Show what would be done without making changes
     --quality-min F    Minimum quality score (default: 0.7)
     --no-cover-only    Only enrich books without covers
+    --concurrency N    Number of books to enrich and save concurrently (default: 8)
     -y, --yes          Skip confirmation prompt
 
 Examples:
@@ -34,9 +35,19 @@ import asyncio
 import argparse
 import logging
 import json
-from datetime import datetime
+import re
+import uuid
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Iterator, Tuple, AsyncIterator
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import httpx
+import requests
 
 # Setup logging FIRST before any logger usage
 logging.basicConfig(
@@ -74,7 +85,262 @@ except Exception as e:
 from app.services.enrichment_service import EnrichmentService
 from app.infrastructure.kuzu_repositories import KuzuBookRepository
 from app.infrastructure.kuzu_graph import safe_execute_kuzu_query
+from app.utils.kuzu_migration_helper import safe_kuzu_transaction
 from app.services import book_service
+from app.services.kuzu_person_service import KuzuPersonService
+from app.domain.models import Person
+from app.utils.text_utils import (
+    CYRILLIC_CHAR_CLASS,
+    IMAGE_EXTENSIONS,
+    IMAGE_EXTENSION_PARAM_RE,
+    has_isbn_in_path,
+    is_cyrillic,
+    is_isbn13,
+)
+
+# Optional faster JSON encoder for tracking metadata
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional libuv-based event loop (faster network I/O; not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+# Precompiled patterns used per book while saving enrichment results
+_RE_CITATION = re.compile(r'\[\d+\]')
+_RE_WS = re.compile(r'\s+')
+_RE_AUTHOR_SEP = re.compile(r'[,;]')
+
+# Cypher for the batched author and publisher writes, bound once so every
+# call passes the same string objects
+_PERSON_LOOKUP_CYPHER = """
+UNWIND $names AS name
+MATCH (p:Person {name: name})
+RETURN name, p.id
+"""
+
+_DELETE_AUTHORS_CYPHER = """
+UNWIND $rows AS row
+MATCH (p:Person)-[r:AUTHORED]->(b:Book {id: row.book_id})
+DELETE r
+"""
+
+_CREATE_AUTHORS_CYPHER = """
+UNWIND $rows AS row
+MATCH (p:Person {id: row.person_id}), (b:Book {id: row.book_id})
+MERGE (p)-[r:AUTHORED {role: 'author', order_index: 0}]->(b)
+RETURN b.id
+"""
+
+_PUBLISHER_LOOKUP_CYPHER = """
+UNWIND $names AS name
+MATCH (p:Publisher {name: name})
+RETURN name, p.id
+"""
+
+_CREATE_PUBLISHERS_CYPHER = """
+UNWIND $rows AS row
+CREATE (p:Publisher {id: row.id, name: row.name, country: '', created_at: $created_at})
+"""
+
+_LINK_PUBLISHERS_CYPHER = """
+UNWIND $rows AS row
+MATCH (b:Book {id: row.book_id}), (p:Publisher {id: row.publisher_id})
+MERGE (b)-[:PUBLISHED_BY]->(p)
+RETURN b.id
+"""
+
+# Browser-like headers to avoid 403 Forbidden from cover hosts
+_BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://www.google.com/',
+}
+
+
+# Cover URL classification tags returned by _classify_cover_url
+_COVER_LOCAL = 0          # Locally cached cover (/covers/...)
+_COVER_CACHE_VALID = 1    # External /cache/ URL with a sane image path
+_COVER_CACHE_SUSPECT = 2  # External /cache/ URL that looks broken (ISBN-derived path)
+_COVER_HTTP_VALID = 3     # Other external URL pointing at an image
+_COVER_INVALID = 4        # Missing, non-image or unsupported URL
+
+_VALID_COVER_TAGS = frozenset({_COVER_CACHE_VALID, _COVER_HTTP_VALID})
+
+
+@lru_cache(maxsize=8192)
+def _classify_cover_url(cover_url: str) -> int:
+    """
+    Classify a cover URL into one of the _COVER_* tags.
+
+    Pure string check, no network access:
+    - Cache URLs (/cache/) must end with an image extension and must not look
+      like a broken ISBN-derived path (e.g. cache/HASH/9/7/9783836555401.jpg)
+    - Other URLs must end with an image extension or contain one before
+      query params
+    """
+    if not cover_url:
+        return _COVER_INVALID
+    if cover_url.startswith('/covers/'):
+        return _COVER_LOCAL
+    if not cover_url.startswith(('http://', 'https://')):
+        return _COVER_INVALID
+
+    cover_url_lower = cover_url.lower()
+    ends_with_extension = cover_url_lower.endswith(IMAGE_EXTENSIONS)
+
+    if '/cache/' not in cover_url:
+        # Extension at the end of the URL or followed by query params
+        if ends_with_extension or IMAGE_EXTENSION_PARAM_RE.search(cover_url_lower):
+            return _COVER_HTTP_VALID
+        return _COVER_INVALID
+
+    if not ends_with_extension:
+        return _COVER_INVALID
+    if has_isbn_in_path(cover_url):
+        return _COVER_CACHE_SUSPECT
+
+    path_segments = [s for s in cover_url.split('/cache/')[-1].split('/') if s]
+    if not path_segments:
+        return _COVER_CACHE_VALID
+
+    # Suspicious pattern: mostly single-digit directories like /9/7/9783836555401
+    if len(path_segments) > 2 and all(len(seg) <= 2 and seg.isdigit() for seg in path_segments[:-1]):
+        return _COVER_CACHE_SUSPECT
+
+    # Filename itself is an ISBN
+    last_seg = path_segments[-1]
+    last_seg_lower = last_seg.lower()
+    for ext in IMAGE_EXTENSIONS:
+        if last_seg_lower.endswith(ext):
+            last_seg = last_seg[:-len(ext)]
+            break
+    return _COVER_CACHE_SUSPECT if is_isbn13(last_seg) else _COVER_CACHE_VALID
+
+
+# How long failed cover URL checks are cached (successful ones last the whole run)
+_NEGATIVE_HEAD_TTL = 30.0
+
+
+def _normalize_cover_url(url: str) -> str:
+    """Drop tracking params (utm_*) and fragment so equivalent URLs share a cache entry"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not k.startswith('utm_')]
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+
+# Book node properties the enrichment command is allowed to write
+_UPDATABLE_BOOK_FIELDS = frozenset({
+    'description', 'cover_url', 'isbn13', 'isbn10', 'page_count', 'published_date', 'language',
+})
+
+
+def _iter_rows(result) -> Iterator[list]:
+    """Iterate rows of a Kuzu query result (no-op for empty results)"""
+    if result and hasattr(result, 'has_next'):
+        while result.has_next():
+            yield result.get_next()
+
+
+# Book properties filled from enriched metadata only when the book has no value
+_FILL_IF_MISSING_FIELDS = ('isbn13', 'isbn10', 'page_count', 'published_date')
+
+
+@lru_cache(maxsize=65536)
+def _has_cyrillic(text: Optional[str]) -> bool:
+    """Check whether text contains Cyrillic (Bulgarian) characters"""
+    # Memoized shared check: the same titles and authors are tested several
+    # times per book. is_cyrillic rules out pure ASCII text (most English
+    # titles/authors) with the C-level isascii() check before any regex scan
+    return is_cyrillic(text)
+
+
+@lru_cache(maxsize=4096)
+def _clean_description(description: str) -> str:
+    """Strip citation markers like [3][5] and collapse whitespace"""
+    return _RE_WS.sub(' ', _RE_CITATION.sub('', description)).strip()
+
+
+def _parse_custom_metadata(raw) -> Dict:
+    """Parse a Book.custom_metadata value (JSON string or dict) into a dict"""
+    if not raw:
+        return {}
+    if isinstance(raw, dict):
+        return raw
+    try:
+        custom_metadata = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return custom_metadata if isinstance(custom_metadata, dict) else {}
+
+
+@contextmanager
+def _kuzu_write_transaction(operation: str):
+    """Run several statements on one Kuzu connection inside one explicit transaction"""
+    with safe_kuzu_transaction(user_id="system", operation=operation) as execute:
+        execute("BEGIN TRANSACTION")
+        try:
+            yield execute
+        except Exception:
+            # Kuzu may already have rolled back the failed transaction itself
+            try:
+                execute("ROLLBACK")
+            except Exception:
+                pass
+            raise
+        execute("COMMIT")
+
+
+@contextmanager
+def _deferred_kuzu_checkpoint():
+    """Turn off Kuzu auto-checkpointing for a burst of writes and checkpoint once afterwards"""
+    disabled = False
+    try:
+        safe_execute_kuzu_query("CALL auto_checkpoint=false", user_id="system", operation="enrich_disable_auto_checkpoint")
+        disabled = True
+    except Exception as e:
+        # Writes still work with the default checkpointing
+        logger.debug(f"Could not disable Kuzu auto-checkpoint: {e}")
+    try:
+        yield
+    finally:
+        if disabled:
+            for statement in ("CALL auto_checkpoint=true", "CHECKPOINT"):
+                try:
+                    safe_execute_kuzu_query(statement, user_id="system", operation="enrich_checkpoint")
+                except Exception as e:
+                    logger.warning(f"⚠️  Kuzu '{statement}' failed after enrichment writes: {e}")
+
+
+def _dumps_compact(obj) -> str:
+    """Serialize to compact UTF-8 JSON (orjson when installed, stdlib json otherwise)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+@lru_cache(maxsize=4096)
+def _split_authors(author_text: str) -> Tuple[str, ...]:
+    """Split a multi-author string on ',' or ';' into stripped names"""
+    return tuple(a.strip() for a in _RE_AUTHOR_SEP.split(author_text))
+
+
+def _first_author_in_script(authors: Tuple[str, ...], cyrillic: bool) -> Optional[str]:
+    """Return the first author written (or not written) in Cyrillic, stopping at the first match"""
+    return next((a for a in authors if _has_cyrillic(a) == cyrillic), None)
+
+
+def _join_author_names(author_names: Optional[List[str]]) -> str:
+    """Join author names collected by Cypher, 'Unknown' if there are none"""
+    return ', '.join(name for name in author_names or [] if name) or 'Unknown'
 
 
 class EnrichmentCommand:
@@ -103,7 +369,6 @@ class EnrichmentCommand:
                 if "Could not set lock on file" in str(e):
                     if attempt < max_retries - 1:
                         logger.warning(f"⚠️  Database lock conflict (attempt {attempt + 1}/{max_retries}). Retrying in {retry_delay}s...")
-                        import time
                         time.sleep(retry_delay)
                         retry_delay *= 2  # Exponential backoff
                     else:
@@ -119,6 +384,9 @@ class EnrichmentCommand:
         if self.book_repo is None:
             raise RuntimeError("Failed to initialize KuzuBookRepository after retries")
         
+        # Shared person service for creating authors the AI found (one instance per run)
+        self.person_service = KuzuPersonService()
+        
         self.stats = {
             'start_time': datetime.now(),
             'books_checked': 0,
@@ -129,14 +397,52 @@ class EnrichmentCommand:
         }
         self.enriched_books_list = []  # Track enriched books
         self.skipped_books_list = []   # Track skipped books (already enriched)
+        self.books_to_save: List[Dict] = []  # Books that got AI metadata, collected while enriching
+        self._covers_dir: Optional[Path] = None  # Resolved once per save batch
+        
+        # Shared HTTP client for cover URL checks (keep-alive connections across books)
+        self._http = httpx.AsyncClient(
+            timeout=5.0,
+            follow_redirects=True,
+            headers=_BROWSER_HEADERS,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+        # Connection-pooled session for cover downloads (used from worker threads)
+        self._download_session = requests.Session()
+        self._download_session.headers.update(_BROWSER_HEADERS)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=max(10, args.concurrency))
+        self._download_session.mount('http://', adapter)
+        self._download_session.mount('https://', adapter)
+        # HEAD results per normalized URL: (expires_at, (status, content_type, final_url))
+        self._url_validation_cache: Dict[str, Tuple[float, Tuple[int, str, str]]] = {}
+        self._url_validation_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
     
     async def run(self):
         """Execute enrichment command"""
+        try:
+            return await self._run()
+        finally:
+            await self.close()
+    
+    async def close(self):
+        """Close HTTP client and enrichment service connections"""
+        await self._http.aclose()
+        self._download_session.close()
+        if self.service:
+            await self.service.close()
+    
+    async def _run(self):
+        """Run the enrichment steps"""
         
         logger.info("="*60)
         logger.info("BOOK ENRICHMENT - AI Web Search")
         logger.info("="*60)
         
+        # Open the database (first connection, schema checks) in a worker thread
+        # while the service initializes; submitted to the executor right away
+        # because the service constructor below blocks the event loop
+        kuzu_warm_up = asyncio.get_running_loop().run_in_executor(None, self._warm_up_kuzu)
+        
         # Initialize service (auto-detects provider from settings)
         logger.info("🔧 Initializing EnrichmentService...")
         self.service = EnrichmentService(provider='auto')
@@ -163,18 +469,23 @@ class EnrichmentCommand:
         if hasattr(self.args, 'no_cover_only') and self.args.no_cover_only:
             logger.info(f"   No cover only: True (only books without covers)")
         
-        # Get books to enrich
-        books = await self._get_books_to_enrich()
+        # Count candidate books - the books themselves are streamed into the
+        # enrichment below, so the first API call does not wait for all of them.
+        # The count is an upper bound: some candidates are skipped while iterating
+        await kuzu_warm_up
+        total = await self._count_books_to_enrich()
         
-        if not books:
+        if not total:
             logger.info("✅ No books need enrichment!")
             return 0
         
-        logger.info(f"\n📚 Found {len(books)} books to enrich")
+        logger.info(f"\n📚 Found {total} candidate books (upper bound - some may be skipped)")
         
         if self.args.dry_run:
-            logger.info("\n🔍 DRY RUN - showing first 10 books:")
-            for i, book in enumerate(books[:10], 1):
+            logger.info(f"\n🔍 DRY RUN - would process up to {total} candidate books; here are the first 10:")
+            i = 0
+            async for book in self._iter_books_to_enrich():
+                i += 1
                 logger.info(f"   {i}. {book['title']} - {book.get('author', 'Unknown')}")
                 missing = []
                 if not book.get('description'):
@@ -186,29 +497,33 @@ class EnrichmentCommand:
                 if not book.get('isbn13') and not book.get('isbn10'):
                     missing.append('isbn')
                 logger.info(f"      Missing: {', '.join(missing) or 'none'}")
+                if i == 10:
+                    break
             
             logger.info(f"\n⚠️  DRY RUN MODE - No changes made")
             return 0
         
         # Confirm with user
         if not self.args.yes:
-            response = input(f"\n❓ Enrich {len(books)} books? [y/N]: ")
+            response = input(f"\n❓ Enrich up to {total} candidate books? [y/N]: ")
             if response.lower() != 'y':
                 logger.info("❌ Cancelled by user")
                 return 0
         
         # Run enrichment
         logger.info(f"\n🚀 Starting enrichment...")
-        logger.info(f"   Estimated time: ~{len(books) * 2 / 60:.1f} minutes")
-        logger.info(f"   Estimated cost: ~${len(books) * 0.0008:.2f}")
+        logger.info(f"   Estimated time: up to ~{total * 2 / 60:.1f} minutes")
+        logger.info(f"   Estimated cost: up to ~${total * 0.0008:.2f}")
         
-        # Enrich books
+        # Enrich books - total is the candidate count, used for progress only
         require_cover = hasattr(self.args, 'no_cover_only') and self.args.no_cover_only
         results = await self.service.enrich_batch(
-            books=books,
+            books=self._iter_books_to_enrich(),
+            total=total,
             force=self.args.force,
             require_cover=require_cover,
-            progress_callback=self._progress_callback
+            progress_callback=self._progress_callback,
+            concurrency=self.args.concurrency
         )
         
         # Update statistics
@@ -217,7 +532,7 @@ class EnrichmentCommand:
         
         # Save enriched books (if not dry run)
         if not self.args.dry_run:
-            saved = await self._save_enriched_books(books)
+            saved = await self._save_enriched_books(self.books_to_save)
             logger.info(f"💾 Saved {saved} enriched books to database")
             
             # Update enrichment status file with enriched/skipped books
@@ -249,17 +564,74 @@ class EnrichmentCommand:
         # Show final report
         self._show_report()
         
-        # Cleanup
-        await self.service.close()
-        
         return 0
     
-    async def _get_books_to_enrich(self) -> List[Dict]:
+    def _warm_up_kuzu(self):
+        """Run a trivial query so the database is open before the first real query"""
+        try:
+            safe_execute_kuzu_query("MATCH (b:Book) RETURN b.id LIMIT 1", user_id="system", operation="enrich_warm_up")
+        except Exception as e:
+            # The real queries report their own errors
+            logger.debug(f"Kuzu warm-up query failed: {e}")
+    
+    def _candidate_book_filter(self) -> Tuple[str, Dict]:
+        """
+        WHERE clause (and its parameters) restricting candidate books
+        
+        Unless --no-cover-only is set only Bulgarian books are enriched: Cyrillic
+        title or language 'bg'. Filter in Cypher so other books never leave Kuzu
+        """
+        if hasattr(self.args, 'no_cover_only') and self.args.no_cover_only:
+            return "", {}
+        return (
+            "WHERE b.language = 'bg' OR regexp_matches(b.title, $cyrillic_pattern)",
+            {'cyrillic_pattern': CYRILLIC_CHAR_CLASS},
+        )
+    
+    async def _count_books_to_enrich(self) -> int:
         """
-        Get list of books that need enrichment from KuzuDB
+        Count the candidate books for confirmation and progress reporting
+        
+        This is an upper bound on the books that will be enriched: it only
+        applies the Bulgarian/--no-cover-only candidate filter and --limit.
+        _iter_books_to_enrich additionally skips books enriched in the last
+        24 hours and, with --no-cover-only, books that already have a valid
+        cover; without --force its query also checks for missing metadata.
         
         Returns:
-            List of book dictionaries
+            Number of candidate books (upper bound)
+        """
+        
+        try:
+            if self.args.book_id:
+                return len(await self._get_book_by_id(self.args.book_id))
+            elif self.args.book_title:
+                return len(await self._get_book_by_title(self.args.book_title))
+            
+            book_filter, params = self._candidate_book_filter()
+            result = safe_execute_kuzu_query(
+                f"MATCH (b:Book) {book_filter} RETURN count(b)", params,
+                user_id="system", operation="enrich_count_books"
+            )
+            rows = list(_iter_rows(result))
+            count = int(rows[0][0]) if rows else 0
+            if self.args.limit:
+                count = min(count, self.args.limit)
+            return count
+            
+        except Exception as e:
+            logger.error(f"❌ Error counting books: {e}", exc_info=True)
+            return 0
+    
+    async def _iter_books_to_enrich(self) -> AsyncIterator[Dict]:
+        """
+        Yield books that need enrichment from KuzuDB
+        
+        Books are yielded as result rows are read, so enrichment can start
+        before the whole candidate set has been loaded.
+        
+        Yields:
+            Book dictionaries
         """
         
         logger.info("📖 Querying database for books...")
@@ -267,321 +639,103 @@ class EnrichmentCommand:
         try:
             # Handle specific book requests
             if self.args.book_id:
-                return await self._get_book_by_id(self.args.book_id)
+                for book in await self._get_book_by_id(self.args.book_id):
+                    yield book
+                return
             elif self.args.book_title:
-                return await self._get_book_by_title(self.args.book_title)
+                for book in await self._get_book_by_title(self.args.book_title):
+                    yield book
+                return
+            
+            no_cover_only = hasattr(self.args, 'no_cover_only') and self.args.no_cover_only
+            book_filter, params = self._candidate_book_filter()
             
             # Build query to find books missing metadata
             # Note: publisher is a relationship, not a property, so we check for PUBLISHED_BY relationship
             if self.args.force:
                 # Force: get all books
-                query = """
+                query = f"""
                 MATCH (b:Book)
+                {book_filter}
                 OPTIONAL MATCH (b)-[:PUBLISHED_BY]->(p:Publisher)
+                OPTIONAL MATCH (a:Person)-[:AUTHORED]->(b)
+                WITH b, p, COLLECT(DISTINCT a.name) AS author_names
                 RETURN b.id as id, b.title as title, b.description as description,
                        b.cover_url as cover_url, p.name as publisher,
                        b.isbn13 as isbn13, b.isbn10 as isbn10,
-                       b.page_count as page_count, b.published_date as published_date
+                       b.page_count as page_count, b.published_date as published_date,
+                       author_names
                 ORDER BY b.created_at DESC
                 """
             else:
                 # Get books missing critical metadata
                 # Check for publisher relationship existence
-                # Note: Filter for Bulgarian books happens in Python after query
                 
                 # If --no-cover-only flag is set, only get books without valid cover URLs
-                if hasattr(self.args, 'no_cover_only') and self.args.no_cover_only:
+                if no_cover_only:
                     # Query for ALL books, then filter in Python (KuzuDB WHERE filtering is unreliable)
                     # Python code will filter out books with valid http/https cover URLs
                     query = """
                     MATCH (b:Book)
                     OPTIONAL MATCH (b)-[:PUBLISHED_BY]->(p:Publisher)
+                    OPTIONAL MATCH (a:Person)-[:AUTHORED]->(b)
+                    WITH b, p, COLLECT(DISTINCT a.name) AS author_names
                     RETURN b.id as id, b.title as title, b.description as description,
                            b.cover_url as cover_url, p.name as publisher,
                            b.isbn13 as isbn13, b.isbn10 as isbn10,
                            b.page_count as page_count, b.published_date as published_date,
-                           b.language as language, b.custom_metadata as custom_metadata
+                           author_names, b.language as language, b.custom_metadata as custom_metadata
                     ORDER BY b.created_at DESC
                     """
-                    logger.info("🔍 [_get_books_to_enrich] Querying for ALL books - will filter books WITHOUT valid cover URLs in Python")
+                    logger.info("🔍 [_iter_books_to_enrich] Querying for ALL books - will filter books WITHOUT valid cover URLs in Python")
                 else:
-                    query = """
+                    query = f"""
                     MATCH (b:Book)
+                    {book_filter}
                     OPTIONAL MATCH (b)-[:PUBLISHED_BY]->(p:Publisher)
                     WHERE (b.description IS NULL OR b.description = '')
                        OR (b.cover_url IS NULL OR b.cover_url = '')
                        OR (p IS NULL)
                        OR ((b.isbn13 IS NULL OR b.isbn13 = '') AND (b.isbn10 IS NULL OR b.isbn10 = ''))
+                    OPTIONAL MATCH (a:Person)-[:AUTHORED]->(b)
+                    WITH b, p, COLLECT(DISTINCT a.name) AS author_names
                     RETURN b.id as id, b.title as title, b.description as description,
                            b.cover_url as cover_url, p.name as publisher,
                            b.isbn13 as isbn13, b.isbn10 as isbn10,
                            b.page_count as page_count, b.published_date as published_date,
-                           b.language as language, b.custom_metadata as custom_metadata
+                           author_names, b.language as language, b.custom_metadata as custom_metadata
                     ORDER BY b.created_at DESC
                     """
             
-            if self.args.limit:
-                query += f" LIMIT {self.args.limit}"
+            limit = self.args.limit
+            if self.args.dry_run and not no_cover_only:
+                # Dry run only shows the first 10 books; the total comes from
+                # _count_books_to_enrich. (With --no-cover-only rows are still
+                # filtered in Python, so the query cannot be cut short.)
+                limit = min(limit or 10, 10)
+            if limit:
+                query += f" LIMIT {limit}"
             
             # Execute query
-            logger.info(f"🔍 [_get_books_to_enrich] Executing query...")
-            result = safe_execute_kuzu_query(query, {})
-            
-            books = []
-            books_checked = 0
-            books_with_valid_cover = 0
-            books_without_valid_cover = 0
+            logger.info(f"🔍 [_iter_books_to_enrich] Executing query...")
+            result = safe_execute_kuzu_query(query, params)
             
-            if result and hasattr(result, 'has_next'):
-                logger.info(f"🔍 [_get_books_to_enrich] Query returned results, processing...")
-                while result.has_next():
-                    row = result.get_next()
-                    books_checked += 1
-                    # Check if we have enough columns (9 for old query, 10 for new with language)
-                    if len(row) >= 9:
-                        book_id = row[0]
-                        title = row[1] or ''
-                        
-                        # Get authors for this book
-                        authors = await self.book_repo.get_book_authors(book_id)
-                        author_names = [a.get('name', '') for a in authors if a.get('name')]
-                        author = ', '.join(author_names) if author_names else 'Unknown'
-                        
-                        # Handle both old (9 columns) and new (10+ columns) query formats
-                        language = row[9] if len(row) > 9 else None
-                        custom_metadata_raw = row[10] if len(row) > 10 else None
-                        
-                        # Parse custom_metadata to check enrichment tracking
-                        custom_metadata = {}
-                        if custom_metadata_raw:
-                            try:
-                                custom_metadata = json.loads(custom_metadata_raw) if isinstance(custom_metadata_raw, str) else custom_metadata_raw
-                            except:
-                                custom_metadata = {}
-                        
-                        # Check if book was recently enriched (within 24 hours) - skip if so
-                        last_enriched_at = custom_metadata.get('last_enriched_at')
-                        if last_enriched_at:
-                            try:
-                                enriched_time = datetime.fromisoformat(last_enriched_at.replace('Z', '+00:00'))
-                                if datetime.now(enriched_time.tzinfo) - enriched_time < timedelta(hours=24):
-                                    logger.info(f"⏭️  Skipping {title} - enriched recently ({last_enriched_at})")
-                                    # Track skipped book
-                                    self.skipped_books_list.append({
-                                        'title': title,
-                                        'id': book_id,
-                                        'reason': f'Already enriched at {last_enriched_at}',
-                                        'skipped_at': datetime.now().isoformat()
-                                    })
-                                    continue
-                            except Exception as e:
-                                logger.debug(f"Could not parse enrichment timestamp: {e}")
-                        
-                        book_dict = {
-                            'id': book_id,
-                            'title': title,
-                            'author': author,
-                            'description': row[2],
-                            'cover_url': row[3],
-                            'publisher': row[4],
-                            'isbn13': row[5],
-                            'isbn10': row[6],
-                            'page_count': row[7],
-                            'published_date': row[8],
-                            'language': language,
-                            'custom_metadata': custom_metadata,
-                        }
-                        
-                        # Include books even if they don't have authors (we'll enrich them)
-                        if book_dict['title']:
-                            # If --no-cover-only is set, include all books (not just Bulgarian)
-                            if hasattr(self.args, 'no_cover_only') and self.args.no_cover_only:
-                                cover_url = book_dict.get('cover_url', '')
-                                
-                                # Check if cover URL is valid:
-                                # 1. Local covers (/covers/...) are always valid (served by Flask)
-                                # 2. Must start with http:// or https:// for external URLs
-                                # 3. Must end with image extension (.jpg, .jpeg, .png, .webp, .gif) OR
-                                #    contain image extension in path (for URLs with query params)
-                                # 4. Exclude cache URLs that don't end with proper extension (broken cache URLs)
-                                has_valid_cover = False
-                                
-                                # Local covers (/covers/...) are always valid - they're served by Flask
-                                if cover_url and cover_url.startswith('/covers/'):
-                                    # Verify the file actually exists (without Flask app context)
-                                    try:
-                                        # Try to find covers directory without Flask app context
-                                        filename = cover_url.split('/covers/')[-1].split('?')[0]  # Remove query params if any
-                                        
-                                        # Try multiple possible paths
-                                        possible_dirs = [
-                                            Path('data/covers'),  # Relative path
-                                            Path('/app/data/covers'),  # Docker path
-                                        ]
-                                        
-                                        # Also try to get from environment or config
-                                        import os
-                                        data_dir = os.getenv('DATA_DIR')
-                                        if data_dir:
-                                            possible_dirs.insert(0, Path(data_dir) / 'covers')
-                                        
-                                        # Try to get base directory
-                                        try:
-                                            base_dir = Path(__file__).parent.parent
-                                            possible_dirs.append(base_dir / 'data' / 'covers')
-                                        except:
-                                            pass
-                                        
-                                        cover_path = None
-                                        for covers_dir in possible_dirs:
-                                            test_path = covers_dir / filename
-                                            if test_path.exists() and test_path.is_file():
-                                                cover_path = test_path
-                                                break
-                                        
-                                        if cover_path:
-                                            file_size = cover_path.stat().st_size
-                                            if file_size > 0:  # File exists and is not empty
-                                                has_valid_cover = True
-                                                logger.info(f"🔍 [_get_books_to_enrich] ✅ Local cover exists and is valid: {cover_url} ({file_size} bytes)")
-                                            else:
-                                                logger.info(f"🔍 [_get_books_to_enrich] ⚠️  Local cover file is empty: {cover_path}")
-                                        else:
-                                            logger.info(f"🔍 [_get_books_to_enrich] ⚠️  Local cover file not found: {filename} (checked {len(possible_dirs)} directories)")
-                                    except Exception as e:
-                                        logger.warning(f"🔍 [_get_books_to_enrich] Error verifying local cover '{cover_url}': {e}", exc_info=True)
-                                
-                                # External URLs (http/https)
-                                elif cover_url and (cover_url.startswith('http://') or cover_url.startswith('https://')):
-                                    cover_url_lower = cover_url.lower()
-                                    image_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif']
-                                    
-                                    # Check if URL ends with image extension
-                                    ends_with_extension = any(cover_url_lower.endswith(ext) for ext in image_extensions)
-                                    
-                                    # Check if URL contains image extension before query params
-                                    contains_extension = any(f'{ext}?' in cover_url_lower or f'{ext}&' in cover_url_lower for ext in image_extensions)
-                                    
-                                    # Special case: cache URLs must end with extension to be valid
-                                    # Broken cache URLs like "cache/926507dc7f..." are invalid
-                                    # Also check for suspicious patterns like ISBN numbers in path (9783836555401)
-                                    is_cache_url = '/cache/' in cover_url
-                                    
-                                    logger.info(f"🔍 [_get_books_to_enrich] '{title}': cover_url='{cover_url[:100]}...', is_cache_url={is_cache_url}, ends_with_extension={ends_with_extension}, contains_extension={contains_extension}")
-                                    
-                                    if is_cache_url:
-                                        # Cache URLs must end with extension AND not contain suspicious patterns
-                                        # Suspicious patterns: ISBN numbers (13 digits starting with 978 or 979) in path
-                                        import re
-                                        # Check for ISBN in path (can be between / or at end before extension)
-                                        has_isbn_in_path = bool(re.search(r'/(978|979)\d{10}(/|\.)', cover_url))
-                                        
-                                        # Also check if path looks like ISBN instead of proper image filename
-                                        # Proper cache URLs should have format: cache/HASH/path/to/image.jpg
-                                        # Broken ones might have: cache/HASH/9/7/9783836555401.jpg
-                                        path_after_cache = cover_url.split('/cache/')[-1] if '/cache/' in cover_url else ''
-                                        # Remove extension from last segment for checking
-                                        path_segments = [s for s in path_after_cache.split('/') if s]
-                                        if path_segments:
-                                            # Remove extension from last segment
-                                            last_seg = path_segments[-1]
-                                            for ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']:
-                                                if last_seg.lower().endswith(ext):
-                                                    last_seg = last_seg[:-len(ext)]
-                                                    break
-                                            path_segments[-1] = last_seg
-                                        
-                                        # Check if path segments are mostly single digits (suspicious pattern like /9/7/9783836555401)
-                                        # Valid paths should have meaningful names like /t/h/the_costume_history
-                                        has_numeric_path = len(path_segments) > 2 and all(len(seg) <= 2 and seg.isdigit() for seg in path_segments[:-1])
-                                        
-                                        # Also check if filename itself is an ISBN (13 digits)
-                                        filename_is_isbn = len(path_segments) > 0 and bool(re.match(r'^(978|979)\d{10}$', path_segments[-1]))
-                                        
-                                        has_valid_cover = ends_with_extension and not has_isbn_in_path and not has_numeric_path and not filename_is_isbn
-                                        
-                                        logger.info(f"🔍 [_get_books_to_enrich] Cache URL analysis: has_isbn_in_path={has_isbn_in_path}, has_numeric_path={has_numeric_path}, filename_is_isbn={filename_is_isbn}, path_segments={path_segments[-3:] if len(path_segments) >= 3 else path_segments}")
-                                        
-                                        if not has_valid_cover:
-                                            logger.info(f"🔍 [_get_books_to_enrich] ❌ Cache URL invalid: '{cover_url[:100]}...' - ends_with_extension={ends_with_extension}, has_isbn_in_path={has_isbn_in_path}, has_numeric_path={has_numeric_path}, filename_is_isbn={filename_is_isbn} - marking as INVALID")
-                                        else:
-                                            logger.info(f"🔍 [_get_books_to_enrich] ✅ Cache URL valid: '{cover_url[:100]}...' - marking as VALID")
-                                    else:
-                                        # Non-cache URLs: check if ends with extension or contains it before query params
-                                        has_valid_cover = ends_with_extension or contains_extension
-                                        logger.info(f"🔍 [_get_books_to_enrich] Non-cache URL: has_valid_cover={has_valid_cover}")
-                                        
-                                        # If --no-cover-only is active, also check if URL is accessible
-                                        if has_valid_cover and hasattr(self.args, 'no_cover_only') and self.args.no_cover_only:
-                                            # Quick accessibility check (timeout 3 seconds)
-                                            try:
-                                                import httpx
-                                                # Browser-like headers to avoid 403 Forbidden
-                                                browser_headers = {
-                                                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                                                    'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-                                                    'Accept-Language': 'en-US,en;q=0.9',
-                                                    'Referer': 'https://www.google.com/',
-                                                }
-                                                with httpx.Client(timeout=3.0, follow_redirects=True, headers=browser_headers) as client:
-                                                    response = client.head(cover_url)
-                                                    if response.status_code == 200:
-                                                        content_type = response.headers.get('content-type', '').lower()
-                                                        if 'image' not in content_type:
-                                                            has_valid_cover = False
-                                                            logger.info(f"🔍 [_get_books_to_enrich] Non-cache URL returned non-image content-type: {content_type} - marking as INVALID")
-                                                    elif response.status_code in [301, 302, 303, 307, 308]:
-                                                        # Redirect - try GET to final URL
-                                                        final_url = response.headers.get('location', cover_url)
-                                                        get_response = client.get(final_url, timeout=3.0)
-                                                        if get_response.status_code != 200:
-                                                            has_valid_cover = False
-                                                            logger.info(f"🔍 [_get_books_to_enrich] Non-cache URL redirect failed with status {get_response.status_code} - marking as INVALID")
-                                                        else:
-                                                            content_type = get_response.headers.get('content-type', '').lower()
-                                                            if 'image' not in content_type:
-                                                                has_valid_cover = False
-                                                                logger.info(f"🔍 [_get_books_to_enrich] Non-cache URL redirect returned non-image content-type: {content_type} - marking as INVALID")
-                                                    else:
-                                                        has_valid_cover = False
-                                                        logger.info(f"🔍 [_get_books_to_enrich] Non-cache URL returned status {response.status_code} - marking as INVALID")
-                                            except Exception as e:
-                                                # If accessibility check fails, still consider URL valid if it has image extension
-                                                # (might be temporary network issue)
-                                                logger.debug(f"🔍 [_get_books_to_enrich] Could not verify accessibility of {cover_url[:60]}...: {e} - assuming valid based on extension")
-                                
-                                # Double-check: only add books WITHOUT valid covers
-                                if not has_valid_cover:
-                                    books.append(book_dict)
-                                    books_without_valid_cover += 1
-                                    logger.info(f"✅ Added book without valid cover: {title} (cover_url='{cover_url[:60] if cover_url else 'None'}...')")
-                                else:
-                                    books_with_valid_cover += 1
-                                    if books_checked <= 10:  # Log first 10 for debugging
-                                        logger.info(f"⏭️  Skipping book with valid cover: {title} (cover_url='{cover_url[:60]}...')")
-                                    elif books_checked == 11:
-                                        logger.info(f"⏭️  ... (skipping remaining books with valid covers)")
-                            else:
-                                # Check if it's a Bulgarian book
-                                # Bulgarian books have Cyrillic characters in title OR language='bg'
-                                has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in title)
-                                is_bg_language = book_dict.get('language') == 'bg'
-                                
-                                if has_cyrillic or is_bg_language:
-                                    books.append(book_dict)
-                                    if book_dict['author'] == 'Unknown':
-                                        logger.debug(f"✅ Added Bulgarian book without author: {title}")
-                                    else:
-                                        logger.debug(f"✅ Added Bulgarian book: {title}")
-                                else:
-                                    logger.debug(f"⏭️  Skipping non-Bulgarian book: {title} (language: {language})")
+            logger.info(f"🔍 [_iter_books_to_enrich] Processing query results...")
+            counts = {'checked': 0, 'with_valid_cover': 0, 'without_valid_cover': 0}
+            books_found = 0
+            async for book in self._iter_candidate_books(result, counts):
+                books_found += 1
+                yield book
+            books_checked = counts['checked']
+            books_with_valid_cover = counts['with_valid_cover']
+            books_without_valid_cover = counts['without_valid_cover']
             
             # Log statistics for --no-cover-only mode
             if hasattr(self.args, 'no_cover_only') and self.args.no_cover_only:
                 logger.info(f"📊 Statistics: Checked {books_checked} books total")
                 logger.info(f"📊 Statistics: {books_with_valid_cover} books WITH valid cover URLs (skipped)")
                 logger.info(f"📊 Statistics: {books_without_valid_cover} books WITHOUT valid cover URLs (will enrich)")
-                if len(books) == 0:
+                if books_found == 0:
                     logger.warning("⚠️  No books found without valid cover URLs.")
                     if books_checked > 0:
                         logger.warning(f"⚠️  All {books_checked} checked books have valid http/https cover URLs.")
@@ -589,12 +743,185 @@ class EnrichmentCommand:
                         logger.warning("⚠️  No books found in database (query returned 0 results).")
                     logger.info("💡 Tip: Use --force flag to force enrichment of all books, or add books without covers to the database.")
             
-            logger.info(f"✅ Found {len(books)} books to enrich")
-            return books
+            logger.info(f"✅ Found {books_found} books to enrich")
             
         except Exception as e:
             logger.error(f"❌ Error querying database: {e}", exc_info=True)
-            return []
+    
+    async def _iter_candidate_books(self, result, counts: Dict[str, int]) -> AsyncIterator[Dict]:
+        """
+        Yield books from a candidate query result that need enrichment
+        
+        Rows are consumed from the Kuzu result one at a time, so callers can
+        start working on a book before the whole result has been read.
+        
+        Args:
+            result: Kuzu query result from one of the candidate queries
+            counts: Counters updated while iterating ('checked',
+                'with_valid_cover', 'without_valid_cover')
+            
+        Yields:
+            Book dictionaries that should be enriched
+        """
+        
+        for row in _iter_rows(result):
+            counts['checked'] += 1
+            # Check if we have enough columns (10 for the force query, 12 with language/custom_metadata)
+            if len(row) < 10:
+                continue
+            
+            book_id = row[0]
+            title = row[1] or ''
+            
+            # Authors are collected by the candidate query itself
+            author = _join_author_names(row[9])
+            
+            # Handle both force (10 columns) and regular (12 columns) query formats
+            language = row[10] if len(row) > 10 else None
+            custom_metadata_raw = row[11] if len(row) > 11 else None
+            
+            # Parse custom_metadata to check enrichment tracking
+            custom_metadata = _parse_custom_metadata(custom_metadata_raw)
+            
+            # Check if book was recently enriched (within 24 hours) - skip if so
+            last_enriched_at = custom_metadata.get('last_enriched_at')
+            if last_enriched_at:
+                try:
+                    enriched_time = datetime.fromisoformat(last_enriched_at.replace('Z', '+00:00'))
+                    if datetime.now(enriched_time.tzinfo) - enriched_time < timedelta(hours=24):
+                        logger.info("⏭️  Skipping %s - enriched recently (%s)", title, last_enriched_at)
+                        # Track skipped book
+                        self.skipped_books_list.append({
+                            'title': title,
+                            'id': book_id,
+                            'reason': f'Already enriched at {last_enriched_at}',
+                            'skipped_at': datetime.now().isoformat()
+                        })
+                        continue
+                except Exception as e:
+                    logger.debug("Could not parse enrichment timestamp: %s", e)
+            
+            book_dict = {
+                'id': book_id,
+                'title': title,
+                'author': author,
+                'description': row[2],
+                'cover_url': row[3],
+                'publisher': row[4],
+                'isbn13': row[5],
+                'isbn10': row[6],
+                'page_count': row[7],
+                'published_date': row[8],
+                'language': language,
+                'custom_metadata': custom_metadata,
+            }
+            
+            # Include books even if they don't have authors (we'll enrich them)
+            if book_dict['title']:
+                # If --no-cover-only is set, include all books (not just Bulgarian)
+                if hasattr(self.args, 'no_cover_only') and self.args.no_cover_only:
+                    cover_url = book_dict.get('cover_url', '')
+                    
+                    # Check if cover URL is valid:
+                    # 1. Local covers (/covers/...) are always valid (served by Flask)
+                    # 2. Must start with http:// or https:// for external URLs
+                    # 3. Must end with image extension (.jpg, .jpeg, .png, .webp, .gif) OR
+                    #    contain image extension in path (for URLs with query params)
+                    # 4. Exclude cache URLs that don't end with proper extension (broken cache URLs)
+                    has_valid_cover = False
+                    
+                    # Local covers (/covers/...) are always valid - they're served by Flask
+                    if cover_url and cover_url.startswith('/covers/'):
+                        # Verify the file actually exists (without Flask app context)
+                        try:
+                            # Try to find covers directory without Flask app context
+                            filename = cover_url.split('/covers/')[-1].split('?')[0]  # Remove query params if any
+                            
+                            # Try multiple possible paths
+                            possible_dirs = [
+                                Path('data/covers'),  # Relative path
+                                Path('/app/data/covers'),  # Docker path
+                            ]
+                            
+                            # Also try to get from environment or config
+                            data_dir = os.getenv('DATA_DIR')
+                            if data_dir:
+                                possible_dirs.insert(0, Path(data_dir) / 'covers')
+                            
+                            # Try to get base directory
+                            try:
+                                base_dir = Path(__file__).parent.parent
+                                possible_dirs.append(base_dir / 'data' / 'covers')
+                            except:
+                                pass
+                            
+                            cover_path = None
+                            for covers_dir in possible_dirs:
+                                test_path = covers_dir / filename
+                                if test_path.exists() and test_path.is_file():
+                                    cover_path = test_path
+                                    break
+                            
+                            if cover_path:
+                                file_size = cover_path.stat().st_size
+                                if file_size > 0:  # File exists and is not empty
+                                    has_valid_cover = True
+                                    logger.info("🔍 [_iter_books_to_enrich] ✅ Local cover exists and is valid: %s (%s bytes)", cover_url, file_size)
+                                else:
+                                    logger.info("🔍 [_iter_books_to_enrich] ⚠️  Local cover file is empty: %s", cover_path)
+                            else:
+                                logger.info("🔍 [_iter_books_to_enrich] ⚠️  Local cover file not found: %s (checked %s directories)", filename, len(possible_dirs))
+                        except Exception as e:
+                            # Per-row error: full traceback only at DEBUG level
+                            logger.warning("🔍 [_iter_books_to_enrich] Error verifying local cover '%s': %s", cover_url, e)
+                            logger.debug("Local cover verification traceback", exc_info=True)
+                    
+                    # External URLs (http/https)
+                    elif cover_url and cover_url.startswith(('http://', 'https://')):
+                        # Cache URLs are judged purely on their path; other URLs may
+                        # additionally get an accessibility check below
+                        is_cache_url = '/cache/' in cover_url
+                        has_valid_cover = _classify_cover_url(cover_url) in _VALID_COVER_TAGS
+                        logger.info("🔍 [_iter_books_to_enrich] '%s': cover_url='%s...', is_cache_url=%s, has_valid_cover=%s", title, cover_url[:100], is_cache_url, has_valid_cover)
+                        
+                        if not is_cache_url:
+                            # If --no-cover-only is active, also check if URL is accessible
+                            if has_valid_cover and hasattr(self.args, 'no_cover_only') and self.args.no_cover_only:
+                                # Quick accessibility check (timeout 3 seconds)
+                                try:
+                                    # Redirects are followed by the shared client
+                                    status_code, content_type, _ = await self._head_cover_url(cover_url, timeout=3.0)
+                                    if status_code == 200:
+                                        if 'image' not in content_type:
+                                            has_valid_cover = False
+                                            logger.info("🔍 [_iter_books_to_enrich] Non-cache URL returned non-image content-type: %s - marking as INVALID", content_type)
+                                    else:
+                                        has_valid_cover = False
+                                        logger.info("🔍 [_iter_books_to_enrich] Non-cache URL returned status %s - marking as INVALID", status_code)
+                                except Exception as e:
+                                    # If accessibility check fails, still consider URL valid if it has image extension
+                                    # (might be temporary network issue)
+                                    logger.debug("🔍 [_iter_books_to_enrich] Could not verify accessibility of %s...: %s - assuming valid based on extension", cover_url[:60], e)
+                    
+                    # Double-check: only add books WITHOUT valid covers
+                    if not has_valid_cover:
+                        counts['without_valid_cover'] += 1
+                        yield book_dict
+                        logger.info("✅ Added book without valid cover: %s (cover_url='%s...')", title, cover_url[:60] if cover_url else 'None')
+                    else:
+                        counts['with_valid_cover'] += 1
+                        if counts['checked'] <= 10:  # Log first 10 for debugging
+                            logger.info("⏭️  Skipping book with valid cover: %s (cover_url='%s...')", title, cover_url[:60])
+                        elif counts['checked'] == 11:
+                            logger.info("⏭️  ... (skipping remaining books with valid covers)")
+                else:
+                    # Only Bulgarian books (Cyrillic title or language='bg') are
+                    # returned by the candidate query in this mode
+                    yield book_dict
+                    if book_dict['author'] == 'Unknown':
+                        logger.debug("✅ Added Bulgarian book without author: %s", title)
+                    else:
+                        logger.debug("✅ Added Bulgarian book: %s", title)
     
     async def _get_book_by_id(self, book_id: str) -> List[Dict]:
         """Get a specific book by ID for enrichment"""
@@ -602,11 +929,13 @@ class EnrichmentCommand:
             query = """
             MATCH (b:Book {id: $book_id})
             OPTIONAL MATCH (b)-[:PUBLISHED_BY]->(p:Publisher)
+            OPTIONAL MATCH (a:Person)-[:AUTHORED]->(b)
+            WITH b, p, COLLECT(DISTINCT a.name) AS author_names
             RETURN b.id as id, b.title as title, b.description as description,
                    b.cover_url as cover_url, p.name as publisher,
                    b.isbn13 as isbn13, b.isbn10 as isbn10,
                    b.page_count as page_count, b.published_date as published_date,
-                   b.language as language
+                   b.language as language, author_names
             """
             
             result = safe_execute_kuzu_query(query, {"book_id": book_id})
@@ -615,13 +944,10 @@ class EnrichmentCommand:
             if result and hasattr(result, 'has_next'):
                 while result.has_next():
                     row = result.get_next()
-                    if len(row) >= 10:
+                    if len(row) >= 11:
                         book_id_val = row[0]
                         title = row[1] or ''
-                        
-                        authors = await self.book_repo.get_book_authors(book_id_val)
-                        author_names = [a.get('name', '') for a in authors if a.get('name')]
-                        author = ', '.join(author_names) if author_names else 'Unknown'
+                        author = _join_author_names(row[10])
                         
                         book_dict = {
                             'id': book_id_val,
@@ -641,18 +967,18 @@ class EnrichmentCommand:
                         if book_dict['title']:
                             books.append(book_dict)
                             if book_dict['author'] == 'Unknown':
-                                logger.debug(f"📝 Book without author will be enriched: {title}")
+                                logger.debug("📝 Book without author will be enriched: %s", title)
             
-            logger.info(f"✅ Found {len(books)} book(s) by ID")
+            logger.info("✅ Found %s book(s) by ID", len(books))
             return books
         except Exception as e:
-            logger.error(f"❌ Error getting book by ID: {e}", exc_info=True)
+            logger.error("❌ Error getting book by ID: %s", e, exc_info=True)
             return []
     
     async def _get_book_by_title(self, title_pattern: str) -> List[Dict]:
         """Get books by title pattern (partial match)"""
         try:
-            logger.debug(f"🔍 Searching for book with title pattern: '{title_pattern}'")
+            logger.debug("🔍 Searching for book with title pattern: '%s'", title_pattern)
             
             # Try multiple search patterns for better matching
             # Use case-insensitive search like other parts of the codebase
@@ -663,20 +989,22 @@ class EnrichmentCommand:
                OR b.title = $title_pattern
                OR b.normalized_title = $title_pattern
             OPTIONAL MATCH (b)-[:PUBLISHED_BY]->(p:Publisher)
+            OPTIONAL MATCH (a:Person)-[:AUTHORED]->(b)
+            WITH b, p, COLLECT(DISTINCT a.name) AS author_names
             RETURN b.id as id, b.title as title, b.description as description,
                    b.cover_url as cover_url, p.name as publisher,
                    b.isbn13 as isbn13, b.isbn10 as isbn10,
                    b.page_count as page_count, b.published_date as published_date,
-                   b.language as language
+                   b.language as language, author_names
             LIMIT 10
             """
             
             result = safe_execute_kuzu_query(query, {"title_pattern": title_pattern})
-            logger.debug(f"🔍 Query returned result type: {type(result)}")
+            logger.debug("🔍 Query returned result type: %s", type(result))
             
             # If no results, try a simpler query to see if book exists at all
             if not result or (hasattr(result, 'has_next') and not result.has_next()):
-                logger.debug(f"🔍 No results from main query, trying simpler search...")
+                logger.debug("🔍 No results from main query, trying simpler search...")
                 simple_query = """
                 MATCH (b:Book)
                 RETURN b.id as id, b.title as title
@@ -684,12 +1012,12 @@ class EnrichmentCommand:
                 """
                 simple_result = safe_execute_kuzu_query(simple_query, {})
                 if simple_result and hasattr(simple_result, 'has_next'):
-                    logger.debug(f"🔍 Sample titles in database:")
+                    logger.debug("🔍 Sample titles in database:")
                     count = 0
                     while simple_result.has_next() and count < 5:
                         row = simple_result.get_next()
                         if len(row) >= 2:
-                            logger.debug(f"   - '{row[1]}'")
+                            logger.debug("   - '%s'", row[1])
                             count += 1
             
             books = []
@@ -698,14 +1026,11 @@ class EnrichmentCommand:
                 while result.has_next():
                     row = result.get_next()
                     row_count += 1
-                    logger.debug(f"🔍 Processing row {row_count}: {row}")
-                    if len(row) >= 10:
+                    logger.debug("🔍 Processing row %s: %s", row_count, row)
+                    if len(row) >= 11:
                         book_id = row[0]
                         title = row[1] or ''
-                        
-                        authors = await self.book_repo.get_book_authors(book_id)
-                        author_names = [a.get('name', '') for a in authors if a.get('name')]
-                        author = ', '.join(author_names) if author_names else 'Unknown'
+                        author = _join_author_names(row[10])
                         
                         book_dict = {
                             'id': book_id,
@@ -725,12 +1050,12 @@ class EnrichmentCommand:
                         if book_dict['title']:
                             books.append(book_dict)
                             if book_dict['author'] == 'Unknown':
-                                logger.debug(f"📝 Book without author will be enriched: {title}")
+                                logger.debug("📝 Book without author will be enriched: %s", title)
             
-            logger.info(f"✅ Found {len(books)} book(s) by title pattern: '{title_pattern}'")
+            logger.info("✅ Found %s book(s) by title pattern: '%s'", len(books), title_pattern)
             return books
         except Exception as e:
-            logger.error(f"❌ Error getting book by title: {e}", exc_info=True)
+            logger.error("❌ Error getting book by title: %s", e, exc_info=True)
             return []
     
     async def _save_enriched_books(self, books: List[Dict]) -> int:
@@ -744,37 +1069,148 @@ class EnrichmentCommand:
             Number of books saved
         """
         
-        saved_count = 0
+        logger.info("🔍 [_save_enriched_books] Processing %s books for saving...", len(books))
+        
+        # Per-book work (cover lookup/download, publisher links, author checks) is
+        # network-bound, so process books concurrently with a bounded semaphore
+        sem = asyncio.Semaphore(max(1, self.args.concurrency))
+        # Resolve the covers directory once for the whole batch
+        self._covers_dir = self._resolve_covers_dir()
+        book_ids = [book['id'] for book in books if book.get('id')]
+        # Look up existing publisher links in one query, only for books that could
+        # get one: an AI publisher and no publisher already loaded with the book
+        publisher_check_ids = [
+            book['id'] for book in books
+            if book.get('id') and not book.get('publisher') and (book.get('ai_metadata') or {}).get('publisher')
+        ]
+        books_with_publisher = self._fetch_books_with_publisher(publisher_check_ids)
+        # Current author names for all books, used to decide author updates
+        authors_by_id = self._fetch_current_authors(book_ids)
+        results = await asyncio.gather(
+            *(self._save_one(book, sem, books_with_publisher, authors_by_id) for book in books),
+            return_exceptions=True
+        )
+        
+        pending_updates = []
+        author_updates = []
+        publisher_links = []
+        for book, result in zip(books, results):
+            if isinstance(result, BaseException):
+                logger.error("❌ Error saving %s: %s", book.get('title', 'unknown'), result)
+                continue
+            pending_update, author_update, publisher_link = result
+            if pending_update:
+                pending_updates.append(pending_update)
+            if author_update:
+                author_updates.append(author_update)
+            if publisher_link:
+                publisher_links.append(publisher_link)
+        
+        if not (author_updates or publisher_links or pending_updates):
+            return 0
+        
+        # Kuzu serializes every query through one connection lock, so the
+        # writes are batched per kind and run one after another instead of
+        # being interleaved with the concurrent network work above.
+        # The whole write burst is checkpointed once at the end.
+        saved_ids = set()
+        enriched_at = datetime.now().isoformat()
+        with _deferred_kuzu_checkpoint():
+            if author_updates:
+                await self._write_author_updates(author_updates)
+            
+            if publisher_links:
+                self._write_publisher_links(publisher_links)
+            
+            if pending_updates:
+                # Write property updates and enrichment tracking together in bulk
+                tracking_by_id = self._build_enrichment_tracking(
+                    [entry['id'] for entry in pending_updates], enriched_at
+                )
+                saved_ids = self._write_book_updates(pending_updates, tracking_by_id)
+        
+        for entry in pending_updates:
+            if entry['id'] not in saved_ids:
+                logger.warning("⚠️  Failed to save: %s", entry['title'])
+                continue
+            
+            logger.info("✅ Saved: %s", entry['title'])
+            logger.info("   Updated fields: %s", ', '.join(entry['updates'].keys()))
+            
+            # Track enriched book
+            # has_cover: True if cover was successfully downloaded and saved
+            # cover_found_in_metadata: True if cover URL was found in metadata (even if not downloaded)
+            self.enriched_books_list.append({
+                'title': entry['title'],
+                'id': entry['id'],
+                'updated_fields': list(entry['updates'].keys()),
+                'enriched_at': enriched_at,
+                'has_cover': 'cover_url' in entry['updates'],
+                'cover_found_in_metadata': entry['cover_found_in_metadata']
+            })
+        
+        return len(saved_ids)
+    
+    async def _save_one(self, book: Dict, sem: asyncio.Semaphore,
+                        books_with_publisher: Optional[Set[str]],
+                        authors_by_id: Optional[Dict[str, List[str]]]) -> Tuple[Optional[Dict], Optional[Dict], Optional[Dict]]:
+        """
+        Prepare one enriched book for saving
+        
+        Downloads the cover; property, author and publisher updates are
+        returned so they can be written in batches.
         
-        logger.info(f"🔍 [_save_enriched_books] Processing {len(books)} books for saving...")
+        Args:
+            book: Enriched book dictionary
+            sem: Semaphore bounding concurrent per-book work
+            books_with_publisher: IDs of books that already have a publisher
+                (None if the lookup failed)
+            authors_by_id: Current author names per book ID (None if the
+                lookup failed; authors are then fetched per book)
+            
+        Returns:
+            Tuple of pending update entry ('id', 'title', 'updates',
+            'cover_found_in_metadata'), author update entry ('book_id',
+            'title', 'author_name') and publisher link entry ('book_id',
+            'title', 'publisher_name'); each is None if there is nothing to write
+        """
         
-        for book in books:
+        async with sem:
             book_title = book.get('title', 'Unknown')
-            logger.info(f"🔍 [_save_enriched_books] Processing book: '{book_title}'")
-            logger.info(f"🔍 [_save_enriched_books] Book keys: {list(book.keys())}")
-            logger.info(f"🔍 [_save_enriched_books] Has ai_metadata: {'ai_metadata' in book}")
+            logger.debug("🔍 [_save_enriched_books] Processing book: '%s' (keys: %s)", book_title, book.keys())
             
             if 'ai_metadata' not in book:
-                logger.warning(f"⚠️  [_save_enriched_books] Skipping '{book_title}' - no ai_metadata found")
-                continue
+                logger.warning("⚠️  [_save_enriched_books] Skipping '%s' - no ai_metadata found", book_title)
+                return None, None, None
+            
+            # Hoist values used throughout the body into locals
+            ai_metadata = book['ai_metadata']
             
+            pending_update = None
+            author_update = None
+            publisher_link = None
             try:
+                book_id = book['id']
+                
                 # Merge AI metadata into book
-                logger.info(f"🔍 [_save_enriched_books] Merging metadata for '{book_title}'...")
-                logger.info(f"🔍 [_save_enriched_books] AI metadata keys: {list(book['ai_metadata'].keys())}")
-                logger.info(f"🔍 [_save_enriched_books] AI metadata description present: {'description' in book['ai_metadata']}")
-                if 'description' in book['ai_metadata']:
-                    logger.info(f"🔍 [_save_enriched_books] AI metadata description: {book['ai_metadata']['description'][:100] if book['ai_metadata']['description'] else 'None'}...")
+                # Trace logging is skipped entirely unless DEBUG is enabled
+                debug = logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    logger.debug("🔍 [_save_enriched_books] Merging metadata for '%s', AI metadata keys: %s", book_title, ai_metadata.keys())
+                    logger.debug("🔍 [_save_enriched_books] AI metadata description: %s...", (ai_metadata.get('description') or 'None')[:100])
                 
                 enriched = self.service.merge_metadata_into_book(
                     book_data=book,
-                    ai_metadata=book['ai_metadata']
+                    ai_metadata=ai_metadata
                 )
                 
-                logger.info(f"🔍 [_save_enriched_books] After merge, enriched keys: {list(enriched.keys())}")
-                logger.info(f"🔍 [_save_enriched_books] After merge, enriched description present: {'description' in enriched}")
-                if 'description' in enriched:
-                    logger.info(f"🔍 [_save_enriched_books] After merge, enriched description: {enriched['description'][:100] if enriched['description'] else 'None'}...")
+                if debug:
+                    logger.debug("🔍 [_save_enriched_books] After merge, enriched keys: %s", enriched.keys())
+                    logger.debug("🔍 [_save_enriched_books] After merge, enriched description: %s...", (enriched.get('description') or 'None')[:100])
+                
+                # Title language drives description, language and author choices below
+                title = book.get('title', '') or enriched.get('title', '')
+                title_cyr = _has_cyrillic(title)
                 
                 # Prepare update data
                 updates = {}
@@ -785,29 +1221,14 @@ class EnrichmentCommand:
                 # Update description if missing or improved
                 if enriched.get('description'):
                     description = enriched['description']
-                    logger.info(f"🔍 [_save_enriched_books] Found description for '{book_title}': {description[:100]}...")
-                    # Remove citation markers like [3][5][7][9] before saving
-                    import re
-                    description = re.sub(r'\[\d+\]', '', description)
-                    # Clean up multiple spaces
-                    description = re.sub(r'\s+', ' ', description).strip()
+                    if debug:
+                        logger.debug("🔍 [_save_enriched_books] Found description for '%s': %s...", book_title, description[:100])
+                    # Remove citation markers like [3][5][7][9] and extra spaces before saving
+                    description = _clean_description(description)
                     
-                    existing_desc = book.get('description', '')
-                    logger.info(f"🔍 [_save_enriched_books] Existing description for '{book_title}': {existing_desc[:100] if existing_desc else 'None'}...")
-                    # Check if existing description has citations
-                    has_citations = bool(re.search(r'\[\d+\]', existing_desc))
-                    
-                    # Check if description language matches title language
-                    title = book.get('title', '') or enriched.get('title', '')
-                    has_cyrillic_title = any('\u0400' <= char <= '\u04FF' for char in title)
-                    desc_has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in description)
-                    desc_matches_title = (has_cyrillic_title and desc_has_cyrillic) or (not has_cyrillic_title and not desc_has_cyrillic)
-                    
-                    existing_desc_has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in existing_desc) if existing_desc else False
-                    existing_desc_matches_title = (has_cyrillic_title and existing_desc_has_cyrillic) or (not has_cyrillic_title and not existing_desc_has_cyrillic)
-                    
-                    logger.info(f"🔍 [_save_enriched_books] Language check for '{book_title}': title_has_cyrillic={has_cyrillic_title}, desc_has_cyrillic={desc_has_cyrillic}, desc_matches_title={desc_matches_title}, existing_desc_matches_title={existing_desc_matches_title}, has_citations={has_citations}, force={self.args.force}")
-                    logger.info(f"🔍 [_save_enriched_books] Description lengths: existing={len(existing_desc)}, new={len(description)}, diff={len(description) - len(existing_desc)}")
+                    existing_desc = book.get('description') or ''
+                    if debug:
+                        logger.debug("🔍 [_save_enriched_books] Existing description for '%s': %s...", book_title, existing_desc[:100] or 'None')
                     
                     # Update if:
                     # 1. No existing description, OR
@@ -815,538 +1236,222 @@ class EnrichmentCommand:
                     # 3. Existing has citations (needs cleaning), OR
                     # 4. New description matches title language AND:
                     #    a. Existing doesn't match title language, OR
-                    #    b. New is significantly longer (more than 50 chars), OR
-                    #    c. New is longer (even slightly), OR
-                    #    d. New is at least 90% of existing length (prefer AI-generated descriptions even if slightly shorter)
-                    length_ratio = len(description) / len(existing_desc) if existing_desc else 1.0
-                    should_update = (not existing_desc or 
-                        self.args.force or 
-                        has_citations or 
-                        (desc_matches_title and (
-                            not existing_desc_matches_title or 
-                            len(description) > len(existing_desc) + 50 or
-                            len(description) > len(existing_desc) or
-                            (length_ratio >= 0.9 and existing_desc_matches_title)  # Prefer AI description if at least 90% of existing length
-                        )))
+                    #    b. New is at least 90% of existing length (prefer AI-generated descriptions even if slightly shorter)
+                    # Cheapest checks first: citation and language scans only run when they can change the outcome
+                    has_citations = False
+                    desc_cyr = title_cyr
+                    desc_matches_title = True
+                    if not existing_desc:
+                        should_update = True
+                    elif description == existing_desc and not self.args.force:
+                        # Nothing new (the common case on re-runs) - don't rewrite the same text
+                        should_update = False
+                    else:
+                        # Language match still decides whether a forced/cleaned description is accepted below
+                        desc_cyr = _has_cyrillic(description)
+                        desc_matches_title = title_cyr == desc_cyr
+                        if self.args.force:
+                            should_update = True
+                        else:
+                            has_citations = _RE_CITATION.search(existing_desc) is not None
+                            if has_citations:
+                                should_update = True
+                            elif not desc_matches_title:
+                                should_update = False
+                            else:
+                                existing_desc_matches_title = title_cyr == _has_cyrillic(existing_desc)
+                                should_update = (not existing_desc_matches_title or
+                                                 len(description) / len(existing_desc) >= 0.9)
+                        
+                        logger.debug("🔍 [_save_enriched_books] Language check for '%s': title_has_cyrillic=%s, desc_has_cyrillic=%s, desc_matches_title=%s, has_citations=%s, force=%s",
+                                     book_title, title_cyr, desc_cyr, desc_matches_title, has_citations, self.args.force)
+                        logger.debug("🔍 [_save_enriched_books] Description lengths: existing=%d, new=%d", len(existing_desc), len(description))
                     
-                    logger.info(f"🔍 [_save_enriched_books] Should update description for '{book_title}': {should_update}")
+                    logger.debug("🔍 [_save_enriched_books] Should update description for '%s': %s", book_title, should_update)
                     
                     if should_update:
                         if desc_matches_title or not existing_desc:
                             updates['description'] = description
-                            logger.info(f"✅ [_save_enriched_books] Added description to updates for '{book_title}'")
+                            logger.info("✅ [_save_enriched_books] Added description to updates for '%s'", book_title)
                             if has_citations:
-                                logger.info(f"🧹 Cleaning description citations for: {book['title']}")
+                                logger.info("🧹 Cleaning description citations for: %s", book_title)
                             if not desc_matches_title and existing_desc:
-                                logger.warning(f"⚠️  Description language doesn't match title for '{book['title']}' - but updating anyway (no existing or force)")
+                                logger.warning("⚠️  Description language doesn't match title for '%s' - but updating anyway (no existing or force)", book_title)
                         else:
-                            logger.warning(f"🚫 Rejecting description for '{book['title']}': language doesn't match title (title is {'Bulgarian' if has_cyrillic_title else 'English'}, desc is {'Bulgarian' if desc_has_cyrillic else 'English'})")
+                            logger.warning("🚫 Rejecting description for '%s': language doesn't match title (title is %s, desc is %s)", book_title, 'Bulgarian' if title_cyr else 'English', 'Bulgarian' if desc_cyr else 'English')
                 else:
-                    logger.info(f"🔍 [_save_enriched_books] No description in enriched data for '{book_title}'")
+                    logger.debug("🔍 [_save_enriched_books] No description in enriched data for '%s'", book_title)
                 
                 # Update cover_url if missing or force update
                 # Only update if new cover_url is a valid URL (http/https), not a local path
                 cover_url_value = enriched.get('cover_url')
-                logger.info(f"🔍 [_save_enriched_books] Checking cover_url for '{book_title}': cover_url='{cover_url_value}', type={type(cover_url_value)}, bool={bool(cover_url_value)}")
+                logger.debug("🔍 [_save_enriched_books] Checking cover_url for '%s': %r", book_title, cover_url_value)
                 # Check if cover_url is not empty (not None, not empty string)
                 if cover_url_value and isinstance(cover_url_value, str) and cover_url_value.strip():
                     cover_found_in_metadata = True
                     new_cover_url = cover_url_value
                     # Check if it's a valid URL (not a local path like /covers/...)
-                    is_valid_url = new_cover_url.startswith('http://') or new_cover_url.startswith('https://')
+                    is_valid_url = new_cover_url.startswith(('http://', 'https://'))
                     current_cover_url = book.get('cover_url', '')
-                    current_is_local = current_cover_url.startswith('/covers/') if current_cover_url else True
                     
-                    # Check if current cover URL is valid (using same logic as _has_sufficient_data)
-                    current_is_valid = False
-                    if current_cover_url:
-                        if current_cover_url.startswith('http://') or current_cover_url.startswith('https://'):
-                            # Check if it ends with image extension or contains one before query params
-                            image_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif']
-                            ends_with_extension = any(current_cover_url.lower().endswith(ext) for ext in image_extensions)
-                            contains_extension = any(f'.{ext}' in current_cover_url.lower().split('?')[0] for ext in ['jpg', 'jpeg', 'png', 'webp', 'gif'])
-                            
-                            if '/cache/' in current_cover_url:
-                                # Cache URLs must end with extension AND not contain suspicious patterns
-                                import re
-                                # Check for ISBN in path (can be between / or at end before extension)
-                                has_isbn_in_path = bool(re.search(r'/(978|979)\d{10}(/|\.)', current_cover_url))
-                                
-                                # Also check if filename itself is an ISBN (13 digits)
-                                path_after_cache = current_cover_url.split('/cache/')[-1] if '/cache/' in current_cover_url else ''
-                                path_segments = [s for s in path_after_cache.split('/') if s]
-                                if path_segments:
-                                    # Remove extension from last segment
-                                    last_seg = path_segments[-1]
-                                    for ext in image_extensions:
-                                        if last_seg.lower().endswith(ext):
-                                            last_seg = last_seg[:-len(ext)]
-                                            break
-                                    filename_is_isbn = bool(re.match(r'^(978|979)\d{10}$', last_seg))
-                                else:
-                                    filename_is_isbn = False
-                                
-                                # Check if path segments are mostly single digits (suspicious pattern like /9/7/9783836555401)
-                                has_numeric_path = len(path_segments) > 2 and all(len(seg) <= 2 and seg.isdigit() for seg in path_segments[:-1])
-                                
-                                current_is_valid = ends_with_extension and not has_isbn_in_path and not has_numeric_path and not filename_is_isbn
-                            else:
-                                # Non-cache URLs: check if ends with extension or contains it before query params
-                                current_is_valid = ends_with_extension or contains_extension
+                    # Check if current cover URL is valid (same rules as _has_sufficient_data)
+                    current_is_valid = _classify_cover_url(current_cover_url or '') in _VALID_COVER_TAGS
                     
                     # Download and cache cover image locally instead of saving external URL
                     if is_valid_url:
                         # First, validate that the URL is accessible before trying to download
                         url_is_accessible = False
                         try:
-                            import httpx
-                            # Browser-like headers to avoid 403 Forbidden
-                            browser_headers = {
-                                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                                'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-                                'Accept-Language': 'en-US,en;q=0.9',
-                                'Referer': 'https://www.google.com/',
-                            }
-                            logger.info(f"🔍 Validating cover URL accessibility for '{book['title']}': {new_cover_url[:80]}...")
-                            with httpx.Client(timeout=5.0, follow_redirects=True, headers=browser_headers) as client:
-                                response = client.head(new_cover_url)
-                                if response.status_code == 200:
-                                    content_type = response.headers.get('content-type', '').lower()
-                                    if 'image' in content_type:
-                                        url_is_accessible = True
-                                        logger.info(f"✅ Cover URL is accessible: {new_cover_url[:80]}... (content-type: {content_type})")
-                                    else:
-                                        logger.warning(f"⚠️  Cover URL returned non-image content-type: {content_type}")
-                                elif response.status_code in [301, 302, 303, 307, 308]:
-                                    # Redirect - try GET to final URL
-                                    final_url = response.headers.get('location', new_cover_url)
-                                    get_response = client.get(final_url, timeout=5.0)
-                                    if get_response.status_code == 200:
-                                        content_type = get_response.headers.get('content-type', '').lower()
-                                        if 'image' in content_type:
-                                            url_is_accessible = True
-                                            new_cover_url = final_url  # Use final URL after redirect
-                                            logger.info(f"✅ Cover URL is accessible after redirect: {final_url[:80]}...")
-                                    else:
-                                        logger.warning(f"⚠️  Cover URL redirect failed with status {get_response.status_code}")
+                            logger.info("🔍 Validating cover URL accessibility for '%s': %s...", book_title, new_cover_url[:80])
+                            status_code, content_type, final_url = await self._head_cover_url(new_cover_url)
+                            if status_code == 200:
+                                if 'image' in content_type:
+                                    url_is_accessible = True
+                                    new_cover_url = final_url  # Use final URL after redirects
+                                    logger.info("✅ Cover URL is accessible: %s... (content-type: %s)", new_cover_url[:80], content_type)
                                 else:
-                                    logger.warning(f"⚠️  Cover URL returned status {response.status_code}: {new_cover_url[:80]}...")
+                                    logger.warning("⚠️  Cover URL returned non-image content-type: %s", content_type)
+                            else:
+                                logger.warning("⚠️  Cover URL returned status %s: %s...", status_code, new_cover_url[:80])
                         except Exception as e:
-                            logger.warning(f"⚠️  Could not validate cover URL accessibility: {e}")
+                            logger.warning("⚠️  Could not validate cover URL accessibility: %s", e)
                             # If validation fails, assume URL might be accessible (might be temporary network issue)
                             # But we'll still try to download it
                             url_is_accessible = True  # Try anyway
                         
-                        logger.info(f"🔍 [_save_enriched_books] Cover URL validation result for '{book['title']}': url_is_accessible={url_is_accessible}, new_cover_url='{new_cover_url[:80] if new_cover_url else 'None'}...'")
+                        if debug:
+                            logger.debug("🔍 [_save_enriched_books] Cover URL validation result for '%s': url_is_accessible=%s, new_cover_url='%s...'", book_title, url_is_accessible, new_cover_url[:80])
                         
                         # Try to download cover - don't rely on HEAD validation alone
                         # Many servers block HEAD but allow GET
-                        logger.info(f"🔍 [_save_enriched_books] Starting cover download for '{book['title']}': {new_cover_url[:80]}...")
-                        
-                        # Use the existing cover search system (same as UI)
-                        import requests
-                        import uuid
-                        import re
-                        from pathlib import Path
-                        
-                        # Get ISBN and author for cover search
-                        isbn = enriched.get('isbn13') or enriched.get('isbn10') or book.get('isbn13') or book.get('isbn10')
-                        title = book.get('title', '')
-                        author = book.get('author', '') or (enriched.get('author', '') if enriched else '')
-                        
-                        # Clean ISBN
-                        clean_isbn = ''
-                        if isbn:
-                            clean_isbn = ''.join(c for c in str(isbn) if c.isdigit() or c.upper() == 'X')
-                        
-                        # Use the same cover search system as the UI
-                        cover_urls_to_try = []
-                        
-                        # First, try Perplexity-provided URL
-                        if new_cover_url:
-                            cover_urls_to_try.append(new_cover_url)
-                            logger.info(f"🔍 Added Perplexity cover URL: {new_cover_url[:80]}...")
-                        
-                        # Then use get_cover_candidates (same as UI search by ISBN/title)
-                        try:
-                            from app.utils.book_utils import get_cover_candidates
-                            
-                            logger.info(f"🔍 Searching for cover candidates using ISBN/title search (same as UI)...")
-                            candidates = get_cover_candidates(
-                                isbn=clean_isbn if clean_isbn else None,
-                                title=title if title else None,
-                                author=author if author else None
-                            )
-                            
-                            if candidates:
-                                logger.info(f"✅ Found {len(candidates)} cover candidates from Google Books/OpenLibrary")
-                                # Add candidates in order (Google Books first, then OpenLibrary)
-                                for cand in candidates:
-                                    cand_url = cand.get('url')
-                                    if cand_url and cand_url not in cover_urls_to_try:
-                                        cover_urls_to_try.append(cand_url)
-                                        logger.info(f"📚 Added candidate: {cand.get('provider', 'unknown')} - {cand_url[:60]}...")
-                            else:
-                                logger.info(f"⚠️  No cover candidates found from Google Books/OpenLibrary")
-                        except Exception as e:
-                            logger.warning(f"⚠️  Error getting cover candidates: {e}")
-                        
-                        # For Bulgarian books, add Bulgarian bookstore fallbacks as last resort
-                        is_bulgarian = bool(re.search(r'[\u0400-\u04FF]', title))
-                        if is_bulgarian and clean_isbn:
-                            logger.info(f"🇧🇬 Bulgarian book detected, adding Bulgarian bookstore fallbacks for ISBN: {clean_isbn}")
-                            
-                            bg_sources = [
-                                f"https://www.ciela.com/media/catalog/product/{clean_isbn[0]}/{clean_isbn[1]}/{clean_isbn}.jpg",
-                                f"https://www.ozone.bg/media/catalog/product/{clean_isbn[0]}/{clean_isbn[1]}/{clean_isbn}.jpg",
-                                f"https://www.helikon.bg/uploads/thumbnail/helikon/product/{clean_isbn[-3:-1]}/{clean_isbn[-1]}/{clean_isbn}.jpg",
-                                f"https://hermesbooks.bg/media/catalog/product/{clean_isbn[0]}/{clean_isbn[1]}/{clean_isbn}.jpg",
-                                f"https://www.book.store.bg/prdimg/{clean_isbn[-6:]}/{clean_isbn}.jpg",
-                                f"https://knigabg.com/pix/{clean_isbn}.jpg",
-                                f"https://chitanka.info/thumb/book-cover/{clean_isbn}.250.jpg",
-                            ]
-                            
-                            for bg_url in bg_sources:
-                                if bg_url not in cover_urls_to_try:
-                                    cover_urls_to_try.append(bg_url)
-                                    logger.info(f"🇧🇬 Added Bulgarian fallback: {bg_url}")
-                        
-                        # Get the covers directory (once, outside loop)
-                        # Get covers directory without Flask app context
-                        # Try multiple possible paths (same logic as get_covers_dir but without Flask)
-                        possible_dirs = [
-                            Path('data/covers'),  # Relative path
-                            Path('/app/data/covers'),  # Docker path
-                        ]
-                        
-                        # Also try to get from environment or config
-                        import os
-                        data_dir = os.getenv('DATA_DIR')
-                        if data_dir:
-                            possible_dirs.insert(0, Path(data_dir) / 'covers')
-                        
-                        # Try to get base directory
-                        try:
-                            base_dir = Path(__file__).parent.parent
-                            possible_dirs.append(base_dir / 'data' / 'covers')
-                        except:
-                            pass
-                        
-                        # Find first existing directory or use the first one
-                        covers_dir = None
-                        for path in possible_dirs:
-                            if path.exists():
-                                covers_dir = path
-                                break
-                        
-                        if not covers_dir:
-                            # Use the first path and create it
-                            covers_dir = possible_dirs[0]
-                            covers_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        logger.info(f"📁 Using covers directory: {covers_dir.absolute()}")
+                        if debug:
+                            logger.debug("🔍 [_save_enriched_books] Starting cover download for '%s': %s...", book_title, new_cover_url[:80])
                         
-                        # Browser-like headers to avoid 403 Forbidden
-                        headers = {
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                            'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-                            'Accept-Language': 'en-US,en;q=0.9',
-                            'Referer': 'https://www.google.com/',
-                        }
-                        
-                        local_cover_path = None
-                        for try_url in cover_urls_to_try:
-                            if local_cover_path:
-                                break  # Already found a working cover
-                                
-                            logger.info(f"🔍 Trying cover URL: {try_url[:80]}...")
-                            try:
-                                # Download the image with browser headers
-                                # Increased timeout to 60 seconds for slow servers and large images
-                                # Use connect timeout of 10s and read timeout of 60s
-                                response = requests.get(try_url, timeout=(10, 60), stream=True, headers=headers)
-                                response.raise_for_status()
-                                
-                                # Check content type
-                                content_type = response.headers.get('content-type', '').lower()
-                                if 'image' not in content_type:
-                                    logger.warning(f"⚠️  URL returned non-image content-type: {content_type}")
-                                    continue  # Try next URL
-                                
-                                # Determine file extension from content type
-                                if 'jpeg' in content_type or 'jpg' in content_type:
-                                    ext = '.jpg'
-                                elif 'png' in content_type:
-                                    ext = '.png'
-                                elif 'webp' in content_type:
-                                    ext = '.webp'
-                                elif 'gif' in content_type:
-                                    ext = '.gif'
-                                else:
-                                    ext = '.jpg'  # Default
-                                
-                                # Generate unique filename
-                                filename = f"{uuid.uuid4()}{ext}"
-                                local_path = covers_dir / filename
-                                
-                                # Download and save the image, checking actual size
-                                downloaded_size = 0
-                                with open(local_path, 'wb') as f:
-                                    for chunk in response.iter_content(chunk_size=8192):
-                                        if chunk:
-                                            f.write(chunk)
-                                            downloaded_size += len(chunk)
-                                
-                                # Check if image has meaningful content (at least 2KB)
-                                # Open Library and some sources return tiny placeholder images
-                                if downloaded_size < 2048:  # Less than 2KB is probably a placeholder
-                                    logger.warning(f"⚠️  Image too small ({downloaded_size} bytes), likely placeholder - trying next URL")
-                                    try:
-                                        local_path.unlink()  # Delete the placeholder
-                                    except:
-                                        pass
-                                    continue
-                                
-                                local_cover_path = f"/covers/{filename}"
-                                logger.info(f"✅ Cover downloaded and saved: {local_cover_path} ({downloaded_size} bytes from {try_url[:60]}...)")
-                                
-                            except requests.exceptions.HTTPError as e:
-                                status = e.response.status_code if e.response else 'unknown'
-                                logger.warning(f"⚠️  HTTP error {status} for URL: {try_url[:60]}... - trying next")
-                                continue  # Try next URL
-                            except Exception as e:
-                                logger.warning(f"⚠️  Error downloading from {try_url[:60]}...: {e} - trying next")
-                                continue  # Try next URL
+                        local_cover_path = await asyncio.to_thread(self._download_cover, book, enriched, new_cover_url)
                         
                         # After trying all URLs, update if we got a valid cover
                         if local_cover_path and local_cover_path.startswith('/covers/'):
-                            logger.info(f"✅ Cover downloaded and cached locally: {local_cover_path}")
-                            logger.info(f"🔍 Cover update check for '{book['title']}': current_cover_url={current_cover_url[:60] if current_cover_url else 'None'}..., current_is_valid={current_is_valid}, force={self.args.force}")
+                            logger.info("✅ Cover downloaded and cached locally: %s", local_cover_path)
+                            logger.debug("🔍 Cover update check for '%s': current_cover_url=%r, current_is_valid=%s, force=%s", book_title, current_cover_url, current_is_valid, self.args.force)
                             
                             # Always update if we successfully downloaded a new cover
                             # The book was selected for enrichment because it doesn't have a valid cover
                             updates['cover_url'] = local_cover_path
-                            logger.info(f"🖼️  Updating cover URL for: {book['title']} -> {local_cover_path}")
+                            logger.info("🖼️  Updating cover URL for: %s -> %s", book_title, local_cover_path)
                             # Track successful cover download
                             self.stats['covers_found'] += 1
                         else:
-                            logger.warning(f"⚠️  Could not download cover for '{book['title']}' from any source")
+                            logger.warning("⚠️  Could not download cover for '%s' from any source", book_title)
                     else:
-                        logger.warning(f"⚠️  Skipping invalid cover URL for '{book['title']}': {new_cover_url} (not http/https)")
+                        logger.warning("⚠️  Skipping invalid cover URL for '%s': %s (not http/https)", book_title, new_cover_url)
                 
                 # Publisher is handled separately as a relationship
                 publisher_name = enriched.get('publisher')
-                has_publisher = False
-                if publisher_name:
-                    # Check if book already has a publisher
-                    check_pub_query = """
-                    MATCH (b:Book {id: $book_id})-[:PUBLISHED_BY]->(p:Publisher)
-                    RETURN p.name as name
-                    LIMIT 1
-                    """
-                    pub_result = safe_execute_kuzu_query(check_pub_query, {"book_id": book['id']})
-                    if pub_result and hasattr(pub_result, 'has_next') and pub_result.has_next():
-                        has_publisher = True
+                # A publisher loaded with the book (its current PUBLISHED_BY name) already
+                # counts; if the publisher lookup failed, don't risk adding a duplicate link
+                has_publisher = (bool(book.get('publisher')) or books_with_publisher is None
+                                 or book_id in books_with_publisher)
                 
-                # Update ISBN if missing
-                if enriched.get('isbn13') and not book.get('isbn13'):
-                    updates['isbn13'] = enriched['isbn13']
-                if enriched.get('isbn10') and not book.get('isbn10'):
-                    updates['isbn10'] = enriched['isbn10']
+                # Update ISBN, page_count and published_date if missing
+                for field in _FILL_IF_MISSING_FIELDS:
+                    value = enriched.get(field)
+                    if value and not book.get(field):
+                        updates[field] = value
                 
-                # Update page_count if missing
-                if enriched.get('page_count') and not book.get('page_count'):
-                    updates['page_count'] = enriched['page_count']
-                
-                # Update published_date if missing
-                if enriched.get('published_date') and not book.get('published_date'):
-                    updates['published_date'] = enriched['published_date']
+                # Get author directly from AI metadata (before merge) - this is already
+                # normalized; fall back to the enriched author
+                ai_author = ai_metadata.get('author') or enriched.get('author')
                 
                 # Update language to Bulgarian if book has Bulgarian title and author
-                title = book.get('title', '') or enriched.get('title', '')
-                ai_author = book.get('ai_metadata', {}).get('author') or enriched.get('author', '')
-                
-                # Check if title and author contain Cyrillic (Bulgarian)
-                has_cyrillic_title = any('\u0400' <= char <= '\u04FF' for char in title)
-                has_cyrillic_author = any('\u0400' <= char <= '\u04FF' for char in ai_author)
-                
-                if has_cyrillic_title and has_cyrillic_author:
+                if title_cyr and _has_cyrillic(ai_author):
                     # Book is Bulgarian - set language to 'bg'
                     current_language = book.get('language', '')
                     if current_language != 'bg':
                         updates['language'] = 'bg'
-                        logger.info(f"🌍 Setting language to 'bg' for Bulgarian book: {title}")
+                        logger.info("🌍 Setting language to 'bg' for Bulgarian book: %s", title)
                 
-                # Save to database using book service
-                logger.info(f"🔍 [_save_enriched_books] Updates dictionary for '{book['title']}': {list(updates.keys())} (count: {len(updates)})")
+                # Queue property updates - written for all books in one batch after the loop
                 if updates:
-                    try:
-                        # Log what we're about to update
-                        logger.info(f"📝 Updating book '{book['title']}' with fields: {list(updates.keys())}")
-                        if 'cover_url' in updates:
-                            logger.info(f"🖼️  Will update cover_url to: {updates['cover_url']}")
-                        
-                        # Use book_service directly (not facade) for simpler updates
-                        from app.services.kuzu_book_service import KuzuBookService
-                        book_update_service = KuzuBookService(user_id='system')
-                        
-                        logger.info(f"🔍 [_save_enriched_books] Calling update_book for '{book['title']}' (ID: {book['id']}) with {len(updates)} fields: {list(updates.keys())}")
-                        
-                        # Update book using the service's update_book method
-                        updated_book = await book_update_service.update_book(book['id'], updates)
-                        
-                        logger.info(f"🔍 [_save_enriched_books] update_book returned: {type(updated_book).__name__ if updated_book else 'None'}")
-                        
-                        if updated_book:
-                            saved_count += 1
-                            logger.info(f"✅ Saved: {book['title']}")
-                            logger.info(f"   Updated fields: {', '.join(updates.keys())}")
-                            if 'cover_url' in updates:
-                                logger.info(f"   Cover URL updated to: {updates['cover_url']}")
-                            
-                            # Track enriched book
-                            # has_cover: True if cover was successfully downloaded and saved
-                            # cover_found_in_metadata: True if cover URL was found in metadata (even if not downloaded)
-                            self.enriched_books_list.append({
-                                'title': book['title'],
-                                'id': book['id'],
-                                'updated_fields': list(updates.keys()),
-                                'enriched_at': datetime.now().isoformat(),
-                                'has_cover': 'cover_url' in updates,
-                                'cover_found_in_metadata': cover_found_in_metadata
-                            })
-                            
-                            # Track that this book was enriched
-                            # Store enrichment timestamp in custom_metadata JSON field
-                            try:
-                                # Get current custom_metadata
-                                get_metadata_query = """
-                                MATCH (b:Book {id: $book_id})
-                                RETURN b.custom_metadata as custom_metadata
-                                """
-                                result = safe_execute_kuzu_query(get_metadata_query, {"book_id": book['id']})
-                                
-                                custom_metadata = {}
-                                if result and result.has_next():
-                                    row = result.get_next()
-                                    import json
-                                    if row[0]:
-                                        try:
-                                            custom_metadata = json.loads(row[0]) if isinstance(row[0], str) else row[0]
-                                        except:
-                                            custom_metadata = {}
-                                
-                                # Add enrichment tracking
-                                custom_metadata['last_enriched_at'] = datetime.now().isoformat()
-                                custom_metadata['enriched_by'] = 'ai_perplexity'
-                                
-                                # Update custom_metadata
-                                update_tracking_query = """
-                                MATCH (b:Book {id: $book_id})
-                                SET b.custom_metadata = $custom_metadata
-                                RETURN b.id
-                                """
-                                safe_execute_kuzu_query(
-                                    update_tracking_query,
-                                    {
-                                        "book_id": book['id'],
-                                        "custom_metadata": json.dumps(custom_metadata)
-                                    }
-                                )
-                            except Exception as e:
-                                # If tracking fails, log but don't fail the enrichment
-                                logger.debug(f"Could not track enrichment for {book['title']}: {e}")
-                        else:
-                            logger.warning(f"⚠️  Failed to save: {book['title']}")
-                    except Exception as e:
-                        logger.error(f"❌ Error updating book {book['id']}: {e}", exc_info=True)
+                    logger.info("📝 Queueing update for '%s' with fields: %s", book_title, list(updates.keys()))
+                    if 'cover_url' in updates:
+                        logger.info("🖼️  Will update cover_url to: %s", updates['cover_url'])
+                    pending_update = {
+                        'id': book_id,
+                        'title': book_title,
+                        'updates': updates,
+                        'cover_found_in_metadata': cover_found_in_metadata,
+                    }
                 else:
-                    logger.warning(f"⚠️  [_save_enriched_books] No updates to save for '{book['title']}' - updates dictionary is empty")
+                    logger.debug("⏭️  [_save_enriched_books] No property updates for '%s' - nothing new", book_title)
                 
                 # Handle publisher separately (it's a relationship, not a property)
+                # Linked for all books in one pass after the loop
                 if publisher_name and not has_publisher:
-                    try:
-                        # Use repository method to create publisher relationship
-                        await self.book_repo._create_publisher_relationship(book['id'], publisher_name)
-                        logger.debug(f"✅ Added publisher: {publisher_name} for {book['title']}")
-                    except Exception as e:
-                        logger.warning(f"⚠️  Failed to add publisher for {book['title']}: {e}")
+                    publisher_link = {
+                        'book_id': book_id,
+                        'title': book_title,
+                        'publisher_name': publisher_name,
+                    }
                 
                 # Handle author update if AI found a normalized author
-                # Get author directly from AI metadata (before merge) - this is already normalized
-                ai_metadata = book.get('ai_metadata', {})
-                ai_author = ai_metadata.get('author')
-                
-                # Debug: log what we found
-                logger.debug(f"🔍 AI metadata author: {ai_author}")
-                logger.debug(f"🔍 Enriched author: {enriched.get('author')}")
-                
-                if not ai_author:
-                    # Fallback to enriched author
-                    ai_author = enriched.get('author')
+                logger.debug("🔍 AI metadata author: %s (enriched author: %s)", ai_metadata.get('author'), enriched.get('author'))
                 
                 # Normalize author based on book title language
                 # Rule: If title is Bulgarian → use Bulgarian author, else use English author
-                title = book.get('title', '') or enriched.get('title', '')
-                has_cyrillic_title = any('\u0400' <= char <= '\u04FF' for char in title)
-                
                 if ai_author:
-                    import re
                     # If multiple authors, choose based on title language
                     if ',' in ai_author or ';' in ai_author:
-                        authors_list = [a.strip() for a in re.split(r'[,;]', ai_author)]
-                        if has_cyrillic_title:
-                            # Bulgarian title → prefer Bulgarian author
-                            cyrillic_authors = [a for a in authors_list if any('\u0400' <= char <= '\u04FF' for char in a)]
-                            if cyrillic_authors:
-                                ai_author = cyrillic_authors[0]
-                                logger.debug(f"✅ Using Bulgarian author for Bulgarian book: {ai_author}")
-                            else:
-                                # No Bulgarian author found, use first one
-                                ai_author = authors_list[0]
+                        authors_list = _split_authors(ai_author)
+                        # Bulgarian title → prefer Bulgarian author, English title → prefer non-Cyrillic
+                        preferred_author = _first_author_in_script(authors_list, title_cyr)
+                        if preferred_author:
+                            ai_author = preferred_author
+                            title_language = 'Bulgarian' if title_cyr else 'English'
+                            logger.debug("✅ Using %s author for %s book: %s", title_language, title_language, ai_author)
                         else:
-                            # English title → use English author (first one, prefer non-Cyrillic)
-                            english_authors = [a for a in authors_list if not any('\u0400' <= char <= '\u04FF' for char in a)]
-                            if english_authors:
-                                ai_author = english_authors[0]
-                                logger.debug(f"✅ Using English author for English book: {ai_author}")
-                            else:
-                                ai_author = authors_list[0]
+                            # No author in the title's language, use first one
+                            ai_author = authors_list[0]
                     else:
                         # Single author - check if it matches title language
-                        has_cyrillic_author = any('\u0400' <= char <= '\u04FF' for char in ai_author)
-                        if has_cyrillic_title and not has_cyrillic_author:
+                        has_cyrillic_author = _has_cyrillic(ai_author)
+                        if title_cyr and not has_cyrillic_author:
                             # Bulgarian title but English author - try to find Bulgarian version
-                            logger.debug(f"⚠️  Bulgarian book '{title}' has English author '{ai_author}' - keeping for now")
-                        elif not has_cyrillic_title and has_cyrillic_author:
+                            logger.debug("⚠️  Bulgarian book '%s' has English author '%s' - keeping for now", title, ai_author)
+                        elif not title_cyr and has_cyrillic_author:
                             # English title but Bulgarian author - skip update, keep original English author
-                            logger.info(f"⚠️  Skipping Bulgarian author '{ai_author}' for English book '{title}' - keeping original author")
+                            logger.info("⚠️  Skipping Bulgarian author '%s' for English book '%s' - keeping original author", ai_author, title)
                             ai_author = None
                 
                 # Final check: Don't update author if title is English but AI returned Bulgarian
-                if ai_author and not has_cyrillic_title:
-                    has_cyrillic_author_final = any('\u0400' <= char <= '\u04FF' for char in ai_author)
+                if ai_author and not title_cyr:
+                    has_cyrillic_author_final = _has_cyrillic(ai_author)
                     if has_cyrillic_author_final:
-                        logger.warning(f"🚫 Rejecting Bulgarian author '{ai_author}' for English book '{title}'")
+                        logger.warning("🚫 Rejecting Bulgarian author '%s' for English book '%s'", ai_author, title)
                         ai_author = None
                 
+                # Fast path: the AI author is already the book's only author (the
+                # common case on re-runs), so skip the normalization and comparison
+                if (ai_author and not self.args.force and authors_by_id is not None
+                        and authors_by_id.get(book_id) == [ai_author]):
+                    logger.debug("⏭️  Author already up to date for '%s'", book_title)
+                    ai_author = None
+                
                 if ai_author:
                     try:
                         # Get current authors
-                        current_authors = await self.book_repo.get_book_authors(book['id'])
-                        current_author_names = [a.get('name', '') for a in current_authors if a.get('name')]
+                        if authors_by_id is not None:
+                            current_author_names = authors_by_id.get(book_id, [])
+                        else:
+                            current_authors = await self.book_repo.get_book_authors(book_id)
+                            current_author_names = [a.get('name', '') for a in current_authors if a.get('name')]
                         
                         # Normalize current author names for comparison
                         current_normalized = []
                         for name in current_author_names:
                             # If name has multiple parts, try to normalize
                             if ',' in name or ';' in name:
-                                parts = [a.strip() for a in re.split(r'[,;]', name)]
-                                cyrillic_parts = [a for a in parts if any('\u0400' <= char <= '\u04FF' for char in a)]
-                                if cyrillic_parts:
-                                    current_normalized.append(cyrillic_parts[0])
-                                else:
-                                    current_normalized.append(parts[0])
+                                parts = _split_authors(name)
+                                current_normalized.append(_first_author_in_script(parts, True) or parts[0])
                             else:
                                 current_normalized.append(name)
                         
@@ -1359,59 +1464,524 @@ class EnrichmentCommand:
                         )
                         
                         if needs_update:
-                            logger.info(f"📝 Updating authors from {current_author_names} to [{ai_author}]")
-                            
-                            # Remove all existing author relationships
-                            delete_authors_query = """
-                            MATCH (p:Person)-[r:AUTHORED]->(b:Book {id: $book_id})
-                            DELETE r
-                            """
-                            safe_execute_kuzu_query(delete_authors_query, {"book_id": book['id']})
-                            
-                            # Add new author relationship
-                            # First, find or create the person
-                            person_query = """
-                            MATCH (p:Person {name: $author_name})
-                            RETURN p.id as id
-                            LIMIT 1
-                            """
-                            person_result = safe_execute_kuzu_query(person_query, {"author_name": ai_author})
-                            
-                            person_id = None
-                            if person_result and hasattr(person_result, 'has_next') and person_result.has_next():
-                                row = person_result.get_next()
-                                if len(row) > 0:
-                                    person_id = row[0]
-                            
-                            if not person_id:
-                                # Create new person
-                                from app.domain.models import Person
-                                from app.services.kuzu_person_service import KuzuPersonService
-                                person_service = KuzuPersonService()
-                                person = Person(name=ai_author)
-                                created_person = await person_service.create_person(person)
-                                if created_person:
-                                    person_id = created_person.id
-                            
-                            if person_id:
-                                # Create AUTHORED relationship
-                                create_author_query = """
-                                MATCH (p:Person {id: $person_id}), (b:Book {id: $book_id})
-                                MERGE (p)-[r:AUTHORED {role: 'author', order_index: 0}]->(b)
-                                RETURN r
-                                """
-                                safe_execute_kuzu_query(create_author_query, {
-                                    "person_id": person_id,
-                                    "book_id": book['id']
-                                })
-                                logger.info(f"✅ Updated author to: {ai_author}")
+                            # Relinked for all books in one batch after the loop
+                            logger.info("📝 Queueing author update from %s to [%s]", current_author_names, ai_author)
+                            author_update = {
+                                'book_id': book_id,
+                                'title': book_title,
+                                'author_name': ai_author,
+                            }
                     except Exception as e:
-                        logger.warning(f"⚠️  Failed to update author for {book['title']}: {e}")
+                        logger.warning("⚠️  Failed to update author for %s: %s", book_title, e)
                 
             except Exception as e:
-                logger.error(f"❌ Error saving {book.get('title', 'unknown')}: {e}", exc_info=True)
+                # Per-book error: full traceback only at DEBUG level
+                logger.error("❌ Error saving %s: %s", book.get('title', 'unknown'), e)
+                logger.debug("Save error traceback", exc_info=True)
+            
+            return pending_update, author_update, publisher_link
+    
+    async def _head_cover_url(self, url: str, timeout: Optional[float] = None) -> Tuple[int, str, str]:
+        """
+        HEAD a cover URL, reusing results for URLs already checked in this run
+        
+        Concurrent checks of the same URL wait for a single request. Failed
+        checks are only cached briefly; network errors are not cached and are
+        raised to the caller.
+        
+        Args:
+            url: Cover URL to check
+            timeout: Optional request timeout overriding the client default
+            
+        Returns:
+            Tuple of (status code, lowercased content-type, final URL after redirects)
+        """
+        
+        key = _normalize_cover_url(url)
+        async with self._url_validation_locks[key]:
+            cached = self._url_validation_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            
+            if timeout is None:
+                response = await self._http.head(url)
+            else:
+                response = await self._http.head(url, timeout=timeout)
+            content_type = response.headers.get('content-type', '').lower()
+            result = (response.status_code, content_type, str(response.url))
+            
+            ok = response.status_code == 200 and 'image' in content_type
+            expires_at = float('inf') if ok else time.monotonic() + _NEGATIVE_HEAD_TTL
+            self._url_validation_cache[key] = (expires_at, result)
+            return result
+    
+    def _resolve_covers_dir(self) -> Path:
+        """
+        Find (or create) the covers directory without a Flask app context
         
-        return saved_count
+        Tries the same locations as get_covers_dir: DATA_DIR, the relative and
+        Docker data paths, then the project data directory.
+        """
+        possible_dirs = [
+            Path('data/covers'),  # Relative path
+            Path('/app/data/covers'),  # Docker path
+        ]
+        
+        # Also try to get from environment or config
+        data_dir = os.getenv('DATA_DIR')
+        if data_dir:
+            possible_dirs.insert(0, Path(data_dir) / 'covers')
+        
+        # Try to get base directory
+        try:
+            base_dir = Path(__file__).parent.parent
+            possible_dirs.append(base_dir / 'data' / 'covers')
+        except:
+            pass
+        
+        # Find first existing directory or use the first one
+        for path in possible_dirs:
+            if path.exists():
+                return path
+        
+        # Use the first path and create it
+        covers_dir = possible_dirs[0]
+        covers_dir.mkdir(parents=True, exist_ok=True)
+        return covers_dir
+    
+    def _download_cover(self, book: Dict, enriched: Dict, new_cover_url: str) -> Optional[str]:
+        """
+        Download a cover for a book and cache it in the covers directory
+        
+        Tries the AI-provided URL first, then Google Books/OpenLibrary candidates
+        and, for Bulgarian books, Bulgarian bookstore fallbacks. Blocking - run
+        it in a worker thread from async code.
+        
+        Args:
+            book: Book dictionary
+            enriched: Book data merged with AI metadata
+            new_cover_url: Cover URL found by the AI provider
+            
+        Returns:
+            Local cover path (/covers/...) or None if no source worked
+        """
+        
+        # Get ISBN and author for cover search
+        isbn = enriched.get('isbn13') or enriched.get('isbn10') or book.get('isbn13') or book.get('isbn10')
+        title = book.get('title', '')
+        author = book.get('author', '') or (enriched.get('author', '') if enriched else '')
+        
+        # Clean ISBN
+        clean_isbn = ''
+        if isbn:
+            clean_isbn = ''.join(c for c in str(isbn) if c.isdigit() or c.upper() == 'X')
+        
+        # Use the same cover search system as the UI
+        cover_urls_to_try = []
+        
+        # First, try Perplexity-provided URL
+        if new_cover_url:
+            cover_urls_to_try.append(new_cover_url)
+            logger.info("🔍 Added Perplexity cover URL: %s...", new_cover_url[:80])
+        
+        # Then use get_cover_candidates (same as UI search by ISBN/title)
+        try:
+            from app.utils.book_utils import get_cover_candidates
+            
+            logger.info("🔍 Searching for cover candidates using ISBN/title search (same as UI)...")
+            candidates = get_cover_candidates(
+                isbn=clean_isbn if clean_isbn else None,
+                title=title if title else None,
+                author=author if author else None
+            )
+            
+            if candidates:
+                logger.info("✅ Found %s cover candidates from Google Books/OpenLibrary", len(candidates))
+                # Add candidates in order (Google Books first, then OpenLibrary)
+                for cand in candidates:
+                    cand_url = cand.get('url')
+                    if cand_url and cand_url not in cover_urls_to_try:
+                        cover_urls_to_try.append(cand_url)
+                        logger.info("📚 Added candidate: %s - %s...", cand.get('provider', 'unknown'), cand_url[:60])
+            else:
+                logger.info("⚠️  No cover candidates found from Google Books/OpenLibrary")
+        except Exception as e:
+            logger.warning("⚠️  Error getting cover candidates: %s", e)
+        
+        # For Bulgarian books, add Bulgarian bookstore fallbacks as last resort
+        is_bulgarian = _has_cyrillic(title)
+        if is_bulgarian and clean_isbn:
+            logger.info("🇧🇬 Bulgarian book detected, adding Bulgarian bookstore fallbacks for ISBN: %s", clean_isbn)
+            
+            bg_sources = [
+                f"https://www.ciela.com/media/catalog/product/{clean_isbn[0]}/{clean_isbn[1]}/{clean_isbn}.jpg",
+                f"https://www.ozone.bg/media/catalog/product/{clean_isbn[0]}/{clean_isbn[1]}/{clean_isbn}.jpg",
+                f"https://www.helikon.bg/uploads/thumbnail/helikon/product/{clean_isbn[-3:-1]}/{clean_isbn[-1]}/{clean_isbn}.jpg",
+                f"https://hermesbooks.bg/media/catalog/product/{clean_isbn[0]}/{clean_isbn[1]}/{clean_isbn}.jpg",
+                f"https://www.book.store.bg/prdimg/{clean_isbn[-6:]}/{clean_isbn}.jpg",
+                f"https://knigabg.com/pix/{clean_isbn}.jpg",
+                f"https://chitanka.info/thumb/book-cover/{clean_isbn}.250.jpg",
+            ]
+            
+            for bg_url in bg_sources:
+                if bg_url not in cover_urls_to_try:
+                    cover_urls_to_try.append(bg_url)
+                    logger.info("🇧🇬 Added Bulgarian fallback: %s", bg_url)
+        
+        covers_dir = self._covers_dir
+        logger.info("📁 Using covers directory: %s", covers_dir.absolute())
+        
+        local_cover_path = None
+        for try_url in cover_urls_to_try:
+            if local_cover_path:
+                break  # Already found a working cover
+                
+            logger.info("🔍 Trying cover URL: %s...", try_url[:80])
+            try:
+                # Download the image with browser headers
+                # Increased timeout to 60 seconds for slow servers and large images
+                # Use connect timeout of 10s and read timeout of 60s
+                # Shared session reuses TCP/TLS connections across covers; the
+                # context manager releases the connection even when we skip a URL
+                with self._download_session.get(try_url, timeout=(10, 60), stream=True) as response:
+                    response.raise_for_status()
+                    
+                    # Check content type
+                    content_type = response.headers.get('content-type', '').lower()
+                    if 'image' not in content_type:
+                        logger.warning("⚠️  URL returned non-image content-type: %s", content_type)
+                        continue  # Try next URL
+                    
+                    # Determine file extension from content type
+                    if 'jpeg' in content_type or 'jpg' in content_type:
+                        ext = '.jpg'
+                    elif 'png' in content_type:
+                        ext = '.png'
+                    elif 'webp' in content_type:
+                        ext = '.webp'
+                    elif 'gif' in content_type:
+                        ext = '.gif'
+                    else:
+                        ext = '.jpg'  # Default
+                    
+                    # Generate unique filename
+                    filename = f"{uuid.uuid4()}{ext}"
+                    local_path = covers_dir / filename
+                    
+                    # Download and save the image, checking actual size
+                    downloaded_size = 0
+                    with open(local_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=8192):
+                            if chunk:
+                                f.write(chunk)
+                                downloaded_size += len(chunk)
+                    
+                    # Check if image has meaningful content (at least 2KB)
+                    # Open Library and some sources return tiny placeholder images
+                    if downloaded_size < 2048:  # Less than 2KB is probably a placeholder
+                        logger.warning("⚠️  Image too small (%s bytes), likely placeholder - trying next URL", downloaded_size)
+                        try:
+                            local_path.unlink()  # Delete the placeholder
+                        except:
+                            pass
+                        continue
+                
+                local_cover_path = f"/covers/{filename}"
+                logger.info("✅ Cover downloaded and saved: %s (%s bytes from %s...)", local_cover_path, downloaded_size, try_url[:60])
+                
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response else 'unknown'
+                logger.warning("⚠️  HTTP error %s for URL: %s... - trying next", status, try_url[:60])
+                continue  # Try next URL
+            except Exception as e:
+                logger.warning("⚠️  Error downloading from %s...: %s - trying next", try_url[:60], e)
+                continue  # Try next URL
+        
+        return local_cover_path
+    
+    def _write_book_updates(self, pending_updates: List[Dict],
+                            tracking_by_id: Dict[str, str]) -> Set[str]:
+        """
+        Write queued property updates with one UNWIND query per update shape
+        
+        Books are grouped by the set of fields they update so every row in a
+        batch has the same properties (Kuzu infers the row struct type from the
+        whole list). The enrichment tracking custom_metadata is written in the
+        same statement. All batches run on one connection in one transaction;
+        if that fails they are retried one by one so a single bad batch does
+        not block the others.
+        
+        Args:
+            pending_updates: Entries with 'id' and 'updates' dictionaries
+            tracking_by_id: Book ID to custom_metadata JSON with enrichment tracking
+            
+        Returns:
+            IDs of books that were updated
+        """
+        
+        batches: Dict[tuple, List[Dict]] = {}
+        for entry in pending_updates:
+            fields = tuple(sorted(f for f in entry['updates'] if f in _UPDATABLE_BOOK_FIELDS))
+            if entry['id'] in tracking_by_id:
+                fields += ('custom_metadata',)
+            if fields:
+                batches.setdefault(fields, []).append(entry)
+        
+        updated_at = datetime.now(timezone.utc)
+        
+        statements = []
+        for fields, entries in batches.items():
+            set_clause = ', '.join(f"b.{field} = row.{field}" for field in fields)
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (b:Book {{id: row.id}})
+            SET {set_clause}, b.updated_at = $updated_at
+            RETURN b.id
+            """
+            rows = []
+            for entry in entries:
+                row = {'id': entry['id']}
+                for field in fields:
+                    row[field] = tracking_by_id[entry['id']] if field == 'custom_metadata' else entry['updates'][field]
+                rows.append(row)
+            statements.append((fields, query, rows))
+            logger.info(f"🔍 [_write_book_updates] Updating {len(rows)} books with fields: {list(fields)}")
+        
+        if not statements:
+            return set()
+        
+        saved_ids = set()
+        try:
+            with _kuzu_write_transaction("enrich_update_books") as execute:
+                for _, query, rows in statements:
+                    result = execute(query, {"rows": rows, "updated_at": updated_at})
+                    saved_ids.update(row[0] for row in _iter_rows(result))
+            return saved_ids
+        except Exception as e:
+            logger.warning(f"⚠️  Batched book update transaction failed, retrying per batch: {e}")
+        
+        saved_ids = set()
+        for fields, query, rows in statements:
+            try:
+                result = safe_execute_kuzu_query(
+                    query,
+                    {"rows": rows, "updated_at": updated_at},
+                    user_id="system",
+                    operation="enrich_update_books"
+                )
+                saved_ids.update(row[0] for row in _iter_rows(result))
+            except Exception as e:
+                logger.error(f"❌ Error updating {len(rows)} books with fields {list(fields)}: {e}", exc_info=True)
+        
+        return saved_ids
+    
+    async def _write_author_updates(self, author_updates: List[Dict]):
+        """
+        Replace book authors in bulk
+        
+        Existing persons are looked up by name in one query and only missing
+        ones are created (concurrently); then all old AUTHORED links are
+        removed and the new ones merged with one UNWIND query each.
+        
+        Args:
+            author_updates: Entries with 'book_id', 'title' and 'author_name'
+        """
+        
+        try:
+            names = list({entry['author_name'] for entry in author_updates})
+            result = safe_execute_kuzu_query(_PERSON_LOOKUP_CYPHER, {"names": names}, user_id="system", operation="enrich_find_persons")
+            person_ids = {}
+            for name, person_id in _iter_rows(result):
+                person_ids.setdefault(name, person_id)
+            
+            # Create persons that don't exist yet. Creation auto-fetches OpenLibrary
+            # metadata per person, so run the blocking repository calls concurrently
+            # in worker threads. IDs are assigned here because the repository
+            # returns the object it was given.
+            missing_persons = [Person(id=str(uuid.uuid4()), name=name) for name in names if name not in person_ids]
+            created_persons = await asyncio.gather(
+                *(asyncio.to_thread(self.person_service.person_repo.create, person) for person in missing_persons),
+                return_exceptions=True
+            )
+            for person, created_person in zip(missing_persons, created_persons):
+                if isinstance(created_person, BaseException):
+                    logger.warning("⚠️  Failed to create person %s: %s", person.name, created_person)
+                elif created_person:
+                    person_ids[person.name] = person.id
+            
+            # Only relink books whose new author could be resolved
+            rows = [
+                {'book_id': entry['book_id'], 'person_id': person_ids[entry['author_name']]}
+                for entry in author_updates
+                if entry['author_name'] in person_ids
+            ]
+            if not rows:
+                return
+            
+            # Unlink and relink in one transaction so a failed relink can't leave books without authors
+            with _kuzu_write_transaction("enrich_replace_authors") as execute:
+                execute(_DELETE_AUTHORS_CYPHER, {"rows": rows})
+                result = execute(_CREATE_AUTHORS_CYPHER, {"rows": rows})
+                linked_ids = {row[0] for row in _iter_rows(result)}
+            
+            for entry in author_updates:
+                if entry['book_id'] in linked_ids:
+                    logger.info("✅ Updated author to: %s (%s)", entry['author_name'], entry['title'])
+                else:
+                    logger.warning("⚠️  Failed to update author for %s", entry['title'])
+        except Exception as e:
+            logger.warning("⚠️  Failed to update authors for %s books: %s", len(author_updates), e)
+    
+    def _write_publisher_links(self, publisher_links: List[Dict]):
+        """
+        Link publishers to books in bulk
+        
+        Existing publishers are looked up by name in one query; missing ones
+        are created and all PUBLISHED_BY links merged with one UNWIND query
+        each, in a single transaction.
+        
+        Args:
+            publisher_links: Entries with 'book_id', 'title' and 'publisher_name'
+        """
+        
+        try:
+            names = list({entry['publisher_name'] for entry in publisher_links})
+            result = safe_execute_kuzu_query(_PUBLISHER_LOOKUP_CYPHER, {"names": names}, user_id="system", operation="enrich_find_publishers")
+            publisher_ids = {}
+            for name, publisher_id in _iter_rows(result):
+                publisher_ids.setdefault(name, publisher_id)
+            
+            # Same properties the repository sets when it creates a publisher
+            new_publishers = [
+                {'id': str(uuid.uuid4()), 'name': name}
+                for name in names if name not in publisher_ids
+            ]
+            
+            with _kuzu_write_transaction("enrich_link_publishers") as execute:
+                if new_publishers:
+                    execute(_CREATE_PUBLISHERS_CYPHER, {"rows": new_publishers, "created_at": datetime.now(timezone.utc)})
+                    publisher_ids.update((row['name'], row['id']) for row in new_publishers)
+                rows = [
+                    {'book_id': entry['book_id'], 'publisher_id': publisher_ids[entry['publisher_name']]}
+                    for entry in publisher_links
+                ]
+                result = execute(_LINK_PUBLISHERS_CYPHER, {"rows": rows})
+                linked_ids = {row[0] for row in _iter_rows(result)}
+            
+            for entry in publisher_links:
+                if entry['book_id'] in linked_ids:
+                    logger.debug("✅ Added publisher: %s for %s", entry['publisher_name'], entry['title'])
+                else:
+                    logger.warning("⚠️  Failed to add publisher for %s", entry['title'])
+        except Exception as e:
+            logger.warning("⚠️  Failed to add publishers for %s books: %s", len(publisher_links), e)
+    
+    def _fetch_current_authors(self, book_ids: List[str]) -> Optional[Dict[str, List[str]]]:
+        """
+        Fetch current author names for many books in one query
+        
+        Args:
+            book_ids: Book IDs to fetch authors for
+            
+        Returns:
+            Mapping of book ID to author names (books without authors are
+            absent), or None if the lookup failed
+        """
+        
+        if not book_ids:
+            return {}
+        query = """
+        UNWIND $ids AS id
+        MATCH (p:Person)-[:AUTHORED]->(b:Book {id: id})
+        RETURN id, COLLECT(DISTINCT p.name)
+        """
+        try:
+            result = safe_execute_kuzu_query(query, {"ids": book_ids}, user_id="system", operation="enrich_get_authors")
+            return {book_id: [name for name in names if name] for book_id, names in _iter_rows(result)}
+        except Exception as e:
+            logger.warning(f"⚠️  Could not fetch current authors: {e}")
+            return None
+    
+    def _fetch_books_with_publisher(self, book_ids: List[str]) -> Optional[Set[str]]:
+        """
+        Find which of the given books already have a publisher linked
+        
+        Args:
+            book_ids: Book IDs to check
+            
+        Returns:
+            Set of book IDs with at least one PUBLISHED_BY relationship,
+            or None if the lookup failed
+        """
+        
+        if not book_ids:
+            return set()
+        query = """
+        UNWIND $ids AS id
+        MATCH (b:Book {id: id})-[:PUBLISHED_BY]->(:Publisher)
+        RETURN DISTINCT id
+        """
+        try:
+            result = safe_execute_kuzu_query(query, {"ids": book_ids}, user_id="system", operation="enrich_check_publishers")
+            return {row[0] for row in _iter_rows(result)}
+        except Exception as e:
+            logger.warning(f"⚠️  Could not check existing publishers: {e}")
+            return None
+    
+    def _fetch_custom_metadata(self, book_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch and parse custom_metadata for many books in one query
+        
+        Args:
+            book_ids: Book IDs to fetch
+            
+        Returns:
+            Mapping of book ID to parsed custom_metadata dictionary
+        """
+        
+        custom_metadata_by_id = {}
+        query = """
+        UNWIND $ids AS id
+        MATCH (b:Book {id: id})
+        RETURN b.id, b.custom_metadata
+        """
+        result = safe_execute_kuzu_query(query, {"ids": book_ids}, user_id="system", operation="enrich_get_custom_metadata")
+        for book_id, raw in _iter_rows(result):
+            custom_metadata_by_id[book_id] = _parse_custom_metadata(raw)
+        return custom_metadata_by_id
+    
+    def _build_enrichment_tracking(self, book_ids: List[str], enriched_at: str) -> Dict[str, str]:
+        """
+        Build custom_metadata JSON with the enrichment timestamp for many books
+        
+        Tracking failures are logged but never fail the enrichment; books
+        whose metadata could not be fetched are simply left untracked.
+        
+        Args:
+            book_ids: IDs of books being enriched
+            enriched_at: ISO timestamp of the enrichment
+            
+        Returns:
+            Mapping of book ID to the new custom_metadata JSON string
+        """
+        
+        if not book_ids:
+            return {}
+        
+        try:
+            custom_metadata_by_id = self._fetch_custom_metadata(book_ids)
+        except Exception as e:
+            # If tracking fails, log but don't fail the enrichment
+            logger.debug(f"Could not track enrichment for {len(book_ids)} books: {e}")
+            return {}
+        
+        tracking_by_id = {}
+        for book_id in book_ids:
+            custom_metadata = custom_metadata_by_id.get(book_id, {})
+            custom_metadata['last_enriched_at'] = enriched_at
+            custom_metadata['enriched_by'] = 'ai_perplexity'
+            tracking_by_id[book_id] = _dumps_compact(custom_metadata)
+        return tracking_by_id
     
     async def _progress_callback(
         self, 
@@ -1425,7 +1995,7 @@ class EnrichmentCommand:
         
         Args:
             processed: Number of books processed
-            total: Total number of books
+            total: Number of candidate books (upper bound)
             current_book: Current book being processed
             metadata: Enriched metadata (or None if failed)
         """
@@ -1433,37 +2003,31 @@ class EnrichmentCommand:
         # Update stats
         self.stats['books_checked'] = processed
         
-        # Show progress
-        progress_pct = processed / total * 100
-        
+        # Messages use %-style arguments so they are only formatted when emitted
         book_title = current_book.get('title', 'Unknown')
-        logger.info(f"🔍 [_progress_callback] Book {processed}/{total}: '{book_title}', metadata={'found' if metadata else 'None'}")
+        logger.info("🔍 [_progress_callback] Book %s/%s candidates: '%s', metadata=%s", processed, total, book_title, 'found' if metadata else 'None')
         
         if metadata:
             self.stats['books_enriched'] += 1
+            # enrich_batch stored the metadata on the book; keep it for saving
+            self.books_to_save.append(current_book)
             
             quality = metadata.get('quality_score', 0)
             
-            logger.info(
-                f"[{processed}/{total}] ✅ {book_title} "
-                f"(quality: {quality:.2f})"
-            )
+            logger.info("[%s/%s] ✅ %s (quality: %.2f)", processed, total, book_title, quality)
             
             if metadata.get('cover_url'):
                 # Note: Cover URL found in metadata, but will only count as "found" after successful download
-                logger.info(f"   🖼️  Cover URL found in metadata (will attempt download)")
+                logger.info("   🖼️  Cover URL found in metadata (will attempt download)")
             
             if metadata.get('description'):
                 self.stats['descriptions_added'] += 1
-                logger.info(f"   📝 Description added")
+                logger.info("   📝 Description added")
         else:
             self.stats['books_failed'] += 1
-            logger.warning(
-                f"[{processed}/{total}] ❌ {book_title} "
-                f"- No metadata found"
-            )
+            logger.warning("[%s/%s] ❌ %s - No metadata found", processed, total, book_title)
             # Log book data to debug why enrichment failed
-            logger.info(f"🔍 [_progress_callback] Book data: title='{book_title}', author='{current_book.get('author', 'Unknown')}', cover_url='{current_book.get('cover_url', 'None')}', description={'present' if current_book.get('description') else 'missing'}")
+            logger.info("🔍 [_progress_callback] Book data: title='%s', author='%s', cover_url='%s', description=%s", book_title, current_book.get('author', 'Unknown'), current_book.get('cover_url', 'None'), 'present' if current_book.get('description') else 'missing')
     
     def _show_report(self):
         """Show final enrichment report"""
@@ -1553,6 +2117,13 @@ def main():
         help='Enrich specific book by title (partial match)'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Number of books to enrich and save concurrently (default: 8)'
+    )
+    
     parser.add_argument(
         '--no-cover-only',
         action='store_true',
@@ -1566,7 +2137,10 @@ def main():
     
     # Run command
     command = EnrichmentCommand(args)
-    exit_code = asyncio.run(command.run())
+    if UVLOOP_AVAILABLE:
+        exit_code = uvloop.run(command.run())
+    else:
+        exit_code = asyncio.run(command.run())
     
     sys.exit(exit_code)
 
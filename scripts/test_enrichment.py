@@ -5,6 +5,10 @@ Tests basic functionality with sample books
 
 Usage:
     python scripts/test_enrichment.py
+    python scripts/test_enrichment.py --no-cache           # bypass cached results
+    python scripts/test_enrichment.py --verbose            # full report per book
+    TEST_CONCURRENCY=1 python scripts/test_enrichment.py   # one book at a time
+    PERPLEXITY_RPM=20 python scripts/test_enrichment.py    # lower request rate (default: 50/min)
 
 Requirements:
     - PERPLEXITY_API_KEY in environment or .env file
@@ -13,9 +17,16 @@ Requirements:
 
 import os
 import sys
+import argparse
 import asyncio
+import hashlib
+import importlib.util
 import json
+import time
+import traceback
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -46,6 +57,56 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Optional faster JSON encoder (C extension); stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON (orjson when installed, stdlib json otherwise)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
+
+# Results are cached per (title, author, model) so repeated runs cost nothing
+CACHE_DIR = Path('.cache') / 'perplexity'
+CACHE_TTL = 30 * 86400  # seconds
+
+
+def _cache_path(title: str, author: str, model: str) -> Path:
+    key = hashlib.sha1(f"{title}|{author}|{model}".encode('utf-8')).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def load_cached_result(title: str, author: str, model: str):
+    """Return cached metadata if present and not expired, else None"""
+    path = _cache_path(title, author, model)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL:
+            return None
+        data = path.read_bytes()
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_result(title: str, author: str, model: str, metadata: dict):
+    """Store metadata in the on-disk cache"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(title, author, model).write_bytes(_dumps(metadata))
+    except (OSError, TypeError) as e:
+        print(f"⚠️  Could not cache result for {title}: {e}")
+
+
+# Full metadata for every successful test book, one JSON object per line
+RESULTS_FILE = 'test_results.jsonl'
+
+
 # Test books (mix of known and obscure)
 TEST_BOOKS = [
     {
@@ -69,8 +130,17 @@ TEST_BOOKS = [
 ]
 
 
-async def test_basic_enrichment():
-    """Test basic enrichment functionality"""
+async def test_basic_enrichment(use_cache: bool = True, verbose: bool = False):
+    """
+    Test basic enrichment functionality
+    
+    Args:
+        use_cache: Reuse cached results for books enriched recently
+        verbose: Print the full per-book report instead of one line per book
+    
+    Returns:
+        Exit status: 1 if the API requests did not reuse HTTP connections
+    """
     
     print("="*70)
     print("PERPLEXITY ENRICHMENT - QUICK TEST")
@@ -80,108 +150,197 @@ async def test_basic_enrichment():
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*70)
     
-    # Initialize enricher
-    enricher = PerplexityEnricher(api_key=API_KEY)
-    print("✅ Enricher initialized")
-    
-    results = {
-        'total': len(TEST_BOOKS),
-        'success': 0,
-        'failed': 0,
-        'quality_scores': [],
-        'covers_found': 0,
-        'descriptions_found': 0
-    }
-    
-    # Test each book
-    for i, book in enumerate(TEST_BOOKS, 1):
-        print(f"\n{'-'*70}")
-        print(f"Test {i}/{len(TEST_BOOKS)}: {book['title']}")
-        print(f"Author: {book['author']}")
-        print(f"Difficulty: {book['difficulty']}")
-        print(f"{'-'*70}")
+    # Initialize enricher; its HTTP client is closed when the block exits
+    async with PerplexityEnricher(api_key=API_KEY) as enricher:
+        print("✅ Enricher initialized")
+        
+        # Count API requests and the new connections they open through httpx's
+        # public hooks: a request event hook attaches a 'trace' extension, which
+        # reports each TCP connect. Fewer connects than requests means reuse
+        api_host = urlsplit(enricher.API_URL).hostname
+        http_stats = {'requests': 0, 'connections': 0}
+        
+        async def count_connect(event_name, info):
+            if event_name == 'connection.connect_tcp.complete':
+                http_stats['connections'] += 1
+        
+        async def trace_api_request(request):
+            if request.url.host == api_host:
+                http_stats['requests'] += 1
+                request.extensions['trace'] = count_connect
+        
+        event_hooks = enricher.client.event_hooks
+        event_hooks['request'].append(trace_api_request)
+        enricher.client.event_hooks = event_hooks
         
-        try:
-            # Enrich book
-            metadata = await enricher.enrich_book(
-                title=book['title'],
-                author=book['author']
-            )
+        results = {
+            'total': len(TEST_BOOKS),
+            'success': 0,
+            'failed': 0,
+            # Quality summary accumulated as results come in (single pass)
+            'quality_count': 0,
+            'quality_sum': 0.0,
+            'quality_min': float('inf'),
+            'quality_max': float('-inf'),
+            'covers_found': 0,
+            'descriptions_found': 0
+        }
+        
+        # Enrich all books concurrently (bounded); API calls overlap instead of
+        # running one after another
+        sem = asyncio.Semaphore(max(1, int(os.getenv('TEST_CONCURRENCY', '3'))))
+        
+        # Proactive rate limit: request starts are spaced to stay within the
+        # Perplexity requests-per-minute quota (429s are also retried by the enricher)
+        rpm = max(1, int(os.getenv('PERPLEXITY_RPM', '50')))
+        rate_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+        
+        async def wait_for_rate_limit():
+            nonlocal next_start
+            async with rate_lock:
+                delay = next_start - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_start = loop.time() + 60.0 / rpm
+        
+        cached_titles = set()
+        
+        async def run_one(book):
+            if use_cache:
+                metadata = load_cached_result(book['title'], book['author'], enricher.model)
+                if metadata is not None:
+                    cached_titles.add(book['title'])
+                    return metadata
             
-            if metadata:
-                results['success'] += 1
-                
-                # Extract info
-                quality = metadata.get('quality_score', 0)
-                results['quality_scores'].append(quality)
-                
-                print(f"\n✅ SUCCESS!")
-                print(f"   Quality Score: {quality:.2f}")
-                
-                # Check fields
-                if metadata.get('title'):
-                    print(f"   📖 Title: {metadata['title']}")
-                
-                if metadata.get('author'):
-                    print(f"   ✍️  Author: {metadata['author']}")
-                
-                if metadata.get('publisher'):
-                    print(f"   🏢 Publisher: {metadata['publisher']}")
-                    if book['expected_publisher']:
-                        match = book['expected_publisher'].lower() in metadata['publisher'].lower()
-                        print(f"      Expected match: {'✅' if match else '❌'}")
-                
-                if metadata.get('year'):
-                    print(f"   📅 Year: {metadata['year']}")
-                
-                if metadata.get('isbn'):
-                    print(f"   🔢 ISBN: {metadata['isbn']}")
-                
-                if metadata.get('pages'):
-                    print(f"   📄 Pages: {metadata['pages']}")
-                
-                if metadata.get('description'):
-                    results['descriptions_found'] += 1
-                    desc = metadata['description'][:100]
-                    print(f"   📝 Description: {desc}...")
-                
-                if metadata.get('cover_url'):
-                    results['covers_found'] += 1
-                    cover = metadata['cover_url']
-                    print(f"   🖼️  Cover: {cover[:60]}...")
-                
-                if metadata.get('genres'):
-                    genres = ', '.join(metadata['genres'][:3])
-                    print(f"   🏷️  Genres: {genres}")
-                
-                if metadata.get('sources'):
-                    print(f"   🔗 Sources: {len(metadata['sources'])} cited")
-                    for source in metadata['sources'][:2]:
-                        print(f"      - {source[:60]}...")
-                
-                # Save detailed results
-                filename = f"test_result_{i}_{book['title'].replace(' ', '_')}.json"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
-                print(f"\n   💾 Full results saved to: {filename}")
+            async with sem:
+                await wait_for_rate_limit()
+                metadata = await enricher.enrich_book(
+                    title=book['title'],
+                    author=book['author']
+                )
+            if metadata and use_cache:
+                save_cached_result(book['title'], book['author'], enricher.model, metadata)
+            return metadata
+        
+        outcomes = await asyncio.gather(
+            *(run_one(book) for book in TEST_BOOKS),
+            return_exceptions=True
+        )
+        
+        # Report each book in order; full results go to one JSONL file
+        with open(RESULTS_FILE, 'wb') as results_fp:
+            for i, (book, metadata) in enumerate(zip(TEST_BOOKS, outcomes), 1):
+                # Each book's report is written in one go instead of line by line
+                out = []
+                emit = out.append
+                position = f"{i}/{len(TEST_BOOKS)}"
+                try:
+                    if verbose:
+                        emit(f"\n{'-'*70}")
+                        emit(f"Test {position}: {book['title']}")
+                        emit(f"Author: {book['author']}")
+                        emit(f"Difficulty: {book['difficulty']}")
+                        emit(f"{'-'*70}")
+                    
+                    if isinstance(metadata, BaseException):
+                        results['failed'] += 1
+                        if not verbose:
+                            emit(f"ERR {position}  {book['title'][:40]:40s}  {metadata}")
+                            continue
+                        emit(f"\n❌ ERROR: {metadata}")
+                        emit(''.join(traceback.format_exception(type(metadata), metadata, metadata.__traceback__)).rstrip())
+                        continue
+                    
+                    if not metadata:
+                        results['failed'] += 1
+                        emit(f"\n❌ FAILED - No metadata found" if verbose
+                             else f"FAIL {position}  {book['title'][:40]:40s}")
+                        continue
+                    
+                    results['success'] += 1
+                    quality = metadata.get('quality_score', 0)
+                    results['quality_count'] += 1
+                    results['quality_sum'] += quality
+                    results['quality_min'] = min(results['quality_min'], quality)
+                    results['quality_max'] = max(results['quality_max'], quality)
+                    if metadata.get('description'):
+                        results['descriptions_found'] += 1
+                    if metadata.get('cover_url'):
+                        results['covers_found'] += 1
+                    
+                    # Save detailed results (one JSON line per book)
+                    results_fp.write(_dumps({'book': book, 'metadata': metadata}) + b'\n')
+                    
+                    cached = ' (cached)' if book['title'] in cached_titles else ''
+                    if not verbose:
+                        emit(f"OK  {position}  {book['title'][:40]:40s}  q={quality:.2f}  "
+                             f"cover={'Y' if metadata.get('cover_url') else 'N'}{cached}")
+                        continue
+                    
+                    emit(f"\n✅ SUCCESS!{cached}")
+                    emit(f"   Quality Score: {quality:.2f}")
+                    
+                    # Check fields
+                    if metadata.get('title'):
+                        emit(f"   📖 Title: {metadata['title']}")
+                    
+                    if metadata.get('author'):
+                        emit(f"   ✍️  Author: {metadata['author']}")
+                    
+                    if metadata.get('publisher'):
+                        emit(f"   🏢 Publisher: {metadata['publisher']}")
+                        if book['expected_publisher']:
+                            match = book['expected_publisher'].lower() in metadata['publisher'].lower()
+                            emit(f"      Expected match: {'✅' if match else '❌'}")
+                    
+                    if metadata.get('year'):
+                        emit(f"   📅 Year: {metadata['year']}")
+                    
+                    if metadata.get('isbn'):
+                        emit(f"   🔢 ISBN: {metadata['isbn']}")
+                    
+                    if metadata.get('pages'):
+                        emit(f"   📄 Pages: {metadata['pages']}")
+                    
+                    if metadata.get('description'):
+                        desc = metadata['description'][:100]
+                        emit(f"   📝 Description: {desc}...")
+                    
+                    if metadata.get('cover_url'):
+                        cover = metadata['cover_url']
+                        emit(f"   🖼️  Cover: {cover[:60]}...")
+                    
+                    if metadata.get('genres'):
+                        genres = ', '.join(metadata['genres'][:3])
+                        emit(f"   🏷️  Genres: {genres}")
+                    
+                    if metadata.get('sources'):
+                        emit(f"   🔗 Sources: {len(metadata['sources'])} cited")
+                        for source in metadata['sources'][:2]:
+                            emit(f"      - {source[:60]}...")
+                    
+                    emit(f"\n   💾 Full results saved to: {RESULTS_FILE}")
+                except Exception as e:
+                    # A bad field in one result must not abort the whole report
+                    results['failed'] += 1
+                    emit(f"\n❌ ERROR: {e}")
+                    emit(traceback.format_exc().rstrip())
+                finally:
+                    sys.stdout.write('\n'.join(out) + '\n')
+            if not verbose and results['success']:
+                print(f"\n💾 Full results saved to: {RESULTS_FILE}")
                 
-            else:
-                results['failed'] += 1
-                print(f"\n❌ FAILED - No metadata found")
-            
-            # Rate limiting
-            if i < len(TEST_BOOKS):
-                print(f"\n⏳ Waiting 2 seconds...")
-                await asyncio.sleep(2)
-            
-        except Exception as e:
-            results['failed'] += 1
-            print(f"\n❌ ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # Close enricher
-    await enricher.close()
+    # Connection reuse: the enricher's shared client should keep its
+    # connection(s) alive across the requests instead of opening one per call
+    connections_reused = True
+    if http_stats['requests']:
+        print(f"\n🔌 New HTTP connections for {http_stats['requests']} API request(s): {http_stats['connections']}")
+        if http_stats['requests'] > 1:
+            connections_reused = http_stats['connections'] < http_stats['requests']
+            if not connections_reused:
+                print("❌ Every API request opened a new connection - keep-alive is not working")
     
     # Show summary
     print(f"\n{'='*70}")
@@ -194,20 +353,21 @@ async def test_basic_enrichment():
     print(f"   Failed: {results['failed']}")
     print(f"   Success rate: {results['success']/results['total']*100:.1f}%")
     
-    if results['quality_scores']:
-        avg_quality = sum(results['quality_scores']) / len(results['quality_scores'])
+    if results['quality_count']:
+        avg_quality = results['quality_sum'] / results['quality_count']
         print(f"\n⭐ Quality:")
         print(f"   Average: {avg_quality:.2f}")
-        print(f"   Min: {min(results['quality_scores']):.2f}")
-        print(f"   Max: {max(results['quality_scores']):.2f}")
+        print(f"   Min: {results['quality_min']:.2f}")
+        print(f"   Max: {results['quality_max']:.2f}")
     
     print(f"\n📝 Content:")
     print(f"   Covers found: {results['covers_found']}/{results['success']}")
     print(f"   Descriptions: {results['descriptions_found']}/{results['success']}")
     
-    # Cost estimate
-    cost = results['total'] * 0.0008
-    print(f"\n💰 Estimated cost: ${cost:.4f}")
+    # Cost estimate (cached results are free)
+    api_calls = results['total'] - len(cached_titles)
+    cost = api_calls * 0.0008
+    print(f"\n💰 Estimated cost: ${cost:.4f} ({len(cached_titles)} cached)")
     
     # Verdict
     print(f"\n{'='*70}")
@@ -226,26 +386,33 @@ async def test_basic_enrichment():
         print("  2. Internet connection working")
         print("  3. Perplexity API is accessible")
     print(f"{'='*70}\n")
+    
+    return 0 if connections_reused else 1
 
 
 if __name__ == "__main__":
-    # Check dependencies
-    try:
-        import httpx
-    except ImportError:
+    parser = argparse.ArgumentParser(description='Quick test of Perplexity enrichment')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass cached results and call the API for every book')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print the full report for each book (default: one line per book)')
+    args = parser.parse_args()
+    
+    # Check dependencies (without importing them)
+    if importlib.util.find_spec('httpx') is None:
         print("❌ Error: httpx not installed")
         print("   Install: pip install httpx")
         sys.exit(1)
     
     # Run tests
     try:
-        asyncio.run(test_basic_enrichment())
+        exit_code = asyncio.run(test_basic_enrichment(use_cache=not args.no_cache, verbose=args.verbose))
     except KeyboardInterrupt:
         print("\n\n⚠️  Tests interrupted by user")
         sys.exit(1)
     except Exception as e:
         print(f"\n\n❌ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
+    sys.exit(exit_code)
 
@@ -0,0 +1,289 @@
+import asyncio
+import importlib.util
+import json
+import sys
+import types
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+
+class FakeResult:
+    """Minimal Kuzu query result: has_next()/get_next() over a list of rows"""
+
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def has_next(self):
+        return bool(self._rows)
+
+    def get_next(self):
+        return self._rows.pop(0)
+
+
+def _unexpected_query(query, params=None, **_kwargs):
+    raise AssertionError(f"Unexpected query: {query}")
+
+
+def load_text_utils_module(monkeypatch):
+    module_path = Path(__file__).resolve().parent.parent / "app" / "utils" / "text_utils.py"
+    spec = importlib.util.spec_from_file_location("app.utils.text_utils", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setitem(sys.modules, "app.utils.text_utils", module)
+    return module
+
+
+def load_enrich_books_module(monkeypatch, tmp_path):
+    module_path = Path(__file__).resolve().parent.parent / "scripts" / "enrich_books.py"
+
+    # Stub the app modules the script imports to avoid the Flask/Kuzu-heavy app package
+    stubs = {
+        "app": {},
+        "app.services": {"book_service": None},
+        "app.services.enrichment_service": {"EnrichmentService": object},
+        "app.services.kuzu_person_service": {"KuzuPersonService": object},
+        "app.infrastructure": {},
+        "app.infrastructure.kuzu_repositories": {"KuzuBookRepository": object},
+        "app.infrastructure.kuzu_graph": {"safe_execute_kuzu_query": _unexpected_query},
+        "app.utils": {},
+        "app.utils.kuzu_migration_helper": {"safe_kuzu_transaction": None},
+        "app.domain": {},
+        "app.domain.models": {"Person": object},
+    }
+    for name, attrs in stubs.items():
+        module = types.ModuleType(name)
+        for attr, value in attrs.items():
+            setattr(module, attr, value)
+        monkeypatch.setitem(sys.modules, name, module)
+    # text_utils has no app dependencies, so the real module is loaded
+    load_text_utils_module(monkeypatch)
+
+    # The script logs to enrichment.log in the working directory
+    monkeypatch.chdir(tmp_path)
+
+    spec = importlib.util.spec_from_file_location("enrich_books", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def enrich_books(monkeypatch, tmp_path):
+    return load_enrich_books_module(monkeypatch, tmp_path)
+
+
+@pytest.fixture
+def command(enrich_books):
+    # The write helpers don't need the repositories set up by __init__
+    return object.__new__(enrich_books.EnrichmentCommand)
+
+
+def fake_transaction(calls, fail=lambda query: False):
+    """safe_kuzu_transaction replacement that records statements and echoes row IDs"""
+
+    @contextmanager
+    def transaction(user_id=None, operation=None):
+        def execute(query, params=None):
+            calls.append((query, params))
+            if fail(query):
+                raise RuntimeError("write failed")
+            return FakeResult([[row["id"]] for row in (params or {}).get("rows", [])])
+
+        yield execute
+
+    return transaction
+
+
+def unwind_calls(calls):
+    return [(query, params) for query, params in calls if "UNWIND" in query]
+
+
+def test_write_book_updates_groups_books_by_field_set(enrich_books, command, monkeypatch):
+    calls = []
+    monkeypatch.setattr(enrich_books, "safe_kuzu_transaction", fake_transaction(calls))
+
+    pending = [
+        {"id": "a", "title": "A", "updates": {"description": "d-a", "cover_url": "c-a"}},
+        {"id": "b", "title": "B", "updates": {"description": "d-b"}},
+        # Same fields as "a" in a different order; 'publisher' is not a Book property update
+        {"id": "c", "title": "C", "updates": {"cover_url": "c-c", "description": "d-c", "publisher": "P"}},
+    ]
+
+    saved_ids = command._write_book_updates(pending, {})
+
+    assert saved_ids == {"a", "b", "c"}
+    statements = [query for query, _ in calls]
+    assert statements[0] == "BEGIN TRANSACTION"
+    assert statements[-1] == "COMMIT"
+
+    batches = unwind_calls(calls)
+    assert len(batches) == 2
+    rows_by_ids = {tuple(row["id"] for row in params["rows"]): (query, params["rows"]) for query, params in batches}
+
+    query, rows = rows_by_ids[("a", "c")]
+    assert "b.cover_url = row.cover_url, b.description = row.description" in query
+    assert "publisher" not in query
+    assert rows == [
+        {"id": "a", "cover_url": "c-a", "description": "d-a"},
+        {"id": "c", "cover_url": "c-c", "description": "d-c"},
+    ]
+
+    query, rows = rows_by_ids[("b",)]
+    assert "b.description = row.description" in query
+    assert "cover_url" not in query
+    assert rows == [{"id": "b", "description": "d-b"}]
+
+
+def test_write_book_updates_writes_enrichment_tracking(enrich_books, command, monkeypatch):
+    calls = []
+    monkeypatch.setattr(enrich_books, "safe_kuzu_transaction", fake_transaction(calls))
+    monkeypatch.setattr(command, "_fetch_custom_metadata", lambda book_ids: {"a": {"source": "import"}})
+
+    enriched_at = "2025-12-30T10:00:00"
+    tracking_by_id = command._build_enrichment_tracking(["a", "b"], enriched_at)
+    pending = [
+        {"id": "a", "title": "A", "updates": {"description": "d-a"}},
+        {"id": "b", "title": "B", "updates": {"description": "d-b"}},
+    ]
+
+    saved_ids = command._write_book_updates(pending, tracking_by_id)
+
+    assert saved_ids == {"a", "b"}
+    (query, params), = unwind_calls(calls)
+    assert "b.custom_metadata = row.custom_metadata" in query
+    custom_metadata = {row["id"]: json.loads(row["custom_metadata"]) for row in params["rows"]}
+    assert custom_metadata["a"] == {
+        "source": "import",
+        "last_enriched_at": enriched_at,
+        "enriched_by": "ai_perplexity",
+    }
+    assert custom_metadata["b"]["last_enriched_at"] == enriched_at
+
+
+def test_write_book_updates_falls_back_per_batch(enrich_books, command, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        enrich_books,
+        "safe_kuzu_transaction",
+        fake_transaction(calls, fail=lambda query: "b.cover_url" in query),
+    )
+
+    fallback_calls = []
+
+    def fake_execute(query, params=None, **_kwargs):
+        fallback_calls.append(query)
+        if "b.cover_url" in query:
+            raise RuntimeError("bad batch")
+        return FakeResult([[row["id"]] for row in params["rows"]])
+
+    monkeypatch.setattr(enrich_books, "safe_execute_kuzu_query", fake_execute)
+
+    pending = [
+        {"id": "a", "title": "A", "updates": {"cover_url": "c-a"}},
+        {"id": "b", "title": "B", "updates": {"description": "d-b"}},
+    ]
+
+    saved_ids = command._write_book_updates(pending, {})
+
+    # The failed transaction is rolled back and every batch is retried on its own
+    assert "ROLLBACK" in [query for query, _ in calls]
+    assert len(fallback_calls) == 2
+    assert saved_ids == {"b"}
+
+
+def make_save_command(enrich_books, enriched_fields, force=False):
+    """EnrichmentCommand whose merge returns the book overlaid with enriched_fields"""
+    command = object.__new__(enrich_books.EnrichmentCommand)
+    command.args = types.SimpleNamespace(force=force)
+    command.service = types.SimpleNamespace(
+        merge_metadata_into_book=lambda book_data, ai_metadata: {**book_data, **enriched_fields}
+    )
+    command.stats = {"covers_found": 0}
+    return command
+
+
+ENGLISH_BOOK = {
+    "id": "book-1",
+    "title": "The Secret History",
+    "author": "Donna Tartt",
+    "description": "A group of classics students.",
+    "isbn13": None,
+    "isbn10": None,
+    "page_count": None,
+    "published_date": None,
+    "language": "en",
+}
+
+BULGARIAN_BOOK = {
+    **ENGLISH_BOOK,
+    "title": "Под игото",
+    "author": "Иван Вазов",
+    "description": "Роман за Априлското въстание.",
+}
+
+# (case, book, AI/merged fields, force, expected property updates, expected new author, expects publisher link)
+SAVE_CASES = [
+    ("nothing new", ENGLISH_BOOK, {"description": ENGLISH_BOOK["description"]}, False, {}, None, False),
+    ("nothing new, forced", ENGLISH_BOOK, {"description": ENGLISH_BOOK["description"], "author": "Donna Tartt"},
+     True, {"description": ENGLISH_BOOK["description"]}, "Donna Tartt", False),
+    ("description for book without one", {**ENGLISH_BOOK, "description": None}, {"description": "New text [3]"},
+     False, {"description": "New text"}, None, False),
+    ("description in the wrong language", ENGLISH_BOOK, {"description": "Описание на български."},
+     False, {}, None, False),
+    ("missing isbn13", ENGLISH_BOOK, {"isbn13": "9780140167771"}, False, {"isbn13": "9780140167771"}, None, False),
+    ("missing isbn10", ENGLISH_BOOK, {"isbn10": "0140167773"}, False, {"isbn10": "0140167773"}, None, False),
+    ("missing page_count", ENGLISH_BOOK, {"page_count": 559}, False, {"page_count": 559}, None, False),
+    ("missing published_date", ENGLISH_BOOK, {"published_date": "1992"}, False, {"published_date": "1992"}, None, False),
+    ("existing isbn13 kept", {**ENGLISH_BOOK, "isbn13": "9780000000002"}, {"isbn13": "9780140167771"},
+     False, {}, None, False),
+    ("missing publisher", ENGLISH_BOOK, {"publisher": "Penguin"}, False, {}, None, True),
+    ("existing publisher kept", {**ENGLISH_BOOK, "publisher": "Knopf"}, {"publisher": "Penguin"},
+     False, {}, None, False),
+    ("same sole author", ENGLISH_BOOK, {"author": "Donna Tartt"}, False, {}, None, False),
+    ("different author", ENGLISH_BOOK, {"author": "D. Tartt"}, False, {}, "D. Tartt", False),
+    ("Cyrillic author for English title", ENGLISH_BOOK, {"author": "Дона Тарт"}, False, {}, None, False),
+    ("Bulgarian author picked from a list", BULGARIAN_BOOK, {"author": "Ivan Vazov, Иван Вазов"},
+     False, {"language": "bg"}, None, False),
+]
+
+
+@pytest.mark.parametrize(
+    "book, fields, force, expected_updates, expected_author, expects_publisher",
+    [case[1:] for case in SAVE_CASES],
+    ids=[case[0] for case in SAVE_CASES],
+)
+def test_save_one_field_rules(enrich_books, book, fields, force, expected_updates,
+                              expected_author, expects_publisher):
+    command = make_save_command(enrich_books, fields, force=force)
+    book = {**book, "ai_metadata": dict(fields)}
+    authors_by_id = {book["id"]: [book["author"]]}
+
+    pending, author_update, publisher_link = asyncio.run(
+        command._save_one(book, asyncio.Semaphore(1), set(), authors_by_id)
+    )
+
+    assert (pending["updates"] if pending else {}) == expected_updates
+    assert (author_update["author_name"] if author_update else None) == expected_author
+    assert (publisher_link is not None) == expects_publisher
+
+
+def test_save_one_downloads_new_cover(enrich_books, monkeypatch):
+    cover_url = "https://x.bg/image.php?src=cover.jpg&w=300"
+    command = make_save_command(enrich_books, {"cover_url": cover_url})
+
+    async def fake_head(url, timeout=None):
+        return 200, "image/jpeg", url
+
+    monkeypatch.setattr(command, "_head_cover_url", fake_head)
+    monkeypatch.setattr(command, "_download_cover", lambda book, enriched, url: "/covers/book-1.jpg")
+
+    book = {**ENGLISH_BOOK, "ai_metadata": {"cover_url": cover_url}}
+    pending, _, _ = asyncio.run(
+        command._save_one(book, asyncio.Semaphore(1), set(), {book["id"]: [book["author"]]})
+    )
+
+    assert pending["updates"] == {"cover_url": "/covers/book-1.jpg"}
+    assert pending["cover_found_in_metadata"] is True
+    assert command.stats["covers_found"] == 1
@@ -0,0 +1,142 @@
+import asyncio
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+def load_text_utils_module(monkeypatch):
+    module_path = Path(__file__).resolve().parent.parent / "app" / "utils" / "text_utils.py"
+    spec = importlib.util.spec_from_file_location("app.utils.text_utils", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setitem(sys.modules, "app.utils.text_utils", module)
+    return module
+
+
+def load_enrichment_service_module(monkeypatch):
+    module_path = Path(__file__).resolve().parent.parent / "app" / "services" / "enrichment_service.py"
+
+    # Stub the packages and the Perplexity provider so the real app package
+    # (Flask, Kuzu) is not imported; the optional OpenAI enricher is left out
+    stubs = {
+        "app": {},
+        "app.services": {},
+        "app.utils": {},
+        "app.services.metadata_providers": {},
+        "app.services.metadata_providers.perplexity": {"PerplexityEnricher": object},
+    }
+    for name, attrs in stubs.items():
+        module = types.ModuleType(name)
+        for attr, value in attrs.items():
+            setattr(module, attr, value)
+        monkeypatch.setitem(sys.modules, name, module)
+    # text_utils has no app dependencies, so the real module is loaded
+    load_text_utils_module(monkeypatch)
+
+    spec = importlib.util.spec_from_file_location("app.services.enrichment_service", module_path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "app.services.enrichment_service", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeEnricher:
+    """Stands in for enrich_single_book, recording how calls overlap"""
+
+    def __init__(self, duration=0.05, fail_titles=()):
+        self.duration = duration
+        self.fail_titles = set(fail_titles)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.start_times = []
+
+    async def __call__(self, book, force=False, require_cover=False):
+        loop = asyncio.get_running_loop()
+        self.start_times.append(loop.time())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.duration)
+            if book["title"] in self.fail_titles:
+                raise RuntimeError("provider error")
+            return {"title": book["title"], "description": "text"}
+        finally:
+            self.in_flight -= 1
+
+
+def make_service(module, enricher, rate_limit_delay=0.0, concurrency=1):
+    # enrich_batch only needs the settings below, not the providers set up by __init__
+    service = object.__new__(module.EnrichmentService)
+    service.rate_limit_delay = rate_limit_delay
+    service.concurrency = concurrency
+    service.enrich_single_book = enricher
+    return service
+
+
+def make_books(count):
+    return [{"id": str(i), "title": f"Book {i}"} for i in range(count)]
+
+
+@pytest.fixture
+def enrichment_service(monkeypatch):
+    return load_enrichment_service_module(monkeypatch)
+
+
+def test_enrich_batch_limits_books_in_flight(enrichment_service):
+    enricher = FakeEnricher()
+    service = make_service(enrichment_service, enricher)
+
+    stats = asyncio.run(service.enrich_batch(make_books(10), concurrency=3))
+
+    assert enricher.max_in_flight == 3
+    assert stats["processed"] == 10
+    assert stats["enriched"] == 10
+
+
+def test_enrich_batch_spaces_request_starts(enrichment_service):
+    delay = 0.05
+    enricher = FakeEnricher(duration=0.01)
+    service = make_service(enrichment_service, enricher, rate_limit_delay=delay)
+
+    asyncio.run(service.enrich_batch(make_books(4), concurrency=4))
+
+    gaps = [later - earlier for earlier, later in zip(enricher.start_times, enricher.start_times[1:])]
+    assert len(gaps) == 3
+    # Small tolerance for timer granularity
+    assert all(gap >= delay * 0.9 for gap in gaps)
+
+
+def test_enrich_batch_accepts_async_iterable_without_total(enrichment_service):
+    enricher = FakeEnricher(duration=0)
+    service = make_service(enrichment_service, enricher)
+    progress = []
+
+    async def books():
+        for book in make_books(3):
+            yield book
+
+    async def on_progress(processed, total, current_book, metadata):
+        progress.append((processed, total))
+
+    stats = asyncio.run(service.enrich_batch(books(), total=None, progress_callback=on_progress))
+
+    assert stats["total"] == 3
+    assert stats["enriched"] == 3
+    # The count is unknown while streaming
+    assert progress == [(1, 0), (2, 0), (3, 0)]
+
+
+def test_enrich_batch_failure_does_not_cancel_other_books(enrichment_service):
+    enricher = FakeEnricher(fail_titles={"Book 1"})
+    service = make_service(enrichment_service, enricher)
+    books = make_books(4)
+
+    stats = asyncio.run(service.enrich_batch(books, concurrency=4))
+
+    assert stats["enriched"] == 3
+    assert stats["failed"] == 1
+    assert "ai_metadata" not in books[1]
+    assert all("ai_metadata" in book for i, book in enumerate(books) if i != 1)
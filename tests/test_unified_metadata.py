@@ -33,10 +33,18 @@ def load_unified_metadata_module():
     book_utils.select_highest_google_image = lambda *_args, **_kwargs: None
     book_utils.upgrade_google_cover_url = lambda url: url
 
+    # text_utils has no app dependencies, so the real module is loaded
+    text_utils_spec = importlib.util.spec_from_file_location(
+        "app.utils.text_utils", module_path.parent / "text_utils.py"
+    )
+    text_utils = importlib.util.module_from_spec(text_utils_spec)
+    text_utils_spec.loader.exec_module(text_utils)
+
     sys.modules["app"] = app_mod
     sys.modules["app.utils"] = utils_mod
     sys.modules["app.utils.metadata_settings"] = metadata_settings
     sys.modules["app.utils.book_utils"] = book_utils
+    sys.modules["app.utils.text_utils"] = text_utils
 
     spec = importlib.util.spec_from_file_location(module_name, module_path)
     module = importlib.util.module_from_spec(spec)